@@ -0,0 +1,173 @@
+"""
+This module contains an index of the routes grouped by airline, and functions that
+summarize the network, the countries and the fleet of a single airline from its
+routes, so that a query about one airline never filters the whole route table.
+"""
+
+# Import the necessary libraries
+import numpy as np
+import pandas as pd
+
+from Functions.route_table import RouteTable
+
+
+class AirlineIndex:
+    """
+    The positions of the routes in routes_df grouped by Airline ID, built with one
+    sort. The routes of the airline at position i of airline_ids are at the positions
+    order[indptr[i]:indptr[i + 1]] of routes_df, in their order in routes_df.
+
+    Attributes
+    ------------
+    airline_ids: numpy.ndarray
+        The Airline IDs that have routes, sorted.
+    indptr: numpy.ndarray
+        The start of the routes of each airline in order.
+    order: numpy.ndarray
+        The positions of the routes in routes_df, grouped by airline.
+    """
+
+    def __init__(self, routes_df: pd.DataFrame):
+        """
+        Groups the routes by airline. Routes without an Airline ID ("\\N") are left out.
+
+        Parameters
+        ------------
+        routes_df: pandas.DataFrame
+            The routes, with the Airline ID column.
+        """
+        airline_ids = pd.to_numeric(routes_df["Airline ID"], errors="coerce").to_numpy()
+        known = np.flatnonzero(~np.isnan(airline_ids))
+        self.order = known[np.argsort(airline_ids[known], kind="stable")]
+        self.airline_ids, starts = np.unique(
+            airline_ids[self.order].astype(np.int64), return_index=True
+        )
+        self.indptr = np.append(starts, len(self.order))
+
+    def __len__(self) -> int:
+        return len(self.airline_ids)
+
+    def __contains__(self, airline_id) -> bool:
+        position = np.searchsorted(self.airline_ids, airline_id)
+        return position < len(self.airline_ids) and self.airline_ids[position] == airline_id
+
+    def positions(self, airline_id: int) -> np.ndarray:
+        """
+        Returns the positions of the routes of an airline in routes_df.
+
+        Parameters
+        ------------
+        airline_id: int
+            The Airline ID.
+
+        Returns
+        ---------
+        numpy.ndarray
+            The positions, in ascending order.
+
+        Raises
+        ------------
+        ValueError
+            If the airline has no routes.
+        """
+        if airline_id not in self:
+            raise ValueError(f"Airline with ID {airline_id} has no routes in the data.")
+        position = np.searchsorted(self.airline_ids, airline_id)
+        return self.order[self.indptr[position] : self.indptr[position + 1]]
+
+    def route_counts(self) -> pd.Series:
+        """
+        Returns the number of routes of every airline, indexed by Airline ID.
+        """
+        return pd.Series(
+            np.diff(self.indptr),
+            index=pd.Index(self.airline_ids, name="Airline ID"),
+            name="Routes",
+        )
+
+
+def served_countries(routes: pd.DataFrame, airport_index: pd.DataFrame) -> pd.Series:
+    """
+    Counts the routes of an airline from or to each country. A route within a
+    country counts once for it.
+
+    Parameters
+    ------------
+    routes: pandas.DataFrame
+        The routes of the airline, with the Source airport and Destination airport columns.
+    airport_index: pandas.DataFrame
+        The airports indexed by airport code, with a Country column.
+
+    Returns
+    ---------
+    pandas.Series
+        The number of routes per country, most routes first.
+    """
+    countries = airport_index["Country"].astype(object)
+    sources = countries.reindex(routes["Source airport"].astype(object)).to_numpy()
+    destinations = countries.reindex(routes["Destination airport"].astype(object)).to_numpy()
+    ends = pd.Series(
+        np.concatenate([sources, destinations[destinations != sources]]), dtype=object
+    )
+    counts = ends.dropna().value_counts()
+    counts.index.name = "Country"
+    return counts.rename("Routes")
+
+
+def fleet_mix(table: RouteTable, routes: np.ndarray, airplanes_df: pd.DataFrame) -> pd.Series:
+    """
+    Counts the routes of an airline flown by each airplane model, from the airplane
+    IDs of the route table.
+
+    Parameters
+    ------------
+    table: RouteTable
+        The route table of routes_df.
+    routes: numpy.ndarray
+        The positions of the routes of the airline in routes_df, in ascending order.
+    airplanes_df: pandas.DataFrame
+        The airplanes, with the Name and IATA code columns.
+
+    Returns
+    ---------
+    pandas.Series
+        The number of routes per airplane model, most routes first.
+        Codes that are not in airplanes_df are left out.
+    """
+    # An airplane code can belong to several models, as in the equipment cube
+    counts = table.equipment_models(airplanes_df, routes)["Name"].value_counts()
+    counts.index.name = "Model"
+    return counts.rename("Routes")
+
+
+def network_summary(routes: pd.DataFrame, countries: pd.Series) -> dict:
+    """
+    Summarizes the network of an airline.
+
+    Parameters
+    ------------
+    routes: pandas.DataFrame
+        The routes of the airline, with the airport ID and distance_km columns.
+    countries: pandas.Series
+        The routes per country served, as returned by served_countries.
+
+    Returns
+    ---------
+    dict
+        The number of Routes, of Airports and of Countries served, and the
+        Total distance_km and Median distance_km of the routes.
+    """
+    airports = pd.concat(
+        [
+            pd.to_numeric(routes["Source airport ID"], errors="coerce"),
+            pd.to_numeric(routes["Destination airport ID"], errors="coerce"),
+        ]
+    )
+    distances = routes["distance_km"]
+    return {
+        "Routes": len(routes),
+        "Airports": airports.dropna().nunique(),
+        "Countries": len(countries),
+        "Total distance_km": float(distances.sum()),
+        "Median distance_km": float(distances.median()) if distances.notna().any() else np.nan,
+    }
@@ -0,0 +1,114 @@
+"""
+This module contains functions that compute the data of the FlightData charts and
+draw them, either on the interactive pyplot figure or on a standalone figure that is
+rendered to PNG or SVG bytes in memory, without a display.
+"""
+
+# Import the necessary libraries
+import io
+from collections import namedtuple
+
+import numpy as np
+import pandas as pd
+from matplotlib.figure import Figure
+
+# The image formats charts can be rendered to
+CHART_FORMATS = ["png", "svg"]
+# The size of the charts in inches
+FIGURE_SIZE = (10, 6)
+
+ChartResult = namedtuple("ChartResult", ["data", "image"])
+ChartResult.__doc__ = """
+The data of a chart and the chart rendered as PNG or SVG bytes (None if not rendered).
+"""
+
+
+def distance_histogram(distances, bins: int = 100) -> pd.DataFrame:
+    """
+    Counts the flights per distance bin. Flights without a distance are left out.
+
+    Parameters
+    ------------
+    distances: array-like
+        The flight distances in km.
+    bins: int, optional
+        The number of equally wide bins.
+
+    Returns
+    ---------
+    pandas.DataFrame
+        One row per bin with the bin edges in the Bin start and Bin end columns
+        and the number of flights in the Flights column.
+    """
+    distances = np.asarray(distances, dtype=np.float64)
+    counts, edges = np.histogram(distances[~np.isnan(distances)], bins=bins)
+    return pd.DataFrame({"Bin start": edges[:-1], "Bin end": edges[1:], "Flights": counts})
+
+
+def draw_distance_histogram(axes, histogram: pd.DataFrame) -> None:
+    """
+    Draws the distribution of flight distances from distance_histogram on axes.
+    """
+    edges = np.append(histogram["Bin start"].to_numpy(), histogram["Bin end"].iloc[-1])
+    axes.hist(
+        histogram["Bin start"],
+        bins=edges,
+        weights=histogram["Flights"],
+        color="blue",
+        edgecolor="black",
+    )
+    axes.set_title("Distribution of Flight Distances")
+    axes.set_xlabel("Distance (km)")
+    axes.set_ylabel("Number of Flights")
+    axes.grid(True)
+
+
+def draw_top_models(axes, model_counts: pd.DataFrame, title: str) -> None:
+    """
+    Draws the number of routes of the top airplane models as bars on axes.
+    """
+    axes.bar(model_counts.index, model_counts["Counts"])
+    axes.set_xlabel("Airplane Model")
+    axes.set_ylabel("Number of Routes")
+    axes.set_title(title)
+    axes.tick_params(axis="x", labelrotation=45)
+    for label in axes.get_xticklabels():
+        label.set_horizontalalignment("right")
+
+
+def render_chart(draw, *args, image_format: str = "png", dpi: int = 100) -> bytes:
+    """
+    Draws a chart on a standalone figure and renders it to bytes. The figure is not
+    registered with pyplot, so no display or interactive backend is needed and
+    nothing is left open after rendering.
+
+    Parameters
+    ------------
+    draw: callable
+        A function that draws the chart on the axes it gets as first argument,
+        such as draw_distance_histogram.
+    args:
+        The further arguments of draw.
+    image_format: str, optional
+        'png' or 'svg'.
+    dpi: int, optional
+        The resolution of PNG images in dots per inch.
+
+    Returns
+    ---------
+    bytes
+        The rendered image.
+
+    Raises
+    ------------
+    ValueError
+        If image_format is not one of CHART_FORMATS.
+    """
+    if image_format not in CHART_FORMATS:
+        raise ValueError(f"image_format must be one of {CHART_FORMATS}, not '{image_format}'.")
+    figure = Figure(figsize=FIGURE_SIZE)
+    draw(figure.subplots(), *args)
+    figure.tight_layout()
+    buffer = io.BytesIO()
+    figure.savefig(buffer, format=image_format, dpi=dpi)
+    return buffer.getvalue()
@@ -0,0 +1,161 @@
+"""
+This module contains functions that compare two snapshots of a table row by row,
+so that only the rows that were added, removed or changed need to be processed.
+"""
+
+# Import the necessary libraries
+from collections import namedtuple
+
+import numpy as np
+import pandas as pd
+
+DeltaInfo = namedtuple(
+    "DeltaInfo",
+    [
+        "airports_added",
+        "airports_removed",
+        "airports_changed",
+        "routes_added",
+        "routes_removed",
+        "routes_changed",
+        "routes_enriched",
+    ],
+)
+DeltaInfo.__doc__ = """
+The number of airports and routes that were added, removed or changed by a new
+snapshot, and the number of routes whose coordinates and distances were calculated.
+"""
+
+
+def row_keys(table: pd.DataFrame, columns: list) -> np.ndarray:
+    """
+    Hashes the values of the columns of each row, so that rows can be compared with
+    a single number. Categorical columns are hashed by their values, not their codes.
+
+    Parameters
+    ------------
+    table: pandas.DataFrame
+        The table.
+    columns: list
+        The columns that make up the key.
+
+    Returns
+    ---------
+    numpy.ndarray
+        One 64-bit hash per row of the table.
+    """
+    return pd.util.hash_pandas_object(table[columns], index=False).to_numpy()
+
+
+def _same_values(old: pd.Series, new: pd.Series) -> np.ndarray:
+    """
+    Compares two columns of equal length element by element, missing values included.
+    """
+    old = old.astype(object).to_numpy()
+    new = new.astype(object).to_numpy()
+    same = old == new
+    # Only the differing values can be missing values on both sides
+    differing = np.flatnonzero(~same)
+    same[differing] = pd.isna(old[differing]) & pd.isna(new[differing])
+    return same
+
+
+def match_rows(  # pylint: disable=too-many-locals
+    old: pd.DataFrame, new: pd.DataFrame, columns: list
+) -> np.ndarray:
+    """
+    Finds for each row of new an identical row of old. Rows that occur several times
+    are matched in order, so that each row of old is matched at most once. Rows are
+    matched by their hashes, and the matches are checked value by value.
+
+    Parameters
+    ------------
+    old: pandas.DataFrame
+        The previous snapshot of the table.
+    new: pandas.DataFrame
+        The new snapshot of the table.
+    columns: list
+        The columns that are compared.
+
+    Returns
+    ---------
+    numpy.ndarray
+        For each row of new, the position of the identical row of old,
+        or -1 if the row was added or changed.
+    """
+    old_keys = row_keys(old, columns)
+    new_keys = row_keys(new, columns)
+    # The n-th occurrence of a row in new is matched with its n-th occurrence in old,
+    # which is the n-th of its equal keys in the stably sorted keys of old
+    old_order = np.argsort(old_keys, kind="stable")
+    old_sorted = old_keys[old_order]
+    first = np.searchsorted(old_sorted, new_keys, side="left")
+    last = np.searchsorted(old_sorted, new_keys, side="right")
+    new_order = np.argsort(new_keys, kind="stable")
+    new_sorted = new_keys[new_order]
+    occurrence = np.empty(len(new_keys), dtype=np.int64)
+    occurrence[new_order] = np.arange(len(new_keys)) - np.searchsorted(
+        new_sorted, new_sorted, side="left"
+    )
+    found = first + occurrence < last
+    matches = np.full(len(new_keys), -1, dtype=np.int64)
+    matches[found] = old_order[(first + occurrence)[found]]
+
+    matched = np.flatnonzero(matches >= 0)
+    same = np.ones(len(matched), dtype=bool)
+    for column in columns:
+        same &= _same_values(
+            old[column].iloc[matches[matched]], new[column].iloc[matched]
+        )
+    matches[matched[~same]] = -1
+    return matches
+
+
+def unmatched(matches: np.ndarray, n_old: int) -> np.ndarray:
+    """
+    Returns the positions of the rows of old that match no row of new,
+    i.e. that were removed or changed.
+
+    Parameters
+    ------------
+    matches: numpy.ndarray
+        The result of match_rows.
+    n_old: int
+        The number of rows of old.
+
+    Returns
+    ---------
+    numpy.ndarray
+        The positions in old, in ascending order.
+    """
+    kept = np.zeros(n_old, dtype=bool)
+    kept[matches[matches >= 0]] = True
+    return np.flatnonzero(~kept)
+
+
+def count_changes(old_rows: pd.DataFrame, new_rows: pd.DataFrame, key: list) -> tuple:
+    """
+    Counts the unmatched rows of two snapshots as added, removed or changed by key:
+    a key that has unmatched rows in both snapshots was changed.
+
+    Parameters
+    ------------
+    old_rows: pandas.DataFrame
+        The rows of old that match no row of new.
+    new_rows: pandas.DataFrame
+        The rows of new that match no row of old.
+    key: list
+        The columns that identify a row, e.g. ['Airport ID'].
+
+    Returns
+    ---------
+    tuple
+        The number of added, removed and changed keys.
+    """
+    old_keys = set(row_keys(old_rows, key).tolist())
+    new_keys = set(row_keys(new_rows, key).tolist())
+    return (
+        len(new_keys - old_keys),
+        len(old_keys - new_keys),
+        len(old_keys & new_keys),
+    )
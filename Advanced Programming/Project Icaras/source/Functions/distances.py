@@ -1,11 +1,16 @@
 """
-This module contains a function to calculate the distance between two points
+This module contains functions to calculate the distance between points
 on the earth's surface given their latitude and longitude in degrees.
 """
 
 # Import the necessary libraries
 from math import sin, cos, sqrt, atan2, radians
 
+import numpy as np
+
+# Approximate radius of earth in km, shared by the scalar and the batch function
+RADIUS_EARTH = 6373.0
+
 def distance(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
     """
     Calculate the distance between two points on the earth's surface
@@ -33,9 +38,6 @@ def distance(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
     634.0
     """
 
-    # Approximate radius of earth in km
-    radius_earth = 6373.0
-
     lat1 = radians(lat1)
     lon1 = radians(lon1)
     lat2 = radians(lat2)
@@ -47,4 +49,133 @@ def distance(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
     a_var = sin(dlat / 2)**2 + cos(lat1) * cos(lat2) * sin(dlon / 2)**2
     c_var = 2 * atan2(sqrt(a_var), sqrt(1 - a_var))
 
-    return radius_earth * c_var
+    return RADIUS_EARTH * c_var
+
+
+def distance_many(lat1, lon1, lat2, lon2) -> np.ndarray:
+    """
+    Calculate the distances between many pairs of points on the earth's surface
+    at once. This is the vectorized counterpart of the distance function and
+    works on whole arrays (or pandas Series) instead of single numbers.
+
+    Parameters
+    ------------
+    lat1: array-like
+        Latitudes of the first points in degrees.
+    lon1: array-like
+        Longitudes of the first points in degrees.
+    lat2: array-like
+        Latitudes of the second points in degrees.
+    lon2: array-like
+        Longitudes of the second points in degrees.
+
+    Returns
+    ---------
+    numpy.ndarray
+        The distances between the pairs of points in kilometers. Pairs with a
+        missing (NaN) coordinate, e.g. routes to an unknown airport, get NaN.
+
+    Raises
+    ------------
+    TypeError
+        If any of the inputs cannot be converted to numbers.
+
+    Example
+    ---------
+    distance_many([55.751244, 50.033333], [37.618423, 8.570556],
+                  [59.93863, 50.033333], [30.31413, 8.570556])
+    array([634.0, 0.0])
+    """
+    try:
+        lat1, lon1, lat2, lon2 = (
+            np.radians(np.asarray(values, dtype=np.float64))
+            for values in (lat1, lon1, lat2, lon2)
+        )
+    except (TypeError, ValueError) as error:
+        raise TypeError("All coordinates must be numbers.") from error
+
+    dlon = lon2 - lon1
+    dlat = lat2 - lat1
+
+    a_var = np.sin(dlat / 2) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin(dlon / 2) ** 2
+    # Rounding can push a_var marginally outside [0, 1] for antipodal points
+    a_var = np.clip(a_var, 0.0, 1.0)
+    c_var = 2 * np.arctan2(np.sqrt(a_var), np.sqrt(1 - a_var))
+
+    return RADIUS_EARTH * c_var
+
+
+def distance_blocks(lat1, lon1, lat2, lon2, block_size: int = 1024):
+    """
+    Calculate the distances from every first point to every second point, one block
+    of first points at a time, so that the memory used is bounded by block_size
+    rows of the matrix instead of the whole matrix.
+
+    Parameters
+    ------------
+    lat1: array-like
+        Latitudes of the first points (the rows) in degrees.
+    lon1: array-like
+        Longitudes of the first points (the rows) in degrees.
+    lat2: array-like
+        Latitudes of the second points (the columns) in degrees.
+    lon2: array-like
+        Longitudes of the second points (the columns) in degrees.
+    block_size: int, optional
+        The number of rows per block.
+
+    Yields
+    ---------
+    tuple
+        The position of the first row of the block and the block, a numpy.ndarray
+        of distances in kilometers with one row per first point and one column per
+        second point.
+
+    Example
+    ---------
+    for start, block in distance_blocks(lats, longs, lats, longs):
+        neighbours[start:start + len(block)] = (block < 100).sum(axis=1)
+    """
+    lat1, lon1 = np.asarray(lat1), np.asarray(lon1)
+    lat2, lon2 = np.asarray(lat2)[np.newaxis, :], np.asarray(lon2)[np.newaxis, :]
+    for start in range(0, len(lat1), block_size):
+        rows = slice(start, start + block_size)
+        yield start, distance_many(
+            lat1[rows, np.newaxis], lon1[rows, np.newaxis], lat2, lon2
+        )
+
+
+def distance_matrix(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+    lat1, lon1, lat2, lon2, block_size: int = 1024, out=None
+) -> np.ndarray:
+    """
+    Calculate the matrix of distances from every first point to every second point
+    block by block with distance_blocks. Pass a numpy.memmap as out to write a matrix
+    that does not fit in memory to disk.
+
+    Parameters
+    ------------
+    lat1: array-like
+        Latitudes of the first points (the rows) in degrees.
+    lon1: array-like
+        Longitudes of the first points (the rows) in degrees.
+    lat2: array-like
+        Latitudes of the second points (the columns) in degrees.
+    lon2: array-like
+        Longitudes of the second points (the columns) in degrees.
+    block_size: int, optional
+        The number of rows calculated at a time.
+    out: numpy.ndarray, optional
+        The array to write the distances to, of shape (len(lat1), len(lat2)).
+        A new float64 array by default.
+
+    Returns
+    ---------
+    numpy.ndarray
+        The distances in kilometers.
+    """
+    if out is None:
+        out = np.empty((len(lat1), len(lat2)))
+    for start, block in distance_blocks(lat1, lon1, lat2, lon2, block_size):
+        out[start : start + len(block)] = block
+    return out
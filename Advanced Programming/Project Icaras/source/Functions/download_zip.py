@@ -1,41 +1,187 @@
 """
-This module contains a function that downloads a file of your choice
+This module contains a function that downloads a file of your choice.
+Downloads are streamed to a temporary file that is renamed once it is complete,
+interrupted downloads are resumed, and files that did not change on the server
+are not downloaded again.
 """
 
 # Import the necessary libraries
-from urllib.request import urlretrieve
+import hashlib
+import json
 import os  # we want python to be able to read what we have in our hard drive
+import shutil
+from email.utils import formatdate
+from urllib.error import HTTPError, URLError
+from urllib.request import Request, urlopen
 
+CHUNK_SIZE = 1 << 20  # Number of bytes written at a time
 
-def download_file(file_link: str, output_file: str = "downloads/flight_data.zip") -> None:
+
+def _read_metadata(metadata_file: str) -> dict:
+    """
+    Reads the ETag and Last-Modified headers stored next to a downloaded file.
+    """
+    if not os.path.exists(metadata_file):
+        return {}
+    with open(metadata_file, encoding="utf-8") as file:
+        return json.load(file)
+
+
+def _file_sha256(file_path: str) -> str:
+    """
+    Calculates the SHA-256 hex digest of a file.
+    """
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as file:
+        for chunk in iter(lambda: file.read(CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _request_headers(output_file: str, part_file: str) -> tuple:
+    """
+    Returns the headers of the request and the size of the partial file it resumes,
+    0 if the whole file is requested.
+    """
+    metadata = _read_metadata(output_file + ".meta.json")
+    part_metadata = _read_metadata(part_file + ".meta.json")
+    resume_from = os.path.getsize(part_file) if os.path.exists(part_file) else 0
+    validator = part_metadata.get("etag") or part_metadata.get("last_modified")
+    if resume_from and validator:
+        # Resume the partial file, unless it changed on the server in the meantime
+        return {"Range": f"bytes={resume_from}-", "If-Range": validator}, resume_from
+    headers = {}
+    if os.path.exists(output_file):
+        # Ask the server to only send the file if it changed
+        if metadata.get("etag"):
+            headers["If-None-Match"] = metadata["etag"]
+        headers["If-Modified-Since"] = metadata.get("last_modified") or formatdate(
+            os.path.getmtime(output_file), usegmt=True
+        )
+    return headers, 0
+
+
+def _write_part(response, part_file: str, resume_from: int) -> int:
+    """
+    Appends the body of a response to the partial file, or replaces the partial
+    file if the server sent the whole file, and returns the size the partial file
+    must have once the body is complete, None if the length was not announced.
+    """
+    if response.status != 206:
+        # The server sent the whole file, so a partial file cannot be reused
+        resume_from = 0
+        with open(part_file + ".meta.json", "w", encoding="utf-8") as file:
+            json.dump(
+                {
+                    "etag": response.headers.get("ETag"),
+                    "last_modified": response.headers.get("Last-Modified"),
+                },
+                file,
+            )
+    expected_length = response.headers.get("Content-Length")
+    with open(part_file, "ab" if resume_from else "wb") as file:
+        shutil.copyfileobj(response, file, CHUNK_SIZE)
+    return None if expected_length is None else resume_from + int(expected_length)
+
+
+def download_file(
+    file_link: str,
+    output_file: str = "downloads/flight_data.zip",
+    sha256: str = None,
+    timeout: float = 60,
+) -> None:
     """
     Downloads a file from an URL into your hard drive.
 
+    The file is streamed in chunks to output_file + '.part' and only renamed to
+    output_file when it is complete and verified, so an interrupted run never leaves
+    a truncated file behind. The next run resumes the partial file with an HTTP Range
+    request that is only honoured if the ETag of the file did not change (If-Range).
+    The ETag and Last-Modified headers of the download are stored in
+    output_file + '.meta.json' and sent back as If-None-Match and If-Modified-Since,
+    so a file that did not change on the server is not downloaded again. If the server
+    cannot be reached or answers with an error, an existing file is kept.
+
     Parameters
     ------------
     file_link: str
         A string containing the link to the file you wish to download.
     output_file: str
-        A string containing the name of the output file. The default value is 'file.csv'
-        at the location you are running the function.
+        A string containing the name of the output file. The default value is
+        'downloads/flight_data.zip' at the location you are running the function.
+    sha256: str, optional
+        The expected SHA-256 hex digest of the file. A download that does not match
+        it is discarded.
+    timeout: float, optional
+        The timeout of the connection in seconds.
 
     Returns
     ---------
     Nothing
 
+    Raises
+    ------------
+    ValueError
+        If the downloaded file does not match the expected checksum or the
+        announced length.
+    urllib.error.URLError
+        If the server cannot be reached or answers with an error and there is
+        no existing file.
 
     Example
     ---------
     download_file("https://archive.ics.uci.edu/ml/machine-learning-databases/00320/student.zip",
-                  output_file='student.zip')
+                  output_file='downloads/student.zip')
     """
 
     # Ensure the 'downloads/' directory exists
-    os.makedirs(os.path.dirname(output_file), exist_ok=True)
+    if os.path.dirname(output_file):
+        os.makedirs(os.path.dirname(output_file), exist_ok=True)
+    part_file = output_file + ".part"
 
-    # If file doesn't exist, download it. Else, print a warning message.
-    if not os.path.exists(output_file):
-        urlretrieve(file_link, filename=output_file)
-        print(f"File downloaded and saved to: {output_file}")
-    else:
+    # A complete file that matches the expected checksum does not need the server
+    if os.path.exists(output_file) and sha256 and _file_sha256(output_file) == sha256:
         print("File already exists!")
+        return
+
+    headers, resume_from = _request_headers(output_file, part_file)
+    try:
+        response = urlopen(Request(file_link, headers=headers), timeout=timeout)
+    except HTTPError as error:
+        if error.code == 304:
+            print("File already exists!")
+            return
+        if error.code == 416:
+            # The partial file is not a prefix of the current file, start over
+            os.remove(part_file)
+            os.remove(part_file + ".meta.json")
+            download_file(file_link, output_file, sha256=sha256, timeout=timeout)
+            return
+        if os.path.exists(output_file):
+            print(f"Server answered with HTTP {error.code}, using the existing file!")
+            return
+        raise
+    except URLError:
+        if os.path.exists(output_file):
+            print("Server not reachable, using the existing file!")
+            return
+        raise
+
+    with response:
+        expected_size = _write_part(response, part_file, resume_from)
+
+    # Verify the download before it replaces the output file
+    size = os.path.getsize(part_file)
+    if expected_size is not None and size != expected_size:
+        raise ValueError(
+            f"Download of {file_link} is incomplete: {size} of "
+            f"{expected_size} bytes. Run again to resume it."
+        )
+    if sha256 and _file_sha256(part_file) != sha256:
+        os.remove(part_file)
+        os.remove(part_file + ".meta.json")
+        raise ValueError(f"Download of {file_link} does not match the expected checksum.")
+
+    os.replace(part_file, output_file)
+    os.replace(part_file + ".meta.json", output_file + ".meta.json")
+    print(f"File downloaded and saved to: {output_file}")
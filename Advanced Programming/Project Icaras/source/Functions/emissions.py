@@ -0,0 +1,276 @@
+"""
+This module contains functions to select the flights departing from a country,
+classify them into short-haul and long-haul flights and estimate the reduction
+in CO2 emissions if short-haul flights were replaced by trains.
+"""
+
+# Import the necessary libraries
+import numpy as np
+import pandas as pd
+
+
+def country_flights(  # pylint: disable=too-many-arguments,too-many-positional-arguments
+    airports_df: pd.DataFrame,
+    routes_df: pd.DataFrame,
+    airport_index: pd.DataFrame,
+    country_name: str,
+    threshold: float = 1000,
+    internal: bool = False,
+) -> pd.DataFrame:
+    """
+    Selects all flights departing from the airports of a country with a single join
+    and classifies them into short-haul and long-haul flights.
+
+    Parameters
+    ------------
+    airports_df: pandas.DataFrame
+        A DataFrame containing airport data.
+    routes_df: pandas.DataFrame
+        A DataFrame containing route data with a distance_km column.
+    airport_index: pandas.DataFrame
+        The airports indexed by airport code, used to resolve the destinations.
+    country_name: str
+        The name of the country whose departing flights are selected.
+    threshold: float, optional
+        The distance threshold in kilometers to distinguish short-haul from long-haul flights.
+    internal: bool, optional
+        Whether to only include flights within the same country.
+
+    Returns
+    ---------
+    pandas.DataFrame
+        One row per flight with the source and destination coordinates, the distance,
+        whether the flight is internal and whether it is a short-haul flight.
+        Flights to airports that are not in the data are left out.
+    """
+    country_airports = airports_df.loc[
+        airports_df["Country"] == country_name, ["IATA", "Latitude", "Longitude"]
+    ]
+    flights = country_airports.merge(
+        routes_df[["Source airport", "Destination airport", "distance_km"]],
+        left_on="IATA",
+        right_on="Source airport",
+    )
+    destinations = airport_index.reindex(flights["Destination airport"])
+
+    flights = pd.DataFrame(
+        {
+            "Source airport": flights["Source airport"].to_numpy(),
+            "Destination airport": flights["Destination airport"].to_numpy(),
+            "Source latitude": flights["Latitude"].to_numpy(),
+            "Source longitude": flights["Longitude"].to_numpy(),
+            "Destination latitude": destinations["Latitude"].to_numpy(),
+            "Destination longitude": destinations["Longitude"].to_numpy(),
+            "distance_km": flights["distance_km"].to_numpy(),
+            "Internal": (destinations["Country"] == country_name).to_numpy(),
+            "Short-haul": (flights["distance_km"] < threshold).to_numpy(),
+        }
+    )
+    # Skip flights whose destination airport does not exist in the data
+    flights = flights[flights["Destination latitude"].notna()]
+    if internal:
+        flights = flights[flights["Internal"]]
+
+    return flights.reset_index(drop=True)
+
+
+def haul_summary(flights: pd.DataFrame, train_plane_ratio: float = 3 / 25) -> pd.DataFrame:
+    """
+    Aggregates the count and total distance of short-haul and long-haul flights
+    and the resulting CO2 emissions if short-haul flights were replaced by trains.
+
+    Parameters
+    ------------
+    flights: pandas.DataFrame
+        A DataFrame as returned by country_flights.
+    train_plane_ratio: float, optional
+        The ratio of train to plane emissions for short-haul flights.
+
+    Returns
+    ---------
+    pandas.DataFrame
+        A single-row DataFrame with the columns sh_count, sh_dist, lh_count, lh_dist
+        and emission_reduction, the emissions in percent of the current emissions.
+    """
+    totals = (
+        flights.groupby("Short-haul")["distance_km"]
+        .agg(["count", "sum"])
+        .reindex([True, False], fill_value=0)
+    )
+    summary = pd.DataFrame(
+        {
+            "sh_count": [int(totals.loc[True, "count"])],
+            "sh_dist": [float(totals.loc[True, "sum"])],
+            "lh_count": [int(totals.loc[False, "count"])],
+            "lh_dist": [float(totals.loc[False, "sum"])],
+        }
+    )
+    summary["emission_reduction"] = emission_reduction(
+        summary["sh_dist"], summary["lh_dist"], train_plane_ratio
+    )
+    return summary
+
+
+def emission_reduction(sh_dist, lh_dist, train_plane_ratio: float = 3 / 25):
+    """
+    Calculates the CO2 emissions, in percent of the current emissions, if short-haul
+    flights were replaced by trains.
+
+    Parameters
+    ------------
+    sh_dist: float or array-like
+        The total distance of short-haul flights in kilometers.
+    lh_dist: float or array-like
+        The total distance of long-haul flights in kilometers.
+    train_plane_ratio: float or array-like, optional
+        The ratio of train to plane emissions for short-haul flights.
+
+    Returns
+    ---------
+    float or numpy.ndarray
+        The remaining emissions in percent. NaN if there are no flights at all.
+    """
+    sh_dist = np.asarray(sh_dist, dtype=np.float64)
+    lh_dist = np.asarray(lh_dist, dtype=np.float64)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return (train_plane_ratio * sh_dist + lh_dist) / (sh_dist + lh_dist) * 100
+
+
+def departure_table(
+    airports_df: pd.DataFrame, routes_df: pd.DataFrame, airport_index: pd.DataFrame
+) -> pd.DataFrame:
+    """
+    Lists the flights departing from the airports of every country, as country_flights
+    selects them for a single country, with their distance and whether they are internal.
+    Flights to airports that are not in the data and flights without a distance are
+    left out, as they count neither as short-haul nor as long-haul flights.
+
+    Parameters
+    ------------
+    airports_df: pandas.DataFrame
+        A DataFrame containing airport data.
+    routes_df: pandas.DataFrame
+        A DataFrame containing route data with a distance_km column.
+    airport_index: pandas.DataFrame
+        The airports indexed by airport code, used to resolve the destinations.
+
+    Returns
+    ---------
+    pandas.DataFrame
+        One row per flight with the Country of departure, the distance_km, the
+        Destination country and whether the flight is Internal, sorted by country
+        and distance.
+    """
+    flights = (
+        airports_df[["IATA", "Country"]]
+        .astype({"Country": object})
+        .merge(
+            routes_df[["Source airport", "Destination airport", "distance_km"]],
+            left_on="IATA",
+            right_on="Source airport",
+        )
+    )
+    destinations = airport_index.reindex(flights["Destination airport"])
+    table = pd.DataFrame(
+        {
+            "Country": flights["Country"].to_numpy(),
+            "distance_km": flights["distance_km"].to_numpy(dtype=np.float64),
+            "Destination country": destinations["Country"].astype(object).to_numpy(),
+        }
+    )
+    table["Internal"] = table["Destination country"].to_numpy() == table["Country"].to_numpy()
+    known = destinations["Latitude"].notna().to_numpy() & table["distance_km"].notna().to_numpy()
+    return table[known & table["Country"].notna().to_numpy()].sort_values(
+        ["Country", "distance_km"], kind="stable", ignore_index=True
+    )
+
+
+def scenario_sweep(  # pylint: disable=too-many-locals
+    departures: pd.DataFrame,
+    countries: list = None,
+    thresholds: list = (1000,),
+    train_plane_ratios: list = (3 / 25,),
+    internal: list = (False, True),
+) -> pd.DataFrame:
+    """
+    Calculates the short-haul and long-haul totals and the emission reduction of
+    plot_country_flights for every combination of country, threshold, train to plane
+    ratio and internal-only setting. The distances of each country are sorted once,
+    so the short-haul flights below a threshold are a prefix whose count and total
+    distance are looked up in cumulative sums, for all thresholds at once.
+
+    Parameters
+    ------------
+    departures: pandas.DataFrame
+        The flights as returned by departure_table.
+    countries: list, optional
+        The countries of departure. By default all countries of departures.
+    thresholds: list, optional
+        The distance thresholds in kilometers below which flights are short-haul.
+    train_plane_ratios: list, optional
+        The ratios of train to plane emissions for short-haul flights.
+    internal: list, optional
+        Whether to only include flights within the same country, one scenario per value.
+
+    Returns
+    ---------
+    pandas.DataFrame
+        One row per scenario with the columns Country, threshold, train_plane_ratio,
+        internal, sh_count, sh_dist, lh_count, lh_dist and emission_reduction, as in
+        haul_summary. Countries without flights have zero counts and a NaN reduction.
+
+    Example
+    ---------
+    >>> scenarios = scenario_sweep(departures, thresholds=range(250, 2001, 250))
+    """
+    if countries is None:
+        countries = departures["Country"].unique()
+    countries = np.asarray(countries, dtype=object)
+    thresholds = np.asarray(thresholds, dtype=np.float64)
+    ratios = np.asarray(train_plane_ratios, dtype=np.float64)
+    internal = np.asarray(internal, dtype=bool)
+
+    # The start and end of the flights of each country in the sorted table
+    names = departures["Country"].to_numpy()
+    starts = np.searchsorted(names, countries, side="left")
+    ends = np.searchsorted(names, countries, side="right")
+    distances = departures["distance_km"].to_numpy()
+    is_internal = departures["Internal"].to_numpy()
+
+    # Short-haul count and distance per country, internal setting and threshold
+    shape = (len(countries), len(internal), len(thresholds))
+    sh_count = np.zeros(shape, dtype=np.int64)
+    sh_dist = np.zeros(shape)
+    lh_count = np.zeros(shape, dtype=np.int64)
+    lh_dist = np.zeros(shape)
+    for row, (start, end) in enumerate(zip(starts, ends)):
+        for column, internal_only in enumerate(internal):
+            country_distances = distances[start:end]
+            if internal_only:
+                country_distances = country_distances[is_internal[start:end]]
+            cumulative = np.concatenate([[0.0], np.cumsum(country_distances)])
+            below = np.searchsorted(country_distances, thresholds, side="left")
+            sh_count[row, column] = below
+            sh_dist[row, column] = cumulative[below]
+            lh_count[row, column] = len(country_distances) - below
+            lh_dist[row, column] = cumulative[-1] - cumulative[below]
+
+    # One row per country, threshold, ratio and internal setting
+    shape = (len(countries), len(thresholds), len(ratios), len(internal))
+    grid = np.indices(shape).reshape(len(shape), -1)
+    totals = (grid[0], grid[3], grid[1])
+    return pd.DataFrame(
+        {
+            "Country": countries[grid[0]],
+            "threshold": thresholds[grid[1]],
+            "train_plane_ratio": ratios[grid[2]],
+            "internal": internal[grid[3]],
+            "sh_count": sh_count[totals],
+            "sh_dist": sh_dist[totals],
+            "lh_count": lh_count[totals],
+            "lh_dist": lh_dist[totals],
+            "emission_reduction": emission_reduction(
+                sh_dist[totals], lh_dist[totals], ratios[grid[2]]
+            ),
+        }
+    )
@@ -0,0 +1,253 @@
+"""
+This module contains a class that counts the airplane models used on the routes
+of any set of countries from counts that are aggregated once.
+"""
+
+# Import the necessary libraries
+import numpy as np
+import pandas as pd
+
+from Functions.route_table import RouteTable
+
+
+class EquipmentCube:  # pylint: disable=too-many-instance-attributes
+    """
+    Counts of the airplane models flown on the routes, aggregated once per
+    source country, per destination country and per pair of countries.
+
+    The routes of a set of countries S are the routes that depart from or arrive
+    in S, so their model counts are the counts of the routes departing from S plus
+    the counts of the routes arriving in S minus the counts of the routes within S,
+    which were added twice. A query is therefore a few row lookups and a small sum
+    instead of a pass over all routes. The airplane models and the countries of the
+    routes are joined by ID through the route table, not by their codes.
+
+    Attributes
+    ------------
+    exploded: pandas.DataFrame
+        One row per route and airplane model, with the columns Route (the position
+        of the route in routes_df), Equipment (the IATA code of the airplane),
+        Name (the model), Source country and Destination country.
+    countries: pandas.Index
+        The countries, in the order of the rows of the count arrays.
+    models: pandas.Index
+        The airplane models, in the order of the columns of the count arrays.
+    source_counts: numpy.ndarray
+        The number of routes per source country and model.
+    destination_counts: numpy.ndarray
+        The number of routes per destination country and model.
+    pair_counts: pandas.DataFrame
+        The number of routes per model (columns) for each pair of source and
+        destination country (index) that has routes.
+    total_counts: numpy.ndarray
+        The number of routes per model worldwide, including routes between
+        airports of unknown countries.
+    """
+
+    def __init__(
+        self,
+        table: RouteTable,
+        airports_df: pd.DataFrame,
+        airplanes_df: pd.DataFrame,
+    ):
+        """
+        Explodes the equipment of the routes into one row per airplane and
+        aggregates the counts.
+
+        Parameters
+        ------------
+        table: RouteTable
+            The route table of routes_df.
+        airports_df: pandas.DataFrame
+            The airports the route table was built with, with a Country column.
+        airplanes_df: pandas.DataFrame
+            The airplanes, with the Name and IATA code columns.
+        """
+        self._n_routes = len(table)
+        # Every attribute exists from the start, _aggregate and _add_counts fill them
+        self.countries = pd.Index([])
+        self.models = pd.Index([])
+        self.total_counts = np.zeros(0, dtype=np.int64)
+        self.source_counts = np.zeros((0, 0), dtype=np.int64)
+        self.destination_counts = np.zeros((0, 0), dtype=np.int64)
+        self._pair_ids = np.zeros(0, dtype=np.int64)
+        self._pair_matrix = np.zeros((0, 0), dtype=np.int64)
+        self._pair_sources = np.zeros(0, dtype=np.int64)
+        self._pair_destinations = np.zeros(0, dtype=np.int64)
+        self.pair_counts = pd.DataFrame()
+        self._rows = {}
+        self.exploded = self._explode(table, airports_df, airplanes_df, np.arange(len(table)))
+        self._aggregate(airports_df)
+
+    @staticmethod
+    def _explode(
+        table: RouteTable,
+        airports_df: pd.DataFrame,
+        airplanes_df: pd.DataFrame,
+        positions: np.ndarray,
+    ) -> pd.DataFrame:
+        """
+        Returns one row per airplane of the routes at positions, see exploded.
+        """
+        exploded = table.equipment_models(airplanes_df, positions)
+        routes = exploded["Route"].to_numpy()
+        for prefix, airport_ids in [("Source", table.source), ("Destination", table.destination)]:
+            exploded[f"{prefix} country"] = table.airport_values(
+                airports_df["Country"], airport_ids[routes]
+            )
+        return exploded
+
+    def _aggregate(self, airports_df: pd.DataFrame) -> None:
+        """
+        Counts the rows of exploded per country and model.
+        """
+        self.countries = pd.Index(sorted(airports_df["Country"].dropna().unique()))
+        self.models = pd.Index(sorted(self.exploded["Name"].unique()))
+        shape = (len(self.countries), len(self.models))
+        self.total_counts = np.zeros(len(self.models), dtype=np.int64)
+        self.source_counts = np.zeros(shape, dtype=np.int64)
+        self.destination_counts = np.zeros(shape, dtype=np.int64)
+        self._pair_ids = np.zeros(0, dtype=np.int64)
+        self._pair_matrix = np.zeros((0, len(self.models)), dtype=np.int64)
+        self._add_counts(self.exploded, 1)
+
+    def _add_counts(self, rows: pd.DataFrame, sign: int) -> None:
+        """
+        Adds (sign 1) or subtracts (sign -1) the counts of rows of exploded, whose
+        countries and models must be in countries and models.
+        """
+        model_codes = self.models.get_indexer(rows["Name"])
+        source_codes = self.countries.get_indexer(rows["Source country"])
+        destination_codes = self.countries.get_indexer(rows["Destination country"])
+
+        self.total_counts += sign * np.bincount(model_codes, minlength=len(self.models))
+        known = source_codes >= 0
+        np.add.at(self.source_counts, (source_codes[known], model_codes[known]), sign)
+        known = destination_codes >= 0
+        np.add.at(self.destination_counts, (destination_codes[known], model_codes[known]), sign)
+
+        # The pairs of countries are numbered source * len(countries) + destination
+        known = (source_codes >= 0) & (destination_codes >= 0)
+        pairs = source_codes[known] * len(self.countries) + destination_codes[known]
+        pair_ids = np.union1d(self._pair_ids, pairs)
+        pair_matrix = np.zeros((len(pair_ids), len(self.models)), dtype=np.int64)
+        pair_matrix[np.searchsorted(pair_ids, self._pair_ids)] = self._pair_matrix
+        np.add.at(pair_matrix, (np.searchsorted(pair_ids, pairs), model_codes[known]), sign)
+        used = pair_matrix.any(axis=1)
+        self._pair_ids = pair_ids[used]
+        self._pair_matrix = pair_matrix[used]
+        self._pair_sources, self._pair_destinations = np.divmod(
+            self._pair_ids, len(self.countries)
+        )
+        self.pair_counts = pd.DataFrame(
+            self._pair_matrix,
+            index=pd.MultiIndex.from_arrays(
+                [self._pair_sources, self._pair_destinations], names=["Source", "Destination"]
+            ),
+            columns=pd.RangeIndex(len(self.models), name="Model"),
+        )
+        self._rows = {country: row for row, country in enumerate(self.countries)}
+
+    def update(
+        self,
+        table: RouteTable,
+        airports_df: pd.DataFrame,
+        airplanes_df: pd.DataFrame,
+        previous: np.ndarray,
+    ) -> None:
+        """
+        Updates the counts to a new version of the routes. Only the routes that are
+        new or changed are exploded and merged with the airplanes, and their counts
+        are added to the counts of the unchanged routes after subtracting the counts
+        of the routes that were removed. If countries or models appear or disappear,
+        the counts are aggregated again from exploded.
+
+        Parameters
+        ------------
+        table: RouteTable
+            The route table of the new routes.
+        airports_df: pandas.DataFrame
+            The new airports.
+        airplanes_df: pandas.DataFrame
+            The airplanes, which must not have changed.
+        previous: numpy.ndarray
+            For each new route, the position of the same route in the routes the
+            counts were built from, or -1 for routes that are new, changed, or whose
+            airports changed country.
+        """
+        previous = np.asarray(previous)
+        reused = np.flatnonzero(previous >= 0)
+        new_positions = np.full(self._n_routes, -1)
+        new_positions[previous[reused]] = reused
+        routes = new_positions[self.exploded["Route"].to_numpy()]
+        removed = self.exploded[routes < 0]
+        kept = self.exploded[routes >= 0].assign(Route=routes[routes >= 0])
+        added = self._explode(table, airports_df, airplanes_df, np.flatnonzero(previous < 0))
+        self._n_routes = len(table)
+        self.exploded = pd.concat([kept, added]).sort_values(
+            "Route", kind="stable", ignore_index=True
+        )
+
+        countries = pd.Index(sorted(airports_df["Country"].dropna().unique()))
+        if countries.equals(self.countries) and added["Name"].isin(self.models).all():
+            self._add_counts(removed, -1)
+            self._add_counts(added, 1)
+            if (self.total_counts > 0).all():
+                return
+        self._aggregate(airports_df)
+
+    def _count_array(self, countries: list = None) -> np.ndarray:
+        """
+        Returns the number of routes per model of the countries as an array.
+        """
+        if countries is None:
+            return self.total_counts
+        rows = sorted({self._rows[country] for country in countries if country in self._rows})
+        within = np.zeros(len(self.countries), dtype=bool)
+        within[rows] = True
+        within = within[self._pair_sources] & within[self._pair_destinations]
+        return (
+            self.source_counts[rows].sum(axis=0)
+            + self.destination_counts[rows].sum(axis=0)
+            - self._pair_matrix[within].sum(axis=0)
+        )
+
+    def counts(self, countries: list = None) -> pd.Series:
+        """
+        Returns the number of routes per airplane model.
+
+        Parameters
+        ------------
+        countries: list, optional
+            The countries whose departing and arriving routes are counted.
+            All routes are counted if no countries are given.
+
+        Returns
+        ---------
+        pandas.Series
+            The number of routes indexed by model name, including models with no routes.
+        """
+        return pd.Series(self._count_array(countries), index=self.models, name="Counts")
+
+    def top_models(self, countries: list = None, top_n: int = 10) -> pd.Series:
+        """
+        Returns the N most used airplane models by number of routes.
+
+        Parameters
+        ------------
+        countries: list, optional
+            The countries whose departing and arriving routes are counted.
+            All routes are counted if no countries are given.
+        top_n: int, optional
+            The number of models to return.
+
+        Returns
+        ---------
+        pandas.Series
+            The number of routes of the top models, in descending order.
+        """
+        counts = self._count_array(countries)
+        # Models with the same count stay in alphabetical order
+        top = np.argsort(-counts, kind="stable")[:top_n]
+        top = top[counts[top] > 0]
+        return pd.Series(counts[top], index=self.models[top], name="Counts")
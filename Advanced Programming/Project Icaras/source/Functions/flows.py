@@ -0,0 +1,262 @@
+"""
+This module contains a class that aggregates the flights between every pair of
+countries once, so that the flights of a pair of countries or of a single country
+are looked up instead of selected from the routes.
+"""
+
+# Import the necessary libraries
+import numpy as np
+import pandas as pd
+
+from Functions.emissions import emission_reduction
+
+# The measures of each pair of countries, in the order of the columns of to_frame
+MEASURES = ["Routes", "distance_km", "sh_count", "sh_dist", "lh_count", "lh_dist"]
+
+
+class CountryFlows:  # pylint: disable=too-many-instance-attributes
+    """
+    The flights between countries as dense country × country arrays, with the
+    countries of departure as rows and the countries of arrival as columns. The
+    flights are those of country_flights: the departures from the airports of a
+    country, by IATA code, to airports that are in the data. Flights shorter than
+    threshold are short-haul (sh), the others long-haul (lh).
+
+    With a few hundred countries the arrays take a few MB, so they are dense; the
+    totals of each country of departure and its internal flights are kept as well,
+    so that every summary is an array lookup.
+
+    Attributes
+    ------------
+    countries: pandas.Index
+        The countries of airports_df, in the order of the rows and columns.
+    threshold: float
+        The distance in kilometers below which flights are short-haul.
+    counts: numpy.ndarray
+        The number of short-haul (counts[0]) and long-haul (counts[1]) flights
+        for each pair of countries.
+    distances: numpy.ndarray
+        The total distance in km of the short-haul and long-haul flights for each
+        pair of countries.
+    departing_counts, departing_distances: numpy.ndarray
+        The totals of counts and distances per country of departure.
+    airport_order: numpy.ndarray
+        The positions in airports_df of the airports, grouped by country.
+    airport_indptr: numpy.ndarray
+        The airports of the i-th country are airport_order[airport_indptr[i]:airport_indptr[i + 1]].
+    """
+
+    def __init__(self, departures: pd.DataFrame, airports_df: pd.DataFrame, threshold=1000):
+        """
+        Aggregates the departures per pair of countries and groups the airports by country.
+
+        Parameters
+        ------------
+        departures: pandas.DataFrame
+            The flights as listed by departure_table, with the Country, Destination
+            country and distance_km columns.
+        airports_df: pandas.DataFrame
+            The airports, with a Country column.
+        threshold: float, optional
+            The distance in kilometers below which flights are short-haul.
+        """
+        self.threshold = threshold
+        airport_countries = airports_df["Country"].astype(object)
+        self.countries = pd.Index(sorted(airport_countries.dropna().unique()))
+        size = len(self.countries)
+
+        # The airports of each country, like the groups of a groupby on Country
+        codes = self.countries.get_indexer(airport_countries)
+        known = np.flatnonzero(codes >= 0)
+        self.airport_order = known[np.argsort(codes[known], kind="stable")]
+        self.airport_indptr = np.concatenate(
+            [[0], np.cumsum(np.bincount(codes[known], minlength=size))]
+        )
+
+        # The pairs of countries are numbered source * len(countries) + destination
+        sources = self.countries.get_indexer(departures["Country"].astype(object))
+        destinations = self.countries.get_indexer(
+            departures["Destination country"].astype(object)
+        )
+        distances = departures["distance_km"].to_numpy(np.float64)
+        known = (sources >= 0) & (destinations >= 0)
+        pairs = sources * size + destinations
+        self.counts = np.zeros((2, size, size), dtype=np.int64)
+        self.distances = np.zeros((2, size, size), dtype=np.float64)
+        for haul, selected in enumerate([distances < threshold, distances >= threshold]):
+            selected &= known
+            self.counts[haul] = np.bincount(pairs[selected], minlength=size * size).reshape(
+                size, size
+            )
+            self.distances[haul] = np.bincount(
+                pairs[selected], weights=distances[selected], minlength=size * size
+            ).reshape(size, size)
+        self.departing_counts = self.counts.sum(axis=2)
+        self.departing_distances = self.distances.sum(axis=2)
+
+    def __len__(self) -> int:
+        return len(self.countries)
+
+    def __contains__(self, country) -> bool:
+        return country in self.countries
+
+    def position(self, country: str) -> int:
+        """
+        Returns the row and column of a country in the arrays.
+
+        Raises
+        ------------
+        ValueError
+            If the country does not exist in the provided data.
+        """
+        if country not in self.countries:
+            raise ValueError(
+                f"The specified country '{country}' does not exist in the provided data."
+            )
+        return self.countries.get_loc(country)
+
+    def airport_positions(self, country: str) -> np.ndarray:
+        """
+        Returns the positions in airports_df of the airports of a country, in order.
+        """
+        row = self.position(country)
+        return self.airport_order[self.airport_indptr[row] : self.airport_indptr[row + 1]]
+
+    def pair(self, source_country: str, destination_country: str) -> pd.Series:
+        """
+        Returns the flights from one country to another.
+
+        Parameters
+        ------------
+        source_country: str
+            The country of departure.
+        destination_country: str
+            The country of arrival, the same country for its internal flights.
+
+        Returns
+        ---------
+        pandas.Series
+            The measures of MEASURES.
+        """
+        source = self.position(source_country)
+        destination = self.position(destination_country)
+        return self._measures(
+            self.counts[:, source, destination], self.distances[:, source, destination]
+        )
+
+    def summary(
+        self, country: str, internal: bool = False, train_plane_ratio: float = 3 / 25
+    ) -> pd.DataFrame:
+        """
+        Returns the summary of haul_summary of the flights departing from a country.
+
+        Parameters
+        ------------
+        country: str
+            The country of departure.
+        internal: bool, optional
+            Whether to only include flights within the same country.
+        train_plane_ratio: float, optional
+            The ratio of train to plane emissions for short-haul flights.
+
+        Returns
+        ---------
+        pandas.DataFrame
+            A single-row DataFrame with the columns sh_count, sh_dist, lh_count, lh_dist
+            and emission_reduction.
+        """
+        row = self.position(country)
+        if internal:
+            counts, distances = self.counts[:, row, row], self.distances[:, row, row]
+        else:
+            counts, distances = self.departing_counts[:, row], self.departing_distances[:, row]
+        summary = pd.DataFrame(
+            {
+                "sh_count": [int(counts[0])],
+                "sh_dist": [float(distances[0])],
+                "lh_count": [int(counts[1])],
+                "lh_dist": [float(distances[1])],
+            }
+        )
+        summary["emission_reduction"] = emission_reduction(
+            summary["sh_dist"], summary["lh_dist"], train_plane_ratio
+        )
+        return summary
+
+    @staticmethod
+    def _measures(counts: np.ndarray, distances: np.ndarray) -> pd.Series:
+        """
+        Returns the measures of MEASURES of the short-haul and long-haul counts and distances.
+        """
+        return pd.Series(
+            [
+                int(counts.sum()),
+                float(distances.sum()),
+                int(counts[0]),
+                float(distances[0]),
+                int(counts[1]),
+                float(distances[1]),
+            ],
+            index=MEASURES,
+            dtype=object,
+        )
+
+    def matrix(self, measure: str = "Routes") -> pd.DataFrame:
+        """
+        Returns one measure for every pair of countries.
+
+        Parameters
+        ------------
+        measure: str, optional
+            One of MEASURES.
+
+        Returns
+        ---------
+        pandas.DataFrame
+            The measure with the countries of departure as index and the countries
+            of arrival as columns.
+
+        Raises
+        ------------
+        ValueError
+            If measure is not one of MEASURES.
+        """
+        if measure not in MEASURES:
+            raise ValueError(f"measure must be one of {MEASURES}, not '{measure}'.")
+        values = {
+            "Routes": lambda: self.counts.sum(axis=0),
+            "distance_km": lambda: self.distances.sum(axis=0),
+            "sh_count": lambda: self.counts[0],
+            "sh_dist": lambda: self.distances[0],
+            "lh_count": lambda: self.counts[1],
+            "lh_dist": lambda: self.distances[1],
+        }[measure]()
+        return pd.DataFrame(
+            values,
+            index=self.countries.rename("Source country"),
+            columns=self.countries.rename("Destination country"),
+        )
+
+    def to_frame(self) -> pd.DataFrame:
+        """
+        Lists the pairs of countries with flights between them, e.g. to export them.
+
+        Returns
+        ---------
+        pandas.DataFrame
+            One row per pair of countries with the Source country and Destination
+            country columns and the measures of MEASURES.
+        """
+        sources, destinations = np.nonzero(self.counts.sum(axis=0))
+        return pd.DataFrame(
+            {
+                "Source country": self.countries[sources],
+                "Destination country": self.countries[destinations],
+                "Routes": self.counts[:, sources, destinations].sum(axis=0),
+                "distance_km": self.distances[:, sources, destinations].sum(axis=0),
+                "sh_count": self.counts[0, sources, destinations],
+                "sh_dist": self.distances[0, sources, destinations],
+                "lh_count": self.counts[1, sources, destinations],
+                "lh_dist": self.distances[1, sources, destinations],
+            }
+        )
@@ -0,0 +1,250 @@
+"""
+This module contains a client for looking up information about aircraft and
+airports with a language model. The client is created once and reused, answers
+are cached on disk, and lists of entities are looked up concurrently.
+"""
+
+# Import the necessary libraries
+import asyncio
+import hashlib
+import json
+import os
+import threading
+
+
+def response_key(entity: str, prompt: str, model: str, temperature: float) -> str:
+    """
+    Calculates the cache key of an answer.
+
+    Parameters
+    ------------
+    entity: str
+        The aircraft or airport the prompt is about.
+    prompt: str
+        The prompt sent to the language model.
+    model: str
+        The name of the language model.
+    temperature: float
+        The sampling temperature of the language model.
+
+    Returns
+    ---------
+    str
+        The SHA-256 hex digest of the four values.
+    """
+    fields = json.dumps([entity, prompt, model, temperature], ensure_ascii=False)
+    return hashlib.sha256(fields.encode("utf-8")).hexdigest()
+
+
+class LLMLookup:
+    """
+    Asks a language model about entities and caches the answers on disk, one JSON
+    file per answer keyed on the entity, the prompt, the model and the temperature.
+
+    Attributes
+    ------------
+    cache_dir: str
+        The directory holding the cached answers. None disables the cache.
+    max_concurrency: int
+        The maximum number of requests that ask_many sends at the same time.
+    hits: int
+        The number of answers that were taken from the cache.
+    misses: int
+        The number of answers that were requested from the language model.
+    """
+
+    def __init__(
+        self,
+        llm=None,
+        model: str = None,
+        temperature: float = 0.1,
+        cache_dir: str = "downloads/llm_cache",
+        max_concurrency: int = 8,
+    ):
+        """
+        Parameters
+        ------------
+        llm: object, optional
+            A chat model with invoke and ainvoke methods, e.g. a ChatOpenAI instance.
+            By default a ChatOpenAI client is created on the first request.
+        model: str, optional
+            The model of the default ChatOpenAI client, e.g. 'gpt-3.5-turbo'.
+        temperature: float, optional
+            The temperature of the default ChatOpenAI client.
+        cache_dir: str, optional
+            The directory holding the cached answers. None disables the cache.
+        max_concurrency: int, optional
+            The maximum number of requests that ask_many sends at the same time.
+        """
+        self._llm = llm
+        # The options of the default ChatOpenAI client, None if a chat model is given
+        self._options = None
+        if llm is None:
+            self._options = {"temperature": temperature}
+            if model is not None:
+                self._options["model"] = model
+        self.cache_dir = cache_dir
+        self.max_concurrency = max_concurrency
+        self.hits = 0
+        self.misses = 0
+        self._loop = None
+
+    @property
+    def llm(self):
+        """
+        The chat model, created once and reused by every request.
+        """
+        if self._llm is None:
+            # Imported here, as langchain_openai takes about a second to import
+            from langchain_openai import ChatOpenAI  # pylint: disable=import-outside-toplevel
+
+            self._llm = ChatOpenAI(**self._options)
+        return self._llm
+
+    def _key(self, entity: str, prompt: str) -> str:
+        """
+        Returns the cache key of a prompt for the model and temperature of the client.
+        The default client is keyed on its options, so that it is only created when
+        an answer is not cached.
+        """
+        if self._options is not None:
+            model = self._options.get("model", "ChatOpenAI")
+            temperature = self._options["temperature"]
+        else:
+            model = getattr(self._llm, "model_name", None) or type(self._llm).__name__
+            temperature = getattr(self._llm, "temperature", None)
+        return response_key(entity, prompt, model, temperature)
+
+    def _cache_path(self, key: str) -> str:
+        """
+        Returns the path of the cache file of a key.
+        """
+        return os.path.join(self.cache_dir, key[:2], f"{key}.json")
+
+    def _load(self, key: str):
+        """
+        Returns the cached answer of a key, or None.
+        """
+        if self.cache_dir is None or not os.path.exists(self._cache_path(key)):
+            return None
+        with open(self._cache_path(key), encoding="utf-8") as file:
+            return json.load(file)["content"]
+
+    def _store(self, key: str, entity: str, prompt: str, content: str) -> None:
+        """
+        Writes an answer to the cache, through a temporary file so that an
+        interrupted write never leaves a broken entry behind.
+        """
+        if self.cache_dir is None:
+            return
+        path = self._cache_path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path + ".tmp", "w", encoding="utf-8") as file:
+            json.dump({"entity": entity, "prompt": prompt, "content": content}, file)
+        os.replace(path + ".tmp", path)
+
+    def ask(self, entity: str, prompt: str) -> str:
+        """
+        Returns the answer of the language model to a prompt about an entity,
+        from the cache if it was asked before.
+
+        Parameters
+        ------------
+        entity: str
+            The aircraft or airport the prompt is about.
+        prompt: str
+            The prompt.
+
+        Returns
+        ---------
+        str
+            The answer.
+        """
+        key = self._key(entity, prompt)
+        content = self._load(key)
+        if content is not None:
+            self.hits += 1
+            return content
+        self.misses += 1
+        content = self.llm.invoke(prompt).content
+        self._store(key, entity, prompt, content)
+        return content
+
+    async def ask_many_async(self, requests: list) -> list:
+        """
+        Returns the answers to many prompts, sending at most max_concurrency
+        requests at the same time. Cached answers are not requested again and
+        duplicate prompts are requested once.
+
+        Parameters
+        ------------
+        requests: list
+            (entity, prompt) pairs.
+
+        Returns
+        ---------
+        list
+            The answers, in the order of the requests.
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        answers = {}
+
+        async def fetch(key: str, entity: str, prompt: str) -> None:
+            async with semaphore:
+                answers[key] = (await self.llm.ainvoke(prompt)).content
+            self._store(key, entity, prompt, answers[key])
+
+        pending = {}
+        keys = []
+        for entity, prompt in requests:
+            key = self._key(entity, prompt)
+            keys.append(key)
+            if key in answers or key in pending:
+                continue
+            content = self._load(key)
+            if content is not None:
+                self.hits += 1
+                answers[key] = content
+            else:
+                self.misses += 1
+                pending[key] = (entity, prompt)
+        await asyncio.gather(*(fetch(key, *request) for key, request in pending.items()))
+        return [answers[key] for key in keys]
+
+    def _event_loop(self) -> asyncio.AbstractEventLoop:
+        """
+        Returns the event loop of the client, started in a background thread on first
+        use. All asynchronous requests run on this one loop, since the async client
+        of the chat model is bound to the loop it was first used on.
+        """
+        if self._loop is None:
+            self._loop = asyncio.new_event_loop()
+            threading.Thread(target=self._loop.run_forever, daemon=True).start()
+        return self._loop
+
+    def close(self) -> None:
+        """
+        Stops the event loop of the client. A later ask_many starts a new one.
+        """
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._loop = None
+
+    def ask_many(self, requests: list) -> list:
+        """
+        Runs ask_many_async to completion on the event loop of the client, which
+        also works inside a running event loop, such as a Jupyter notebook.
+
+        Parameters
+        ------------
+        requests: list
+            (entity, prompt) pairs.
+
+        Returns
+        ---------
+        list
+            The answers, in the order of the requests.
+        """
+        return asyncio.run_coroutine_threadsafe(
+            self.ask_many_async(requests), self._event_loop()
+        ).result()
@@ -0,0 +1,237 @@
+"""
+This module contains functions that add many routes or airports to a folium map
+as a few batched layers instead of one folium object per route or airport, or as
+a layer that loads route tiles as the map is moved.
+"""
+
+# Import the necessary libraries
+import folium
+from folium.plugins import FastMarkerCluster
+from folium.template import Template
+
+# Draws each clustered airport as the red circle of the per-airport map
+AIRPORT_MARKER_CALLBACK = """
+function (row) {
+    var marker = L.circleMarker(new L.LatLng(row[0], row[1]), {
+        radius: 4, color: "black", weight: 1, opacity: 1,
+        fillColor: "red", fillOpacity: 0.6
+    });
+    marker.bindTooltip(row[2]);
+    return marker;
+};
+"""
+# Loads the tiles of write_route_tiles that are in view at the zoom level of the map,
+# or the nearest level that was written. The tiles are reloaded when the level changes,
+# and an edge that is in several loaded tiles is drawn once.
+TILED_ROUTES_TEMPLATE = """
+{% macro script(this, kwargs) %}
+(function () {
+    var map = {{ this._parent.get_name() }};
+    var url = {{ this.tile_url|tojson }};
+    var layer = L.layerGroup().addTo(map);
+    var index = null, level = null, loaded = {}, drawn = {};
+    function update() {
+        if (index === null) { return; }
+        var zoom = Math.max(index.min_zoom, Math.min(index.max_zoom, map.getZoom()));
+        if (zoom !== level) {
+            layer.clearLayers();
+            level = zoom;
+            loaded = {};
+            drawn = {};
+        }
+        var available = new Set(index.tiles[zoom]);
+        var size = 256 * Math.pow(2, map.getZoom() - zoom), last = Math.pow(2, zoom) - 1;
+        var bounds = map.getPixelBounds();
+        var x0 = Math.max(0, Math.floor(bounds.min.x / size));
+        var x1 = Math.min(last, Math.floor(bounds.max.x / size));
+        var y0 = Math.max(0, Math.floor(bounds.min.y / size));
+        var y1 = Math.min(last, Math.floor(bounds.max.y / size));
+        for (var x = x0; x <= x1; x++) {
+            for (var y = y0; y <= y1; y++) {
+                var tile = x + "/" + y;
+                if (!available.has(tile) || loaded[tile]) { continue; }
+                loaded[tile] = true;
+                load(zoom, tile);
+            }
+        }
+    }
+    function load(zoom, tile) {
+        fetch(url + "/" + zoom + "/" + tile + ".geojson")
+            .then(function (response) { return response.json(); })
+            .then(function (data) {
+                if (zoom !== level) { return; }
+                L.geoJSON(data, {
+                    filter: function (feature) {
+                        var fresh = !drawn[feature.properties.id];
+                        drawn[feature.properties.id] = true;
+                        return fresh;
+                    },
+                    style: function (feature) {
+                        return {
+                            color: {{ this.color|tojson }},
+                            weight: feature.properties.weight,
+                            opacity: 0.6
+                        };
+                    }
+                }).addTo(layer);
+            });
+    }
+    fetch(url + "/index.json")
+        .then(function (response) { return response.json(); })
+        .then(function (data) { index = data; update(); });
+    map.on("moveend", update);
+})();
+{% endmacro %}
+"""
+
+
+def route_feature_collection(
+    source_lats, source_longs, destination_lats, destination_longs, colors
+) -> dict:
+    """
+    Builds a GeoJSON FeatureCollection with one MultiLineString per line color.
+
+    Parameters
+    ------------
+    source_lats: array-like
+        Latitudes of the source airports in degrees.
+    source_longs: array-like
+        Longitudes of the source airports in degrees.
+    destination_lats: array-like
+        Latitudes of the destination airports in degrees.
+    destination_longs: array-like
+        Longitudes of the destination airports in degrees.
+    colors: array-like
+        The line color of each route.
+
+    Returns
+    ---------
+    dict
+        The FeatureCollection. GeoJSON coordinates are (longitude, latitude) pairs.
+    """
+    lines_by_color = {}
+    for source_lat, source_long, destination_lat, destination_long, color in zip(
+        source_lats, source_longs, destination_lats, destination_longs, colors
+    ):
+        lines_by_color.setdefault(color, []).append(
+            [
+                [round(float(source_long), 5), round(float(source_lat), 5)],
+                [round(float(destination_long), 5), round(float(destination_lat), 5)],
+            ]
+        )
+    return {
+        "type": "FeatureCollection",
+        "features": [
+            {
+                "type": "Feature",
+                "properties": {"color": color, "routes": len(lines)},
+                "geometry": {"type": "MultiLineString", "coordinates": lines},
+            }
+            for color, lines in lines_by_color.items()
+        ],
+    }
+
+
+def add_route_layer(flight_map: folium.Map, feature_collection: dict) -> folium.GeoJson:
+    """
+    Adds the routes of a FeatureCollection to a map as a single GeoJSON layer,
+    colored by the color property of each feature.
+
+    Parameters
+    ------------
+    flight_map: folium.Map
+        The map to add the routes to.
+    feature_collection: dict
+        A FeatureCollection as returned by route_feature_collection.
+
+    Returns
+    ---------
+    folium.GeoJson
+        The added layer.
+    """
+    layer = folium.GeoJson(
+        feature_collection,
+        name="Routes",
+        style_function=lambda feature: {
+            "color": feature["properties"]["color"],
+            "weight": 2,
+            "opacity": 0.6,
+        },
+    )
+    layer.add_to(flight_map)
+    return layer
+
+
+def add_airport_cluster(flight_map: folium.Map, lats, longs, names) -> FastMarkerCluster:
+    """
+    Adds airports to a map as a clustered marker layer. The markers are created in
+    the browser from a compact array, so the HTML only contains the coordinates
+    and names instead of one object per airport.
+
+    Parameters
+    ------------
+    flight_map: folium.Map
+        The map to add the airports to.
+    lats: array-like
+        Latitudes of the airports in degrees.
+    longs: array-like
+        Longitudes of the airports in degrees.
+    names: array-like
+        Names of the airports, shown as tooltips.
+
+    Returns
+    ---------
+    folium.plugins.FastMarkerCluster
+        The added layer.
+    """
+    data = [
+        [round(float(lat), 5), round(float(long), 5), str(name)]
+        for lat, long, name in zip(lats, longs, names)
+    ]
+    layer = FastMarkerCluster(data, name="Airports", callback=AIRPORT_MARKER_CALLBACK)
+    layer.add_to(flight_map)
+    return layer
+
+
+class TiledRouteLayer(folium.MacroElement):
+    """
+    A layer that loads the route tiles of write_route_tiles in view as the map is
+    moved and zoomed, see add_tiled_route_layer.
+    """
+
+    _template = Template(TILED_ROUTES_TEMPLATE)
+
+    def __init__(self, tile_url: str, color: str = "blue"):
+        super().__init__()
+        self._name = "TiledRoutes"
+        self.tile_url = tile_url.rstrip("/")
+        self.color = color
+
+
+def add_tiled_route_layer(
+    flight_map: folium.Map, tile_url: str, color: str = "blue"
+) -> TiledRouteLayer:
+    """
+    Adds a layer that loads the route tiles in view, at the zoom level of the map,
+    instead of embedding the routes in the map. The browser fetches the tiles, so
+    the map must be opened from a web server that also serves them, e.g. started
+    with "python -m http.server" in a directory containing both.
+
+    Parameters
+    ------------
+    flight_map: folium.Map
+        The map to add the routes to.
+    tile_url: str
+        The URL of the directory the tiles were written to, relative to the map
+        or absolute.
+    color: str, optional
+        The line color of the routes.
+
+    Returns
+    ---------
+    TiledRouteLayer
+        The added layer.
+    """
+    layer = TiledRouteLayer(tile_url, color)
+    layer.add_to(flight_map)
+    return layer
@@ -0,0 +1,304 @@
+"""
+This module contains functions that rank the airports of the route network, or of the
+network of a single airline, by their importance as hubs: degree, betweenness,
+PageRank and the routes and airports that are cut off when a hub closes.
+
+Every metric is computed for all airports at once with sparse matrix products over
+the adjacency matrix of the routes, instead of a groupby or a search per airport.
+"""
+
+# Import the necessary libraries
+import numpy as np
+import pandas as pd
+from scipy.sparse import csr_matrix
+
+BATCH_SIZE = 64  # Number of source airports whose shortest paths are counted at once
+DAMPING = 0.85  # Probability that a passenger of PageRank takes another flight
+
+
+def route_adjacency(routes_df: pd.DataFrame, airline_id: int = None) -> tuple:
+    """
+    Builds the adjacency matrix of the routes, of all airlines or of one airline.
+    Routes without an airport ID ("\\N") and routes from an airport to itself are
+    left out.
+
+    Parameters
+    ------------
+    routes_df: pandas.DataFrame
+        The routes, with the Airline ID, Source airport ID and Destination airport ID
+        columns.
+    airline_id: int, optional
+        The Airline ID of the routes to include. By default all routes.
+
+    Returns
+    ---------
+    tuple
+        The sorted airport IDs of the nodes and a scipy.sparse.csr_matrix whose entry
+        [i, j] is the number of routes from the airport at position i to the airport
+        at position j.
+    """
+    sources = pd.to_numeric(routes_df["Source airport ID"], errors="coerce").to_numpy()
+    destinations = pd.to_numeric(
+        routes_df["Destination airport ID"], errors="coerce"
+    ).to_numpy()
+    keep = ~(np.isnan(sources) | np.isnan(destinations)) & (sources != destinations)
+    if airline_id is not None:
+        airline_ids = pd.to_numeric(routes_df["Airline ID"], errors="coerce").to_numpy()
+        keep &= airline_ids == airline_id
+    sources = sources[keep].astype(np.int64)
+    destinations = destinations[keep].astype(np.int64)
+
+    airport_ids = np.union1d(sources, destinations)
+    # Duplicate entries are added up, so each entry counts the routes
+    adjacency = csr_matrix(
+        (
+            np.ones(len(sources)),
+            (np.searchsorted(airport_ids, sources), np.searchsorted(airport_ids, destinations)),
+        ),
+        shape=(len(airport_ids), len(airport_ids)),
+    )
+    adjacency.sum_duplicates()
+    return airport_ids, adjacency
+
+
+def pagerank(
+    adjacency: csr_matrix, damping: float = DAMPING, tol: float = 1e-10, max_iter: int = 200
+) -> np.ndarray:
+    """
+    Calculates the PageRank of every airport by power iteration: the share of time a
+    passenger spends at each airport who takes a random route out of the current
+    airport, weighted by the number of routes, and with probability 1 - damping (or
+    when there are no routes out) continues from a random airport instead.
+
+    Parameters
+    ------------
+    adjacency: scipy.sparse.csr_matrix
+        The number of routes between each pair of airports.
+    damping: float, optional
+        The probability of taking another route.
+    tol: float, optional
+        The iteration stops when the ranks change by less than tol in total.
+    max_iter: int, optional
+        The maximum number of iterations.
+
+    Returns
+    ---------
+    numpy.ndarray
+        The PageRank of each airport, adding up to 1.
+    """
+    n_airports = adjacency.shape[0]
+    if n_airports == 0:
+        return np.zeros(0)
+    out_weights = np.asarray(adjacency.sum(axis=1)).ravel()
+    dangling = out_weights == 0
+    # Row-normalize, transposed so that one product spreads the ranks along the routes
+    scale = np.divide(1.0, out_weights, out=np.zeros(n_airports), where=~dangling)
+    transition = csr_matrix(adjacency.multiply(scale[:, None])).T.tocsr()
+    ranks = np.full(n_airports, 1.0 / n_airports)
+    for _ in range(max_iter):
+        previous = ranks
+        ranks = damping * (transition @ ranks)
+        ranks += (1.0 - ranks.sum()) / n_airports
+        if np.abs(ranks - previous).sum() < tol:
+            break
+    return ranks
+
+
+def betweenness(  # pylint: disable=too-many-locals
+    adjacency: csr_matrix, samples: int = None, seed: int = 0, batch_size: int = BATCH_SIZE
+) -> np.ndarray:
+    """
+    Calculates the betweenness centrality of every airport: the share of the
+    connections with the fewest flights between two other airports that change
+    planes at it, normalized by (n - 1)(n - 2) for n airports.
+
+    Brandes' algorithm is run for a batch of source airports at once. The shortest
+    paths are counted by a breadth-first search in which each level is a product of
+    the frontier with the adjacency matrix, and the dependencies are accumulated
+    back through the levels with the transposed product.
+
+    Parameters
+    ------------
+    adjacency: scipy.sparse.csr_matrix
+        The routes between each pair of airports. Only whether there is a route counts.
+    samples: int, optional
+        The number of randomly chosen source airports that estimate the betweenness.
+        By default all airports, which gives the exact betweenness.
+    seed: int, optional
+        The seed of the random choice of source airports.
+    batch_size: int, optional
+        The number of source airports that are searched at once.
+
+    Returns
+    ---------
+    numpy.ndarray
+        The betweenness of each airport.
+    """
+    n_airports = adjacency.shape[0]
+    if n_airports < 3:
+        return np.zeros(n_airports)
+    forward = csr_matrix(adjacency, dtype=np.float64, copy=True)
+    forward.data[:] = 1.0
+    # The searches run along the routes and the dependencies back against them
+    backward = forward.T.tocsr()
+    sources = np.arange(n_airports)
+    if samples is not None and samples < n_airports:
+        sources = np.sort(np.random.default_rng(seed).choice(n_airports, samples, replace=False))
+
+    centrality = np.zeros(n_airports)
+    for start in range(0, len(sources), batch_size):
+        batch = sources[start : start + batch_size]
+        columns = np.arange(len(batch))
+        # One column per source airport, so that the products are with contiguous arrays
+        paths = np.zeros((n_airports, len(batch)))
+        paths[batch, columns] = 1.0
+        visited = paths != 0
+        frontier = paths
+        levels = [visited.copy()]
+        while True:
+            # The number of shortest paths to the airports of the next level
+            reached = backward @ frontier
+            reached[visited] = 0.0
+            level = reached != 0
+            if not level.any():
+                break
+            visited |= level
+            paths += reached
+            levels.append(level)
+            frontier = reached
+
+        inverse_paths = np.divide(1.0, paths, out=np.zeros_like(paths), where=visited)
+        dependency = np.zeros_like(paths)
+        for depth in range(len(levels) - 1, 0, -1):
+            share = (1.0 + dependency) * inverse_paths
+            share *= levels[depth]
+            gained = forward @ share
+            gained *= paths
+            gained *= levels[depth - 1]
+            dependency += gained
+        dependency[batch, columns] = 0.0
+        centrality += dependency.sum(axis=1)
+
+    centrality *= n_airports / len(sources)
+    return centrality / ((n_airports - 1) * (n_airports - 2))
+
+
+def stranded_airports(adjacency: csr_matrix) -> np.ndarray:
+    """
+    Counts for each airport the airports whose only connection, in either direction,
+    is with it, and that are cut off from the network when it closes.
+
+    Parameters
+    ------------
+    adjacency: scipy.sparse.csr_matrix
+        The routes between each pair of airports.
+
+    Returns
+    ---------
+    numpy.ndarray
+        The number of airports that only have routes to or from each airport.
+    """
+    connected = csr_matrix(adjacency + adjacency.T)
+    neighbours = np.diff(connected.indptr)
+    # The single neighbour of each airport with one neighbour
+    leaves = np.flatnonzero(neighbours == 1)
+    return np.bincount(connected.indices[connected.indptr[leaves]], minlength=adjacency.shape[0])
+
+
+def hub_table(
+    routes_df: pd.DataFrame, airline_id: int = None, samples: int = None
+) -> pd.DataFrame:
+    """
+    Calculates the hub metrics of every airport of the route network, or of the network
+    of one airline.
+
+    Parameters
+    ------------
+    routes_df: pandas.DataFrame
+        The routes, with the Airline ID, Source airport ID and Destination airport ID
+        columns.
+    airline_id: int, optional
+        The Airline ID whose network is analysed. By default all routes.
+    samples: int, optional
+        The number of source airports that estimate the betweenness,
+        by default all of them (see betweenness).
+
+    Returns
+    ---------
+    pandas.DataFrame
+        One row per airport with routes, indexed by Airport ID, with the columns:
+        Destinations and Origins, the number of airports with routes from and to it;
+        Routes lost, the number of routes from or to it; Stranded airports, the
+        airports that only have routes with it; PageRank and Betweenness.
+        Sorted by PageRank, highest first.
+    """
+    airport_ids, adjacency = route_adjacency(routes_df, airline_id)
+    routes = adjacency.sum(axis=1).A1 + adjacency.sum(axis=0).A1
+    table = pd.DataFrame(
+        {
+            "Destinations": np.diff(adjacency.indptr),
+            "Origins": np.bincount(adjacency.indices, minlength=len(airport_ids)),
+            "Routes lost": routes.astype(np.int64),
+            "Stranded airports": stranded_airports(adjacency),
+            "PageRank": pagerank(adjacency),
+            "Betweenness": betweenness(adjacency, samples=samples),
+        },
+        index=pd.Index(airport_ids, name="Airport ID"),
+    )
+    return table.sort_values("PageRank", ascending=False, kind="stable")
+
+
+def airline_table(routes_df: pd.DataFrame, pageranks: pd.Series) -> pd.DataFrame:
+    """
+    Ranks the airlines by the importance of the airports they serve, with the hub
+    of each airline: the airport with the most of its routes.
+
+    Parameters
+    ------------
+    routes_df: pandas.DataFrame
+        The routes, with the Airline ID, Source airport ID and Destination airport ID
+        columns.
+    pageranks: pandas.Series
+        The PageRank of each airport in the whole network, indexed by Airport ID.
+
+    Returns
+    ---------
+    pandas.DataFrame
+        One row per airline, indexed by Airline ID, with the columns: Routes;
+        Airports, the number of airports served; Hub, the Airport ID of the airport
+        with the most routes of the airline; Hub share, the share of the routes of
+        the airline from or to its hub; PageRank, the summed PageRank of the airports
+        served. Sorted by PageRank, highest first.
+    """
+    airline_ids = pd.to_numeric(routes_df["Airline ID"], errors="coerce")
+    ends = pd.DataFrame(
+        {
+            "Airline ID": np.tile(airline_ids.to_numpy(), 2),
+            "Airport ID": np.concatenate(
+                [
+                    pd.to_numeric(routes_df["Source airport ID"], errors="coerce").to_numpy(),
+                    pd.to_numeric(routes_df["Destination airport ID"], errors="coerce").to_numpy(),
+                ]
+            ),
+        }
+    ).dropna()
+    ends = ends.astype(np.int64)
+    # The routes of each airline from or to each airport
+    served = ends.groupby(["Airline ID", "Airport ID"]).size().rename("Routes").reset_index()
+    served["PageRank"] = pageranks.reindex(served["Airport ID"]).fillna(0.0).to_numpy()
+    hubs = served.sort_values(["Airline ID", "Routes"], ascending=[True, False], kind="stable")
+    hubs = hubs.drop_duplicates("Airline ID").set_index("Airline ID")
+
+    table = pd.DataFrame(
+        {
+            "Routes": airline_ids.dropna().astype(np.int64).value_counts(),
+            "Airports": served.groupby("Airline ID").size(),
+            "Hub": hubs["Airport ID"],
+            "Hub share": hubs["Routes"],
+            "PageRank": served.groupby("Airline ID")["PageRank"].sum(),
+        }
+    ).dropna()
+    table.index.name = "Airline ID"
+    table = table.astype({"Routes": np.int64, "Airports": np.int64, "Hub": np.int64})
+    table["Hub share"] = table["Hub share"] / table["Routes"]
+    return table.sort_values("PageRank", ascending=False, kind="stable")
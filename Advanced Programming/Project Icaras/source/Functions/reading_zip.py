@@ -4,6 +4,8 @@ This module contains a function that unzips a zip-file of your choice
 
 # Import the necessary libraries
 import zipfile
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
 import pandas as pd
 
 TARGET_URL = (
@@ -11,7 +13,37 @@ TARGET_URL = (
 )
 TARGET_FILE = "flight_data.zip"
 
-def unzip(target_file: str) -> dict:
+# The pools that unzip can parse the csv files with concurrently
+EXECUTORS = {"thread": ThreadPoolExecutor, "process": ProcessPoolExecutor}
+
+
+def read_member(target_file: str, member: str, read_options: dict = None) -> pd.DataFrame:
+    """
+    Loads a single csv file inside a zip file into a DataFrame. The zip file is opened
+    by the function itself, so concurrent calls each use their own file handle.
+
+    Parameters
+    ------------
+    target_file: str
+        A string containing the name of the zip file.
+    member: str
+        The name of the csv file inside the zip file.
+    read_options: dict, optional
+        Keyword arguments for pandas.read_csv.
+
+    Returns
+    ---------
+    pandas.DataFrame
+        The content of the csv file.
+    """
+    with zipfile.ZipFile(target_file) as zip_contents:
+        with zip_contents.open(member) as csv_file:
+            return pd.read_csv(csv_file, **(read_options or {}))
+
+
+def unzip(
+    target_file: str, members: list = None, schemas: dict = None, parallel: str = None
+) -> dict:
     """
     Unzips a file from an URL into your hard drive.
 
@@ -19,26 +51,80 @@ def unzip(target_file: str) -> dict:
     ------------
     target_file: str
         A string containing the name of the file you wish to unzip.
+    members: list, optional
+        The names of the csv files to load. By default all csv files are loaded.
+    schemas: dict, optional
+        Keyword arguments for pandas.read_csv per dictionary key, e.g.
+        {"routes_df": {"usecols": [...], "dtype": {"Equipment": "category"}}},
+        so that only the needed columns are parsed and with compact types.
+    parallel: str, optional
+        'thread' or 'process' to parse the csv files concurrently in a thread or
+        process pool with one worker per csv file. By default they are parsed one
+        after another.
 
     Returns
     ---------
     All csv files in the zip file in the form of a dictionary.
+
+    Raises
+    ------------
+    ValueError
+        If parallel is not one of None, 'thread' and 'process'.
     """
+    if parallel is not None and parallel not in EXECUTORS:
+        raise ValueError(
+            f"parallel must be one of {list(EXECUTORS)} or None, not '{parallel}'."
+        )
 
     # Use 'with' to ensure the zip file is properly closed after its suite finishes
     with zipfile.ZipFile(target_file) as zip_contents:
         filelist = zip_contents.namelist()
 
-        # Create a dictionary to store the dataframes
-        dataframes_dict = {}
+    # Generate the dictionary key names by replacing ".csv" with "_df" in the filenames
+    selected = {
+        file.replace(".csv", "_df"): file
+        for file in filelist
+        if file.endswith(".csv") and (members is None or file in members)
+    }
+    read_options = {key_name: (schemas or {}).get(key_name, {}) for key_name in selected}
+
+    # Load the CSV files into DataFrames and store them in the dictionary
+    if parallel is None or len(selected) < 2:
+        return {
+            key_name: read_member(target_file, file, read_options[key_name])
+            for key_name, file in selected.items()
+        }
+
+    with EXECUTORS[parallel](max_workers=len(selected)) as executor:
+        futures = {
+            key_name: executor.submit(read_member, target_file, file, read_options[key_name])
+            for key_name, file in selected.items()
+        }
+        return {key_name: future.result() for key_name, future in futures.items()}
+
+
+def iter_csv_chunks(target_file: str, member: str, chunksize: int = 100_000, **read_options):
+    """
+    Streams a csv file inside a zip file as DataFrames of at most chunksize rows,
+    so files larger than memory can be processed piece by piece.
 
-        # Loop through the file list
-        for file in filelist:
-            if file.endswith(".csv"):
-                # Generate the dictionary key name by replacing ".csv" with "_df" in the filename
-                key_name = file.replace(".csv", "_df")
-                # Load the CSV file into a DataFrame and store it in the dictionary
-                with zip_contents.open(file) as csv_file:
-                    dataframes_dict[key_name] = pd.read_csv(csv_file)
+    Parameters
+    ------------
+    target_file: str
+        A string containing the name of the zip file.
+    member: str
+        The name of the csv file inside the zip file, e.g. 'routes.csv'.
+    chunksize: int, optional
+        The maximum number of rows per chunk.
+    read_options: dict
+        Further keyword arguments for pandas.read_csv, e.g. usecols and dtype.
 
-    return dataframes_dict
+    Yields
+    ---------
+    pandas.DataFrame
+        The consecutive chunks of the csv file.
+    """
+    with zipfile.ZipFile(target_file) as zip_contents:
+        with zip_contents.open(member) as csv_file:
+            with pd.read_csv(csv_file, chunksize=chunksize, **read_options) as reader:
+                yield from reader
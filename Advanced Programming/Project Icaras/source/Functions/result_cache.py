@@ -0,0 +1,163 @@
+"""
+This module contains an in-memory cache for the results of methods that are called
+over and over with the same arguments, with least recently used eviction.
+"""
+
+# Import the necessary libraries
+import functools
+import inspect
+from collections import OrderedDict, namedtuple
+
+import pandas as pd
+
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "maxsize", "currsize"])
+
+
+class ResultCache:
+    """
+    A mapping from keys to results that holds at most maxsize results. When it is
+    full, the result that was used least recently is evicted.
+
+    Attributes
+    ------------
+    maxsize: int
+        The maximum number of results. 0 disables the cache.
+    hits: int
+        The number of lookups that found a result.
+    misses: int
+        The number of lookups that had to compute the result.
+    """
+
+    def __init__(self, maxsize: int = 128):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._results = OrderedDict()
+
+    def get_or_compute(self, key, compute):
+        """
+        Returns the result stored under key, or computes it with compute() and stores it.
+
+        Parameters
+        ------------
+        key: hashable
+            The key of the result.
+        compute: callable
+            A function without arguments that computes the result.
+
+        Returns
+        ---------
+        object
+            The stored or computed result.
+        """
+        if key in self._results:
+            self.hits += 1
+            self._results.move_to_end(key)
+            return self._results[key]
+
+        self.misses += 1
+        result = compute()
+        if self.maxsize > 0:
+            self._results[key] = result
+            if len(self._results) > self.maxsize:
+                self._results.popitem(last=False)
+        return result
+
+    def clear(self) -> None:
+        """
+        Removes all results. The hit and miss statistics are kept.
+        """
+        self._results.clear()
+
+    def info(self) -> CacheInfo:
+        """
+        Returns the hit and miss statistics and the size of the cache.
+        """
+        return CacheInfo(self.hits, self.misses, self.maxsize, len(self._results))
+
+    def __contains__(self, key) -> bool:
+        return key in self._results
+
+    def __len__(self) -> int:
+        return len(self._results)
+
+
+def normalize(value):
+    """
+    Turns an argument into a hashable value, so that lists and tuples, or dictionaries
+    with the same items, give the same key.
+
+    Parameters
+    ------------
+    value: object
+        The argument.
+
+    Returns
+    ---------
+    object
+        A hashable version of the argument.
+
+    Raises
+    ------------
+    TypeError
+        If the argument cannot be made hashable.
+    """
+    if isinstance(value, (list, tuple)):
+        return tuple(normalize(item) for item in value)
+    if isinstance(value, dict):
+        return tuple(sorted((key, normalize(item)) for key, item in value.items()))
+    if isinstance(value, (set, frozenset)):
+        return frozenset(normalize(item) for item in value)
+    hash(value)
+    return value
+
+
+def _copy(result):
+    """
+    Returns a copy of a DataFrame or Series, so that callers cannot change the
+    stored result, and any other result as it is.
+    """
+    if isinstance(result, (pd.DataFrame, pd.Series)):
+        return result.copy()
+    return result
+
+
+def cached_method(method):
+    """
+    Decorates a method so that its results are stored in the ResultCache of the
+    instance, its result_cache attribute. The key is the name of the method and
+    its arguments with the defaults applied, so f("LHR") and f("LHR", internal=False)
+    share a result. Calls with arguments that cannot be hashed are not cached.
+
+    DataFrames and Series are returned as copies, so changing a returned table does
+    not change later results. Other results are returned as they are stored, so
+    cache the data behind mutable objects, such as folium maps, and build a new
+    object from it per call.
+
+    Parameters
+    ------------
+    method: callable
+        The method to decorate.
+
+    Returns
+    ---------
+    callable
+        The decorated method.
+    """
+    signature = inspect.signature(method)
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        bound = signature.bind(self, *args, **kwargs)
+        bound.apply_defaults()
+        try:
+            key = (method.__name__,) + tuple(
+                normalize(value) for name, value in list(bound.arguments.items())[1:]
+            )
+        except TypeError:
+            return method(self, *args, **kwargs)
+        return _copy(
+            self.result_cache.get_or_compute(key, lambda: method(self, *args, **kwargs))
+        )
+
+    return wrapper
@@ -0,0 +1,334 @@
+"""
+This module contains a directed graph of the airports connected by routes, stored
+as compressed sparse row (CSR) arrays, that answers shortest-distance, fewest-hop
+and reachability queries.
+"""
+
+# Import the necessary libraries
+import numpy as np
+import pandas as pd
+from scipy.sparse import csr_matrix
+from scipy.sparse.csgraph import dijkstra
+
+from Functions.result_cache import ResultCache
+
+BATCH_SIZE = 256  # Number of source airports whose shortest paths are computed at once
+
+
+class RouteGraph:
+    """
+    The airports as nodes and the routes as directed edges weighted by distance_km.
+    Several routes between the same two airports (e.g. of different airlines) are
+    a single edge. The adjacency is stored in CSR form: the destinations of the node
+    at position i are indices[indptr[i]:indptr[i + 1]] with the distances
+    weights[indptr[i]:indptr[i + 1]].
+
+    The shortest paths from an airport are computed once for all destinations and
+    kept for the most recently used source airports, so repeated and batched
+    origin/destination queries are array lookups. For many queries between arbitrary
+    airports, precompute stores the distances between all airports.
+
+    Attributes
+    ------------
+    airport_ids: numpy.ndarray
+        The airport IDs of the nodes, sorted.
+    indptr: numpy.ndarray
+        The start of the edges of each node in indices and weights.
+    indices: numpy.ndarray
+        The positions of the destination airports of the edges.
+    weights: numpy.ndarray
+        The distances of the edges in km.
+    """
+
+    def __init__(self, routes_df: pd.DataFrame, cache_size: int = 256):
+        """
+        Builds the graph from the routes.
+
+        Parameters
+        ------------
+        routes_df: pandas.DataFrame
+            The routes, with the Source airport ID, Destination airport ID
+            and distance_km columns. Routes without an airport ID ("\\N") or
+            without a distance are left out.
+        cache_size: int, optional
+            The number of source airports whose shortest paths are kept.
+        """
+        edges = pd.DataFrame(
+            {
+                "Source": pd.to_numeric(routes_df["Source airport ID"], errors="coerce"),
+                "Destination": pd.to_numeric(
+                    routes_df["Destination airport ID"], errors="coerce"
+                ),
+                "Distance": routes_df["distance_km"].to_numpy(dtype=np.float64),
+            }
+        ).dropna()
+        # One edge per pair of airports, the shortest if their distances differ
+        edges = edges.groupby(["Source", "Destination"], as_index=False)["Distance"].min()
+
+        self.airport_ids = np.union1d(edges["Source"], edges["Destination"]).astype(np.int64)
+        sources = np.searchsorted(self.airport_ids, edges["Source"])
+        destinations = np.searchsorted(self.airport_ids, edges["Destination"])
+        # Explicitly stored zeros are edges for scipy.sparse.csgraph
+        self._matrix = csr_matrix(
+            (edges["Distance"].to_numpy(), (sources, destinations)),
+            shape=(len(self.airport_ids), len(self.airport_ids)),
+        )
+        self._matrix.sort_indices()
+        self._paths = ResultCache(cache_size)
+        self._all_pairs = {}
+
+    @property
+    def indptr(self) -> np.ndarray:
+        """
+        The start of the edges of each node in indices and weights.
+        """
+        return self._matrix.indptr
+
+    @property
+    def indices(self) -> np.ndarray:
+        """
+        The positions of the destination airports of the edges.
+        """
+        return self._matrix.indices
+
+    @property
+    def weights(self) -> np.ndarray:
+        """
+        The distances of the edges in km.
+        """
+        return self._matrix.data
+
+    def __len__(self) -> int:
+        return len(self.airport_ids)
+
+    def _positions(self, airport_ids) -> np.ndarray:
+        """
+        Returns the node positions of airport IDs.
+
+        Raises
+        ------------
+        ValueError
+            If an airport has no routes in the graph.
+        """
+        airport_ids = np.atleast_1d(np.asarray(airport_ids, dtype=np.int64))
+        positions = np.searchsorted(self.airport_ids, airport_ids)
+        positions = np.minimum(positions, len(self.airport_ids) - 1)
+        missing = self.airport_ids[positions] != airport_ids
+        if missing.any():
+            raise ValueError(
+                f"The following airport IDs have no routes: {airport_ids[missing].tolist()}"
+            )
+        return positions
+
+    def _shortest_paths(self, positions, unweighted: bool) -> dict:
+        """
+        Returns the distances and predecessors from each node at positions to all
+        nodes. Only the nodes that are not cached are computed, in batches.
+        """
+        positions = np.unique(positions).tolist()
+        # Take the cached rows before storing new ones, which may evict them
+        found = {
+            position: self._paths.get_or_compute((unweighted, position), None)
+            for position in positions
+            if (unweighted, position) in self._paths
+        }
+        missing = [position for position in positions if position not in found]
+        for start in range(0, len(missing), BATCH_SIZE):
+            batch = missing[start : start + BATCH_SIZE]
+            distances, predecessors = dijkstra(
+                self._matrix,
+                directed=True,
+                indices=batch,
+                unweighted=unweighted,
+                return_predecessors=True,
+            )
+            for row, position in enumerate(batch):
+                computed = (distances[row], predecessors[row])
+                found[position] = self._paths.get_or_compute(
+                    (unweighted, position), lambda computed=computed: computed
+                )
+        return found
+
+    def _path(self, predecessors: np.ndarray, source: int, destination: int) -> list:
+        """
+        Follows the predecessors back from the destination to the source.
+        """
+        if source != destination and predecessors[destination] < 0:
+            return []
+        path = [destination]
+        while path[-1] != source:
+            path.append(predecessors[path[-1]])
+        return self.airport_ids[path[::-1]].tolist()
+
+    def shortest_route(self, source_id: int, destination_id: int) -> tuple:
+        """
+        Finds the itinerary with the shortest total distance between two airports.
+
+        Parameters
+        ------------
+        source_id: int
+            The airport ID of the origin.
+        destination_id: int
+            The airport ID of the destination.
+
+        Returns
+        ---------
+        tuple
+            The total distance in km (inf if the destination cannot be reached) and
+            the airport IDs of the itinerary, from origin to destination
+            (empty if the destination cannot be reached).
+        """
+        source, destination = self._positions([source_id, destination_id])
+        distances, predecessors = self._shortest_paths([source], unweighted=False)[source]
+        return float(distances[destination]), self._path(predecessors, source, destination)
+
+    def fewest_hops(self, source_id: int, destination_id: int) -> tuple:
+        """
+        Finds the itinerary with the fewest flights between two airports.
+
+        Parameters
+        ------------
+        source_id: int
+            The airport ID of the origin.
+        destination_id: int
+            The airport ID of the destination.
+
+        Returns
+        ---------
+        tuple
+            The number of flights (inf if the destination cannot be reached) and
+            the airport IDs of the itinerary, from origin to destination
+            (empty if the destination cannot be reached).
+        """
+        source, destination = self._positions([source_id, destination_id])
+        hops, predecessors = self._shortest_paths([source], unweighted=True)[source]
+        return float(hops[destination]), self._path(predecessors, source, destination)
+
+    def reachable(self, source_ids, max_hops: int) -> pd.Series:
+        """
+        Finds the airports that can be reached with at most max_hops flights from an
+        airport, or from any of several airports. The search stops after max_hops
+        flights instead of visiting the whole graph.
+
+        Parameters
+        ------------
+        source_ids: int or array-like
+            The airport ID of the origin, or the airport IDs of several origins.
+        max_hops: int
+            The maximum number of flights.
+
+        Returns
+        ---------
+        pandas.Series
+            The fewest number of flights from the nearest origin to each reachable
+            airport, indexed by airport ID. The origins are included with 0 flights.
+        """
+        hops = dijkstra(
+            self._matrix,
+            directed=True,
+            indices=self._positions(source_ids),
+            unweighted=True,
+            limit=max_hops,
+            min_only=True,
+        )
+        reached = np.flatnonzero(np.isfinite(hops))
+        return pd.Series(
+            hops[reached].astype(np.int64),
+            index=pd.Index(self.airport_ids[reached], name="Airport ID"),
+            name="Hops",
+        )
+
+    def distances(  # pylint: disable=too-many-locals
+        self, source_ids, destination_ids, unweighted: bool = False
+    ) -> np.ndarray:
+        """
+        Answers many origin/destination queries at once. The shortest paths of the
+        origins that are not cached are computed in batches, after which every query
+        is an array lookup.
+
+        Parameters
+        ------------
+        source_ids: array-like
+            The airport IDs of the origins.
+        destination_ids: array-like
+            The airport IDs of the destinations, one for each origin.
+        unweighted: bool, optional
+            Whether to count the flights instead of adding up the distances.
+
+        Returns
+        ---------
+        numpy.ndarray
+            The shortest distance in km, or the fewest number of flights, of each
+            query. inf where the destination cannot be reached.
+
+        Raises
+        ------------
+        ValueError
+            If the numbers of origins and destinations differ or an airport has no routes.
+        """
+        sources = self._positions(source_ids)
+        destinations = self._positions(destination_ids)
+        if len(sources) != len(destinations):
+            raise ValueError("source_ids and destination_ids must have the same length.")
+        if unweighted in self._all_pairs:
+            return self._all_pairs[unweighted][sources, destinations].astype(np.float64)
+        result = np.empty(len(sources))
+        # Group the queries by origin, so that each row of distances is used once
+        order = np.argsort(sources, kind="stable")
+        unique_sources, starts = np.unique(sources[order], return_index=True)
+        ends = np.append(starts[1:], len(order))
+        for first in range(0, len(unique_sources), BATCH_SIZE):
+            batch = slice(first, first + BATCH_SIZE)
+            rows = self._shortest_paths(unique_sources[batch], unweighted)
+            for source, start, end in zip(
+                unique_sources[batch].tolist(), starts[batch], ends[batch]
+            ):
+                queries = order[start:end]
+                result[queries] = rows[source][0][destinations[queries]]
+        return result
+
+    def precompute(self, unweighted: bool = False) -> None:
+        """
+        Computes the shortest distances, or fewest numbers of flights, between all
+        airports, after which distances answers every query with a lookup. The table
+        takes 4 bytes per pair of airports, e.g. about 45 MB for 3,400 airports.
+
+        Parameters
+        ------------
+        unweighted: bool, optional
+            Whether to count the flights instead of adding up the distances.
+        """
+        all_pairs = np.empty((len(self), len(self)), dtype=np.float32)
+        for start in range(0, len(self), BATCH_SIZE):
+            batch = np.arange(start, min(start + BATCH_SIZE, len(self)))
+            all_pairs[batch] = dijkstra(
+                self._matrix, directed=True, indices=batch, unweighted=unweighted
+            )
+        self._all_pairs[unweighted] = all_pairs
+
+    def distance_matrix(self, source_ids, unweighted: bool = False) -> pd.DataFrame:
+        """
+        Computes the shortest distances, or fewest numbers of flights, from several
+        airports to every airport in one batch.
+
+        Parameters
+        ------------
+        source_ids: array-like
+            The airport IDs of the origins.
+        unweighted: bool, optional
+            Whether to count the flights instead of adding up the distances.
+
+        Returns
+        ---------
+        pandas.DataFrame
+            One row per origin and one column per airport ID, inf where an
+            airport cannot be reached.
+        """
+        source_ids = np.atleast_1d(np.asarray(source_ids, dtype=np.int64))
+        positions = self._positions(source_ids)
+        rows = self._shortest_paths(positions, unweighted)
+        return pd.DataFrame(
+            np.array([rows[position][0] for position in positions.tolist()]),
+            index=pd.Index(source_ids, name="Source airport ID"),
+            columns=pd.Index(self.airport_ids, name="Destination airport ID"),
+        )
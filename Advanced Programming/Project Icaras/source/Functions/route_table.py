@@ -0,0 +1,314 @@
+"""
+This module contains a compact representation of the routes: the airport, airline
+and airplane codes are interned to dense int32 IDs, the routes are stored as parallel
+typed arrays and the airplanes of each route as a compressed sparse row (CSR) list
+of airplane IDs. Joins with the airports and the airplanes are array lookups on the
+IDs instead of merges on strings, and DataFrames are only materialized on demand.
+"""
+
+# Import the necessary libraries
+import numpy as np
+import pandas as pd
+
+
+def intern(values: pd.Series) -> tuple:
+    """
+    Interns strings to dense IDs, through the categories of a categorical column.
+
+    Parameters
+    ------------
+    values: pandas.Series
+        The strings, categorical or not. Missing values get the ID -1.
+
+    Returns
+    ---------
+    tuple
+        The vocabulary as a pandas.Index, so that ID i stands for vocabulary[i], and
+        the int32 ID of each value.
+    """
+    if not isinstance(values.dtype, pd.CategoricalDtype):
+        values = values.astype(object).astype("category")
+    values = values.cat.remove_unused_categories()
+    return pd.Index(values.cat.categories.astype(object)), values.cat.codes.to_numpy(np.int32)
+
+
+def _int_ids(values: pd.Series) -> np.ndarray:
+    """
+    Returns the integer IDs of a column as int32, -1 where the ID is missing ("\\N").
+    """
+    ids = pd.to_numeric(values, errors="coerce")
+    return ids.fillna(-1).to_numpy(np.int32)
+
+
+def _offsets(lengths: np.ndarray) -> np.ndarray:
+    """
+    Returns the position of each element within its run, for consecutive runs of
+    the given lengths, e.g. [0, 1, 0, 1, 2] for the lengths [2, 3].
+    """
+    return np.arange(lengths.sum()) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+
+
+class RouteTable:  # pylint: disable=too-many-instance-attributes
+    """
+    The routes as parallel arrays of int32 IDs. The airports of the routes are
+    numbered by their position in airport_codes, the airlines by their position in
+    airline_codes and the airplanes by their position in equipment_codes. The
+    airplane IDs of route i are equipment_ids[equipment_indptr[i]:equipment_indptr[i + 1]].
+
+    Attributes
+    ------------
+    airport_codes: pandas.Index
+        The IATA or ICAO codes of the airports, as used by the routes.
+    airline_codes: pandas.Index
+        The codes of the airlines.
+    equipment_codes: pandas.Index
+        The IATA codes of the airplanes.
+    airline: numpy.ndarray
+        The airline ID of each route.
+    source: numpy.ndarray
+        The airport ID of the source airport of each route.
+    destination: numpy.ndarray
+        The airport ID of the destination airport of each route.
+    airline_ids, source_airport_ids, destination_airport_ids: numpy.ndarray
+        The Airline ID, Source airport ID and Destination airport ID columns,
+        -1 where they are missing.
+    codeshare: numpy.ndarray
+        Whether each route is a codeshare.
+    stops: numpy.ndarray
+        The number of stops of each route.
+    distance_km: numpy.ndarray
+        The distance of each route in km.
+    equipment_indptr: numpy.ndarray
+        The start of the airplanes of each route in equipment_ids.
+    equipment_ids: numpy.ndarray
+        The airplane IDs of all routes.
+    airport_rows: numpy.ndarray
+        The position in airports_df of each airport ID, -1 for codes that are
+        not in airports_df.
+    latitude, longitude: numpy.ndarray
+        The coordinates of each airport ID, NaN for unknown airports.
+    """
+
+    def __init__(
+        self, routes_df: pd.DataFrame, airports_df: pd.DataFrame, airport_index: pd.DataFrame
+    ):
+        """
+        Interns the codes of the routes and stores the routes as arrays.
+
+        Parameters
+        ------------
+        routes_df: pandas.DataFrame
+            The routes, with the columns of TABLE_COLUMNS and distance_km.
+        airports_df: pandas.DataFrame
+            The airports.
+        airport_index: pandas.DataFrame
+            The airports indexed by airport code, as built by FlightData.
+        """
+        self.airline_codes, self.airline = intern(routes_df["Airline"])
+        # Both ends share one vocabulary, so that an airport has one ID
+        ends = pd.concat(
+            [
+                routes_df["Source airport"].astype(object),
+                routes_df["Destination airport"].astype(object),
+            ],
+            ignore_index=True,
+        )
+        self.airport_codes, airports = intern(ends)
+        self.source = airports[: len(routes_df)]
+        self.destination = airports[len(routes_df) :]
+        self.airline_ids = _int_ids(routes_df["Airline ID"])
+        self.source_airport_ids = _int_ids(routes_df["Source airport ID"])
+        self.destination_airport_ids = _int_ids(routes_df["Destination airport ID"])
+        self.codeshare = (routes_df["Codeshare"].astype(object) == "Y").to_numpy()
+        stops = pd.to_numeric(routes_df["Stops"], errors="coerce")
+        self.stops = stops.fillna(0).to_numpy(np.int8)
+        self.distance_km = routes_df["distance_km"].to_numpy(np.float64)
+        self._intern_equipment(routes_df["Equipment"])
+
+        # The airports of the IDs, looked up once per airport instead of once per route
+        matched = airport_index.reindex(self.airport_codes)
+        first = ~airports_df["Airport ID"].duplicated()
+        positions = pd.Series(
+            np.flatnonzero(first), index=airports_df["Airport ID"][first].to_numpy()
+        )
+        self.airport_rows = (
+            positions.reindex(matched["Airport ID"].to_numpy()).fillna(-1).to_numpy(np.int32)
+        )
+        self.latitude = matched["Latitude"].to_numpy(np.float32)
+        self.longitude = matched["Longitude"].to_numpy(np.float32)
+
+    def _intern_equipment(self, equipment: pd.Series) -> None:
+        """
+        Builds the CSR list of airplane IDs from the space-separated codes. Each distinct
+        Equipment string is split once, and the routes take its IDs by position.
+        """
+        strings, string_ids = intern(equipment)
+        codes = pd.Series(strings, dtype=object).str.split(" ").explode().dropna()
+        self.equipment_codes, code_ids = intern(codes)
+        string_lengths = np.bincount(codes.index.to_numpy(), minlength=len(strings))
+        string_starts = np.concatenate([[0], np.cumsum(string_lengths)])
+
+        lengths = np.where(string_ids >= 0, string_lengths[string_ids], 0)
+        self.equipment_indptr = np.concatenate([[0], np.cumsum(lengths)]).astype(np.int32)
+        # The position of each airplane of each route among the airplanes of its string
+        self.equipment_ids = code_ids[
+            np.repeat(string_starts[:-1][string_ids], lengths) + _offsets(lengths)
+        ]
+
+    def __len__(self) -> int:
+        return len(self.source)
+
+    @property
+    def nbytes(self) -> int:
+        """
+        The number of bytes of the arrays and the vocabularies.
+        """
+        arrays = sum(
+            value.nbytes for value in vars(self).values() if isinstance(value, np.ndarray)
+        )
+        vocabularies = sum(
+            codes.memory_usage(deep=True)
+            for codes in [self.airport_codes, self.airline_codes, self.equipment_codes]
+        )
+        return int(arrays + vocabularies)
+
+    @staticmethod
+    def _take(values: np.ndarray, airport_ids: np.ndarray, missing):
+        """
+        Returns the values of airport IDs, missing for the ID -1 of a missing code.
+        """
+        return np.where(airport_ids >= 0, values[airport_ids], missing)
+
+    def airport_values(self, values, airport_ids: np.ndarray) -> np.ndarray:
+        """
+        Joins a column of airports_df to airport IDs, e.g. the country of the source
+        airport of every route with airport_values(airports_df["Country"], table.source).
+
+        Parameters
+        ------------
+        values: array-like
+            A column of airports_df.
+        airport_ids: numpy.ndarray
+            The airport IDs, e.g. source or destination.
+
+        Returns
+        ---------
+        numpy.ndarray
+            The value of each airport, None for airports that are not in airports_df.
+        """
+        values = np.append(np.asarray(values, dtype=object), None)
+        # Unknown airports take the appended None at position -1
+        return values[self._take(self.airport_rows, airport_ids, -1)]
+
+    def equipment_routes(self) -> np.ndarray:
+        """
+        Returns the route of each entry of equipment_ids, so that the pairs of route
+        and airplane ID are (equipment_routes()[k], equipment_ids[k]).
+        """
+        return np.repeat(np.arange(len(self)), np.diff(self.equipment_indptr))
+
+    def equipment_models(
+        self, airplanes_df: pd.DataFrame, routes: np.ndarray = None
+    ) -> pd.DataFrame:
+        """
+        Joins the airplanes of the routes with the airplane models. An airplane code
+        can belong to several models, as in a merge on "IATA code".
+
+        Parameters
+        ------------
+        airplanes_df: pandas.DataFrame
+            The airplanes, with the Name and IATA code columns.
+        routes: numpy.ndarray, optional
+            The positions of the routes to join, in ascending order. By default all routes.
+
+        Returns
+        ---------
+        pandas.DataFrame
+            One row per route and airplane model, with the Route (the position of the
+            route), Equipment (the IATA code of the airplane) and Name columns,
+            ordered by route.
+        """
+        models = airplanes_df[["Name", "IATA code"]].copy()
+        models["Code"] = self.equipment_codes.get_indexer(models["IATA code"].astype(object))
+        models = models[models["Code"] >= 0].sort_values("Code", kind="stable")
+        # The models of airplane ID i are names[starts[i]:starts[i + 1]]
+        starts = np.searchsorted(
+            models["Code"].to_numpy(), np.arange(len(self.equipment_codes) + 1)
+        )
+        if routes is None:
+            equipment_ids, equipment_routes = self.equipment_ids, self.equipment_routes()
+        else:
+            routes = np.asarray(routes, dtype=np.int64)
+            lengths = np.diff(self.equipment_indptr)[routes]
+            entries = np.repeat(self.equipment_indptr[:-1][routes], lengths) + _offsets(lengths)
+            equipment_ids = self.equipment_ids[entries]
+            equipment_routes = np.repeat(routes, lengths)
+        counts = np.diff(starts)[equipment_ids]
+        first = np.repeat(starts[:-1][equipment_ids], counts)
+        return pd.DataFrame(
+            {
+                "Route": np.repeat(equipment_routes, counts),
+                "Equipment": self.equipment_codes.to_numpy()[np.repeat(equipment_ids, counts)],
+                "Name": models["Name"].to_numpy()[first + _offsets(counts)],
+            }
+        )
+
+    def to_frame(self, columns: list = None) -> pd.DataFrame:
+        """
+        Materializes the routes as a DataFrame. The codes are categorical columns on
+        the vocabularies, the IDs integers (nullable if some are missing) and the
+        coordinates are taken from the airports.
+
+        Parameters
+        ------------
+        columns: list, optional
+            The columns to materialize, of the columns of routes_df. By default all
+            of them, in the order of routes_df.
+
+        Returns
+        ---------
+        pandas.DataFrame
+            One row per route.
+        """
+        nan = np.float32("nan")
+        makers = {
+            "Airline": lambda: pd.Categorical.from_codes(self.airline, self.airline_codes),
+            "Airline ID": lambda: self._nullable(self.airline_ids),
+            "Source airport": lambda: pd.Categorical.from_codes(self.source, self.airport_codes),
+            "Source airport ID": lambda: self._nullable(self.source_airport_ids),
+            "Destination airport": lambda: pd.Categorical.from_codes(
+                self.destination, self.airport_codes
+            ),
+            "Destination airport ID": lambda: self._nullable(self.destination_airport_ids),
+            "Codeshare": lambda: pd.Categorical(np.where(self.codeshare, "Y", None)),
+            "Stops": lambda: self.stops.astype(np.int64),
+            "Equipment": self._equipment_strings,
+            "Source latitude": lambda: self._take(self.latitude, self.source, nan),
+            "Source longitude": lambda: self._take(self.longitude, self.source, nan),
+            "Destination latitude": lambda: self._take(self.latitude, self.destination, nan),
+            "Destination longitude": lambda: self._take(self.longitude, self.destination, nan),
+            "distance_km": lambda: self.distance_km,
+        }
+        columns = list(makers) if columns is None else columns
+        return pd.DataFrame({column: makers[column]() for column in columns})
+
+    @staticmethod
+    def _nullable(ids: np.ndarray):
+        """
+        Returns IDs as int64, or as nullable integers missing where they are -1.
+        """
+        if (ids >= 0).all():
+            return ids.astype(np.int64)
+        return pd.arrays.IntegerArray(ids.astype(np.int64), ids < 0)
+
+    def _equipment_strings(self) -> pd.Categorical:
+        """
+        Joins the airplane codes of each route with spaces again.
+        """
+        codes = self.equipment_codes.to_numpy()[self.equipment_ids].tolist()
+        bounds = self.equipment_indptr.tolist()
+        strings = [
+            " ".join(codes[start:end]) if end > start else None
+            for start, end in zip(bounds[:-1], bounds[1:])
+        ]
+        return pd.Categorical(strings)
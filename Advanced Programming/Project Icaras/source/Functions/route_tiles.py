@@ -0,0 +1,217 @@
+"""
+This module contains functions that aggregate the routes into level-of-detail
+tiles and write them to a directory as GeoJSON files, one per zoom level and tile.
+A map then only loads the tiles in view (see map_layers.add_tiled_route_layer),
+so the cost of drawing the whole network is bounded by the viewport instead of the
+number of routes.
+
+The tiles follow the web map scheme of Leaflet: at zoom level z the Web Mercator
+world is split into 2^z × 2^z tiles, numbered x from west to east and y from north
+to south. At each level the airports are snapped to a grid of 2^CELL_BITS cells per
+tile along each axis and the routes between the same two cells are merged into one
+line, so coarse levels hold few lines however many routes there are. Each line is
+stored in the tiles of its two ends, at most MAX_TILE_EDGES lines per tile.
+"""
+
+# Import the necessary libraries
+import json
+import os
+
+import numpy as np
+
+# The number of grid cells per tile along each axis, 2^CELL_BITS
+CELL_BITS = 3
+# The largest latitude of the Web Mercator projection in degrees
+MAX_LATITUDE = 85.0511287798
+# The largest number of edges in a tile, the edges with the most routes are kept
+MAX_TILE_EDGES = 1000
+
+
+def mercator(latitudes, longitudes) -> tuple:
+    """
+    Projects coordinates to Web Mercator world coordinates.
+
+    Parameters
+    ------------
+    latitudes: array-like
+        Latitudes in degrees, clipped to MAX_LATITUDE.
+    longitudes: array-like
+        Longitudes in degrees.
+
+    Returns
+    ---------
+    tuple
+        The x and y coordinates as arrays in [0, 1], x growing to the east and
+        y to the south.
+    """
+    latitudes = np.clip(np.asarray(latitudes, dtype=np.float64), -MAX_LATITUDE, MAX_LATITUDE)
+    latitudes = np.radians(latitudes)
+    x = (np.asarray(longitudes, dtype=np.float64) + 180) / 360
+    y = (1 - np.arcsinh(np.tan(latitudes)) / np.pi) / 2
+    return x, y
+
+
+def inverse_mercator(x, y) -> tuple:
+    """
+    Returns the latitudes and longitudes in degrees of Web Mercator world coordinates.
+    """
+    latitudes = np.degrees(np.arctan(np.sinh(np.pi * (1 - 2 * np.asarray(y)))))
+    return latitudes, np.asarray(x) * 360 - 180
+
+
+def level_edges(  # pylint: disable=too-many-locals
+    source_lats, source_longs, destination_lats, destination_longs, zoom: int
+) -> tuple:
+    """
+    Merges the routes between the same two grid cells of a zoom level, in either
+    direction, into one edge. Routes within a cell and routes with missing
+    coordinates are left out.
+
+    Parameters
+    ------------
+    source_lats, source_longs, destination_lats, destination_longs: array-like
+        The coordinates of the source and destination airports of the routes in degrees.
+    zoom: int
+        The zoom level.
+
+    Returns
+    ---------
+    tuple
+        The x and y world coordinates of the centers of the first and second cell
+        of each edge, as arrays of shape (2, edges), and the number of routes of
+        each edge.
+    """
+    cells = 2 ** (zoom + CELL_BITS)
+    ends = []
+    for lats, longs in [(source_lats, source_longs), (destination_lats, destination_longs)]:
+        x, y = mercator(lats, longs)
+        known = np.isfinite(x) & np.isfinite(y)
+        column = np.clip(np.floor(np.where(known, x, 0) * cells), 0, cells - 1).astype(np.int64)
+        row = np.clip(np.floor(np.where(known, y, 0) * cells), 0, cells - 1).astype(np.int64)
+        ends.append(np.where(known, row * cells + column, -1))
+    first, second = np.minimum(*ends), np.maximum(*ends)
+    keep = (first >= 0) & (first != second)
+    edges, routes = np.unique(first[keep] * cells**2 + second[keep], return_counts=True)
+    centers = np.stack(np.divmod(edges, cells**2))
+    rows, columns = np.divmod(centers, cells)
+    return (columns + 0.5) / cells, (rows + 0.5) / cells, routes
+
+
+def edge_tiles(x: np.ndarray, y: np.ndarray, routes: np.ndarray, zoom: int) -> tuple:
+    """
+    Assigns each edge to the tiles of its two ends, so that a map shows the edges
+    from and to the airports in view. Each tile keeps at most MAX_TILE_EDGES edges,
+    those with the most routes, which bounds the lines drawn per tile in view.
+
+    Parameters
+    ------------
+    x, y: numpy.ndarray
+        The world coordinates of the ends of the edges, of shape (2, edges).
+    routes: numpy.ndarray
+        The number of routes of each edge.
+    zoom: int
+        The zoom level.
+
+    Returns
+    ---------
+    tuple
+        The edge, tile x and tile y of each pair of edge and tile, ordered by tile
+        and by descending number of routes within a tile.
+    """
+    tiles = 2**zoom
+    tile_ids = (np.floor(y * tiles) * tiles + np.floor(x * tiles)).astype(np.int64)
+    edges = np.arange(len(routes))
+    # An edge within one tile is listed once
+    pairs = np.unique((tile_ids * len(routes) + edges).ravel())
+    tile_ids, edges = np.divmod(pairs, len(routes))
+    order = np.lexsort((-routes[edges], tile_ids))
+    tile_ids, edges = tile_ids[order], edges[order]
+    starts = np.flatnonzero(np.diff(tile_ids, prepend=-1))
+    counts = np.diff(np.append(starts, len(tile_ids)))
+    ranks = np.arange(len(tile_ids)) - np.repeat(starts, counts)
+    keep = ranks < MAX_TILE_EDGES
+    tile_y, tile_x = np.divmod(tile_ids[keep], tiles)
+    return edges[keep], tile_x, tile_y
+
+
+def write_route_tiles(  # pylint: disable=R0913,R0917,R0914
+    directory: str,
+    source_lats,
+    source_longs,
+    destination_lats,
+    destination_longs,
+    max_zoom: int = 6,
+) -> dict:
+    """
+    Writes the routes as level-of-detail GeoJSON tiles for the zoom levels 0 to
+    max_zoom. Each tile is written to directory/z/x/y.geojson as a FeatureCollection
+    with a LineString per edge it holds. An edge is a Feature with the properties
+    id (its number at the zoom level, the same in every tile), routes (the number of
+    routes merged into it) and weight (a line width growing with the log of routes).
+    Only tiles with edges are written; directory/index.json lists them per level,
+    so tiles left over from an earlier write to the directory are not loaded.
+
+    Parameters
+    ------------
+    directory: str
+        The directory to write the tiles to, created if needed.
+    source_lats, source_longs, destination_lats, destination_longs: array-like
+        The coordinates of the source and destination airports of the routes in degrees.
+    max_zoom: int, optional
+        The most detailed zoom level. Maps zoomed in further show this level.
+
+    Returns
+    ---------
+    dict
+        The index, as written to index.json: min_zoom, max_zoom, and per zoom level
+        the tiles written as "x/y" strings (tiles) and the number of edges (edges).
+    """
+    index = {"min_zoom": 0, "max_zoom": max_zoom, "tiles": {}, "edges": {}}
+    for zoom in range(max_zoom + 1):
+        x, y, routes = level_edges(
+            source_lats, source_longs, destination_lats, destination_longs, zoom
+        )
+        latitudes, longitudes = inverse_mercator(x, y)
+        coordinates = np.stack([longitudes, latitudes], axis=-1).round(5).tolist()
+        weights = (1 + np.log2(routes) / 2).round(1).tolist()
+        edges, tile_x, tile_y = edge_tiles(x, y, routes, zoom)
+        routes = routes.tolist()
+        # The edges of each tile are consecutive, as the pairs are ordered by tile
+        starts = np.flatnonzero(np.diff(tile_y * 2**zoom + tile_x, prepend=-1))
+        written = []
+        for tile_edges, column, row in zip(
+            np.split(edges, starts[1:]), tile_x[starts].tolist(), tile_y[starts].tolist()
+        ):
+            features = [
+                {
+                    "type": "Feature",
+                    "properties": {
+                        "id": edge,
+                        "routes": routes[edge],
+                        "weight": weights[edge],
+                    },
+                    "geometry": {
+                        "type": "LineString",
+                        "coordinates": [coordinates[0][edge], coordinates[1][edge]],
+                    },
+                }
+                for edge in tile_edges.tolist()
+            ]
+            tile_directory = os.path.join(directory, str(zoom), str(column))
+            os.makedirs(tile_directory, exist_ok=True)
+            tile_path = os.path.join(tile_directory, f"{row}.geojson")
+            with open(tile_path, "w", encoding="utf-8") as file:
+                # json.dumps encodes in C, json.dump would encode in Python
+                file.write(
+                    json.dumps(
+                        {"type": "FeatureCollection", "features": features},
+                        separators=(",", ":"),
+                    )
+                )
+            written.append(f"{column}/{row}")
+        index["tiles"][str(zoom)] = written
+        index["edges"][str(zoom)] = len(routes)
+    os.makedirs(directory, exist_ok=True)
+    with open(os.path.join(directory, "index.json"), "w", encoding="utf-8") as file:
+        json.dump(index, file)
+    return index
@@ -0,0 +1,159 @@
+"""
+This module contains a spatial index over points on the earth's surface that finds
+the points within a radius of, or nearest to, given coordinates without calculating
+the distance to every point.
+"""
+
+# Import the necessary libraries
+import numpy as np
+import pandas as pd
+from scipy.spatial import cKDTree
+
+from Functions.distances import RADIUS_EARTH, distance_many
+
+
+def to_unit_sphere(latitudes, longitudes) -> np.ndarray:
+    """
+    Converts latitudes and longitudes in degrees to 3D points on a sphere with the
+    radius of the earth, on which the straight-line (chord) distance grows with the
+    great-circle distance.
+
+    Parameters
+    ------------
+    latitudes: array-like
+        Latitudes in degrees.
+    longitudes: array-like
+        Longitudes in degrees.
+
+    Returns
+    ---------
+    numpy.ndarray
+        The points, one row of x, y and z in kilometers per coordinate.
+    """
+    lat = np.radians(np.asarray(latitudes, dtype=np.float64))
+    lon = np.radians(np.asarray(longitudes, dtype=np.float64))
+    return RADIUS_EARTH * np.column_stack(
+        [np.cos(lat) * np.cos(lon), np.cos(lat) * np.sin(lon), np.sin(lat)]
+    )
+
+
+def chord_length(distance_km) -> np.ndarray:
+    """
+    Converts great-circle distances in km into straight-line distances through the earth.
+    """
+    angle = np.minimum(np.asarray(distance_km, dtype=np.float64) / RADIUS_EARTH, np.pi)
+    return 2 * RADIUS_EARTH * np.sin(angle / 2)
+
+
+class SpatialIndex:
+    """
+    A k-d tree over the points of a table on a sphere with the radius of the earth.
+    The tree finds candidates by straight-line distance, which orders points the same
+    way as the great-circle distance, and the reported distances are calculated with
+    the haversine formula of distance_many, so they match the distance function.
+
+    Attributes
+    ------------
+    labels: pandas.Index
+        The index labels of the indexed rows. Rows with missing coordinates are left out.
+    latitudes: numpy.ndarray
+        The latitudes of the indexed rows in degrees.
+    longitudes: numpy.ndarray
+        The longitudes of the indexed rows in degrees.
+    """
+
+    def __init__(
+        self,
+        table: pd.DataFrame,
+        latitude_column: str = "Latitude",
+        longitude_column: str = "Longitude",
+    ):
+        """
+        Builds the index over the coordinates of a table, such as airports_df.
+
+        Parameters
+        ------------
+        table: pandas.DataFrame
+            The table with the coordinates in degrees.
+        latitude_column: str, optional
+            The column with the latitudes.
+        longitude_column: str, optional
+            The column with the longitudes.
+        """
+        located = table[[latitude_column, longitude_column]].dropna()
+        self.labels = located.index
+        self.latitudes = located[latitude_column].to_numpy(dtype=np.float64)
+        self.longitudes = located[longitude_column].to_numpy(dtype=np.float64)
+        self._tree = cKDTree(to_unit_sphere(self.latitudes, self.longitudes))
+
+    def __len__(self) -> int:
+        return len(self.labels)
+
+    def within(self, latitude: float, longitude: float, radius_km: float) -> pd.Series:
+        """
+        Finds the points within a radius of a location.
+
+        Parameters
+        ------------
+        latitude: float
+            The latitude of the location in degrees.
+        longitude: float
+            The longitude of the location in degrees.
+        radius_km: float
+            The radius in kilometers.
+
+        Returns
+        ---------
+        pandas.Series
+            The distances in kilometers, indexed by the labels of the rows and
+            sorted from nearest to farthest.
+        """
+        # A slightly larger radius, so that no point is lost to rounding
+        positions = self._tree.query_ball_point(
+            to_unit_sphere([latitude], [longitude])[0], chord_length(radius_km) * (1 + 1e-9)
+        )
+        distances = distance_many(
+            latitude, longitude, self.latitudes[positions], self.longitudes[positions]
+        )
+        found = pd.Series(distances, index=self.labels[positions], name="distance_km")
+        return found[found <= radius_km].sort_values(kind="stable")
+
+    def nearest(self, latitudes, longitudes, k: int = 1) -> pd.DataFrame:
+        """
+        Finds the k nearest points to each of many locations.
+
+        Parameters
+        ------------
+        latitudes: float or array-like
+            The latitudes of the locations in degrees.
+        longitudes: float or array-like
+            The longitudes of the locations in degrees.
+        k: int, optional
+            The number of points to find per location.
+
+        Returns
+        ---------
+        pandas.DataFrame
+            One row per location and neighbour, nearest first, with the position of
+            the location in the Query column, the label of the row in the Label column
+            and the distance in the distance_km column.
+        """
+        latitudes = np.atleast_1d(np.asarray(latitudes, dtype=np.float64))
+        longitudes = np.atleast_1d(np.asarray(longitudes, dtype=np.float64))
+        k = min(k, len(self))
+        _, positions = self._tree.query(to_unit_sphere(latitudes, longitudes), k=k)
+        positions = positions.reshape(len(latitudes), k)
+        queries = np.repeat(np.arange(len(latitudes)), k)
+        positions = positions.ravel()
+        return pd.DataFrame(
+            {
+                "Query": queries,
+                "Label": self.labels[positions],
+                "distance_km": distance_many(
+                    latitudes[queries],
+                    longitudes[queries],
+                    self.latitudes[positions],
+                    self.longitudes[positions],
+                ),
+            }
+        )
@@ -0,0 +1,248 @@
+"""
+This module contains functions to cache processed DataFrames on disk in the
+columnar Arrow (Feather) format, keyed on the content hash of the file they
+were built from, and to write and read tables that are too large for memory
+as chunked Parquet stores.
+"""
+
+# Import the necessary libraries
+import hashlib
+import os
+import re
+import shutil
+
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    from pyarrow import feather
+    from pyarrow import parquet
+except ImportError:  # pyarrow is optional, without it nothing is cached
+    pa = None
+    feather = None
+    parquet = None
+
+# Bump this whenever the processing of the cached tables changes
+CACHE_VERSION = "3"
+# The names of the directories of the cache keys, SHA-256 hex digests
+KEY_PATTERN = re.compile(r"[0-9a-f]{64}")
+
+
+def file_hash(file_path: str, chunk_size: int = 1 << 20) -> str:
+    """
+    Calculates the cache key of a file from its content.
+
+    Parameters
+    ------------
+    file_path: str
+        The path of the file to hash.
+    chunk_size: int
+        The number of bytes to read at a time.
+
+    Returns
+    ---------
+    str
+        The SHA-256 hex digest of the file content and the cache version.
+    """
+    digest = hashlib.sha256(CACHE_VERSION.encode())
+    with open(file_path, "rb") as file:
+        for chunk in iter(lambda: file.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def is_key_dir(cache_dir: str, entry: str) -> bool:
+    """
+    Returns whether an entry of the cache directory holds the tables of a cache key,
+    that is a directory named like a file_hash that contains .arrow files.
+
+    Parameters
+    ------------
+    cache_dir: str
+        The directory holding the cache.
+    entry: str
+        The name of the entry in the cache directory.
+
+    Returns
+    ---------
+    bool
+        Whether the entry is the directory of a cache key.
+    """
+    path = os.path.join(cache_dir, entry)
+    return (
+        KEY_PATTERN.fullmatch(entry) is not None
+        and os.path.isdir(path)
+        and any(name.endswith(".arrow") for name in os.listdir(path))
+    )
+
+
+def cache_available() -> bool:
+    """
+    Returns whether tables can be cached, which requires pyarrow.
+    """
+    return feather is not None
+
+
+def is_cached(cache_dir: str, cache_key: str, name: str) -> bool:
+    """
+    Returns whether a table is cached, without loading it.
+
+    Parameters
+    ------------
+    cache_dir: str
+        The directory holding the cache.
+    cache_key: str
+        The cache key, usually the file_hash of the source file.
+    name: str
+        The name of the table, e.g. 'routes_df'.
+
+    Returns
+    ---------
+    bool
+        Whether load_table would find the table.
+    """
+    return cache_available() and os.path.exists(
+        os.path.join(cache_dir, cache_key, f"{name}.arrow")
+    )
+
+
+def load_table(cache_dir: str, cache_key: str, name: str):
+    """
+    Loads a cached table. The file is memory-mapped, so columns that Arrow can hand
+    over to pandas without conversion are not copied into memory.
+
+    Parameters
+    ------------
+    cache_dir: str
+        The directory holding the cache.
+    cache_key: str
+        The cache key, usually the file_hash of the source file.
+    name: str
+        The name of the table, e.g. 'routes_df'.
+
+    Returns
+    ---------
+    pandas.DataFrame or None
+        The cached table, or None if it is not cached.
+    """
+    if not is_cached(cache_dir, cache_key, name):
+        return None
+    path = os.path.join(cache_dir, cache_key, f"{name}.arrow")
+    return feather.read_table(path, memory_map=True).to_pandas(split_blocks=True)
+
+
+def save_table(cache_dir: str, cache_key: str, name: str, table: pd.DataFrame) -> bool:
+    """
+    Stores a table in the cache and removes the tables cached under any other key,
+    since they were built from an outdated file. Other entries of the cache
+    directory are left alone.
+
+    Parameters
+    ------------
+    cache_dir: str
+        The directory holding the cache.
+    cache_key: str
+        The cache key, usually the file_hash of the source file.
+    name: str
+        The name of the table, e.g. 'routes_df'.
+    table: pandas.DataFrame
+        The table to store.
+
+    Returns
+    ---------
+    bool
+        Whether the table was stored.
+    """
+    if not cache_available():
+        return False
+    try:
+        arrow_table = pa.Table.from_pandas(table, preserve_index=False)
+    except (pa.ArrowInvalid, pa.ArrowTypeError) as error:
+        print(f"Table {name} could not be cached: {error}")
+        return False
+
+    key_dir = os.path.join(cache_dir, cache_key)
+    os.makedirs(key_dir, exist_ok=True)
+    # Write to a temporary file first so an interrupted write never looks cached
+    path = os.path.join(key_dir, f"{name}.arrow")
+    feather.write_feather(arrow_table, path + ".tmp", compression="uncompressed")
+    os.replace(path + ".tmp", path)
+
+    for entry in os.listdir(cache_dir):
+        if entry != cache_key and is_key_dir(cache_dir, entry):
+            shutil.rmtree(os.path.join(cache_dir, entry), ignore_errors=True)
+    return True
+
+
+def write_chunks(chunks, store_path: str) -> int:
+    """
+    Writes DataFrame chunks one after another to a Parquet file, one row group per
+    chunk, so only a single chunk is held in memory at a time.
+
+    Parameters
+    ------------
+    chunks: iterable of pandas.DataFrame
+        The chunks to write. All chunks must have the same columns and types.
+    store_path: str
+        The path of the Parquet file. It only appears once all chunks are written.
+
+    Returns
+    ---------
+    int
+        The number of rows written.
+
+    Raises
+    ------------
+    ImportError
+        If pyarrow is not installed.
+    """
+    if parquet is None:
+        raise ImportError("Writing a chunked store requires pyarrow.")
+
+    directory = os.path.dirname(store_path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+    writer = None
+    n_rows = 0
+    try:
+        for chunk in chunks:
+            table = pa.Table.from_pandas(chunk, preserve_index=False)
+            if writer is None:
+                writer = parquet.ParquetWriter(store_path + ".tmp", table.schema)
+            writer.write_table(table.cast(writer.schema))
+            n_rows += len(chunk)
+    finally:
+        if writer is not None:
+            writer.close()
+
+    if writer is not None:
+        os.replace(store_path + ".tmp", store_path)
+    return n_rows
+
+
+def iter_store(store_path: str, columns: list = None, batch_size: int = 100_000):
+    """
+    Reads a Parquet store back as DataFrames of at most batch_size rows.
+
+    Parameters
+    ------------
+    store_path: str
+        The path of the Parquet file.
+    columns: list, optional
+        The columns to read. By default all columns are read.
+    batch_size: int, optional
+        The maximum number of rows per DataFrame.
+
+    Yields
+    ---------
+    pandas.DataFrame
+        The consecutive batches of the store.
+    """
+    if parquet is None:
+        raise ImportError("Reading a chunked store requires pyarrow.")
+
+    for batch in parquet.ParquetFile(store_path).iter_batches(
+        batch_size=batch_size, columns=columns
+    ):
+        yield batch.to_pandas()
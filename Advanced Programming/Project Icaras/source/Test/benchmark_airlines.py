@@ -0,0 +1,54 @@
+"""
+This module benchmarks the queries about single airlines: selecting the routes of
+an airline with a boolean mask of routes_df against the positions in the airline
+index, and the time of airline_summary, which adds the countries and the fleet mix.
+
+The benchmark is not part of the pytest suite. Run it from the source directory with:
+    python -m Test.benchmark_airlines
+"""
+
+import time
+
+import numpy as np
+
+from flightclass.flight import FlightData
+
+
+def main(airlines: int = 200, seed: int = 0) -> None:
+    """
+    Queries a random sample of airlines each way and prints the milliseconds per query.
+    """
+    flight_data = FlightData(lazy=True, result_cache_size=0)
+    routes = flight_data.routes_df
+
+    start = time.perf_counter()
+    index = flight_data.airline_index
+    print(f"Airlines with routes: {len(index)}")
+    print(f"Building the index:            {(time.perf_counter() - start) * 1000:10.1f} ms")
+    airline_ids = np.random.default_rng(seed).choice(index.airline_ids, airlines)
+
+    # The Airline ID column holds strings if it contains missing IDs ("\N")
+    column = routes["Airline ID"]
+    if column.dtype == object:
+        airline_ids = airline_ids.astype(str)
+    start = time.perf_counter()
+    for airline_id in airline_ids:
+        masked = routes[column == airline_id]
+    mask_time = (time.perf_counter() - start) * 1000 / airlines
+    start = time.perf_counter()
+    for airline_id in airline_ids:
+        indexed = flight_data.airline_routes(int(airline_id))
+    index_time = (time.perf_counter() - start) * 1000 / airlines
+    assert masked.equals(indexed)
+    start = time.perf_counter()
+    for airline_id in airline_ids:
+        flight_data.airline_summary(int(airline_id))
+    summary_time = (time.perf_counter() - start) * 1000 / airlines
+
+    print(f"Routes with a mask:            {mask_time:10.2f} ms per airline")
+    print(f"Routes with the index:         {index_time:10.2f} ms per airline")
+    print(f"airline_summary:               {summary_time:10.2f} ms per airline")
+
+
+if __name__ == "__main__":
+    main()
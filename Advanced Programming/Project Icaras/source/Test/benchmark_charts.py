@@ -0,0 +1,51 @@
+"""
+This module benchmarks the headless chart export of distance_analysis and
+plot_top_models: the number of charts per minute that are rendered to PNG and SVG
+bytes in memory, with show=False, for the world and for every country.
+
+The benchmark is not part of the pytest suite. Run it from the source directory with:
+    python -m Test.benchmark_charts
+"""
+
+import time
+
+from flightclass.flight import FlightData
+
+# The number of top model charts that are rendered per image format
+CHARTS = 100
+
+
+def main() -> None:
+    """
+    Renders the distance histogram and the top model charts of the countries with the
+    most airports, and prints the charts per minute and the image sizes.
+    """
+    flight_data = FlightData()
+    countries = (
+        flight_data.airports_df["Country"].value_counts().index[:CHARTS].astype(str).tolist()
+    )
+    # Build the equipment cube and warm up matplotlib outside of the timings
+    flight_data.plot_top_models(countries[:1], show=False)
+
+    for image_format in ["png", "svg"]:
+        start = time.perf_counter()
+        histogram = flight_data.distance_analysis(show=False, image_format=image_format)
+        histogram_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        sizes = []
+        for country in countries:
+            chart = flight_data.plot_top_models([country], show=False, image_format=image_format)
+            sizes.append(len(chart.image))
+        models_time = time.perf_counter() - start
+
+        name = image_format.upper()
+        print(f"{name} distance histogram:    {histogram_time * 1000:10.1f} ms"
+              f" {len(histogram.image) / 1024:8.1f} KiB")
+        print(f"{name} top models per chart:  {models_time / len(countries) * 1000:10.1f} ms"
+              f" {sum(sizes) / len(sizes) / 1024:8.1f} KiB")
+        print(f"{name} top models per minute: {60 * len(countries) / models_time:10.0f}")
+
+
+if __name__ == "__main__":
+    main()
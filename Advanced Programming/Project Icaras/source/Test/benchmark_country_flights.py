@@ -0,0 +1,91 @@
+"""
+This module benchmarks the vectorized selection and classification of the flights
+departing from a country (country_flights and haul_summary) against the nested
+iterrows() loops that plot_country_flights used before.
+
+The benchmark runs on the flight data for the largest countries and is not part
+of the pytest suite. Run it from the source directory with:
+    python -m Test.benchmark_country_flights
+"""
+
+import functools
+import timeit
+
+import numpy as np
+
+from flightclass.flight import FlightData
+from Functions.emissions import country_flights, haul_summary
+
+COUNTRIES = ["United States", "China"]
+
+
+def loop_path(flight_data: FlightData, country_name: str, threshold: int = 1000) -> tuple:
+    """
+    Computes the short- and long-haul totals with the nested loops of the former
+    plot_country_flights implementation, without drawing the map.
+    """
+    airports_df = flight_data.airports_df
+    routes_df = flight_data.routes_df
+    country_airports = airports_df[airports_df["Country"] == country_name]
+    sh_dist, sh_count, lh_dist, lh_count = 0, 0, 0, 0
+    for _, source_airport in country_airports.iterrows():
+        departing_flights = routes_df[routes_df["Source airport"] == source_airport["IATA"]]
+        for _, flight in departing_flights.iterrows():
+            destination_airport_info = airports_df[
+                airports_df["IATA"] == flight["Destination airport"]
+            ]
+            if destination_airport_info.empty:
+                continue
+            if flight["distance_km"] < threshold:
+                sh_dist += flight["distance_km"]
+                sh_count += 1
+            else:
+                lh_dist += flight["distance_km"]
+                lh_count += 1
+    return sh_count, sh_dist, lh_count, lh_dist
+
+
+def vectorized_path(flight_data: FlightData, country_name: str, threshold: int = 1000) -> tuple:
+    """
+    Computes the short- and long-haul totals with one join and one groupby.
+    """
+    flights = country_flights(
+        flight_data.airports_df,
+        flight_data.routes_df,
+        flight_data.airport_index,
+        country_name,
+        threshold=threshold,
+    )
+    summary = haul_summary(flights)
+    return tuple(summary.loc[0, ["sh_count", "sh_dist", "lh_count", "lh_dist"]])
+
+
+def main(countries: list = None) -> None:
+    """
+    Times both paths for each country, checks that they agree and prints the speedup.
+    """
+    flight_data = FlightData()
+    for country_name in countries or COUNTRIES:
+        np.testing.assert_allclose(
+            loop_path(flight_data, country_name), vectorized_path(flight_data, country_name)
+        )
+        loop_time = min(
+            timeit.repeat(
+                functools.partial(loop_path, flight_data, country_name), number=1, repeat=1
+            )
+        )
+        vector_time = min(
+            timeit.repeat(
+                functools.partial(vectorized_path, flight_data, country_name),
+                number=1,
+                repeat=5,
+            )
+        )
+        print(f"{country_name}")
+        print(f"  Nested iterrows loops: {loop_time * 1000:10.2f} ms")
+        print(f"  Join and groupby:      {vector_time * 1000:10.2f} ms")
+        print(f"  Speedup:               {loop_time / vector_time:10.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""
+This module benchmarks the vectorized distance_many function against the
+row-wise application of the scalar distance function that FlightData used
+to compute the distance_km column of the routes.
+
+The benchmark is not part of the pytest suite. Run it from the source directory with:
+    python -m Test.benchmark_distances
+"""
+
+import sys
+import timeit
+
+import numpy as np
+import pandas as pd
+
+sys.path.append("./Functions/")
+# pylint: disable=wrong-import-position
+from Functions.distances import distance, distance_many
+
+
+def make_routes(n_routes: int = 67000, seed: int = 0) -> pd.DataFrame:
+    """
+    Creates a DataFrame of random routes shaped like the enriched routes_df.
+
+    Parameters
+    ------------
+    n_routes: int
+        The number of routes to generate. The default matches the size of the flight data.
+    seed: int
+        The seed of the random number generator.
+
+    Returns
+    ---------
+    pandas.DataFrame
+        A DataFrame with source and destination coordinates. About 1% of the
+        destinations have no coordinates, like routes to unknown airports.
+    """
+    rng = np.random.default_rng(seed)
+    routes = pd.DataFrame(
+        {
+            "Source latitude": rng.uniform(-90, 90, n_routes),
+            "Source longitude": rng.uniform(-180, 180, n_routes),
+            "Destination latitude": rng.uniform(-90, 90, n_routes),
+            "Destination longitude": rng.uniform(-180, 180, n_routes),
+        }
+    )
+    routes.loc[rng.random(n_routes) < 0.01, "Destination latitude"] = np.nan
+    return routes
+
+
+def scalar_path(routes: pd.DataFrame) -> pd.Series:
+    """
+    Computes the distances by applying the scalar distance function row by row.
+    """
+    return routes.apply(
+        lambda row: distance(
+            row["Source latitude"],
+            row["Source longitude"],
+            row["Destination latitude"],
+            row["Destination longitude"],
+        ),
+        axis=1,
+    )
+
+
+def vectorized_path(routes: pd.DataFrame) -> np.ndarray:
+    """
+    Computes the distances with a single call to distance_many.
+    """
+    return distance_many(
+        routes["Source latitude"],
+        routes["Source longitude"],
+        routes["Destination latitude"],
+        routes["Destination longitude"],
+    )
+
+
+def main(n_routes: int = 67000, repeat: int = 3) -> None:
+    """
+    Times both paths, checks that they agree and prints the speedup.
+    """
+    routes = make_routes(n_routes)
+
+    np.testing.assert_allclose(
+        scalar_path(routes).to_numpy(), vectorized_path(routes), equal_nan=True
+    )
+
+    scalar_time = min(timeit.repeat(lambda: scalar_path(routes), number=1, repeat=repeat))
+    vector_time = min(
+        timeit.repeat(lambda: vectorized_path(routes), number=1, repeat=repeat)
+    )
+
+    print(f"Routes:            {n_routes}")
+    print(f"Row-wise apply:    {scalar_time * 1000:10.2f} ms")
+    print(f"distance_many:     {vector_time * 1000:10.2f} ms")
+    print(f"Speedup:           {scalar_time / vector_time:10.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""
+This module benchmarks the country flows: building them from the routes, and the
+summary of the flights departing from a country, selected and aggregated with
+country_flights and haul_summary against a lookup in the country flows.
+
+The benchmark is not part of the pytest suite. Run it from the source directory with:
+    python -m Test.benchmark_flows
+"""
+
+import time
+
+import numpy as np
+
+from flightclass.flight import FlightData
+from Functions.emissions import country_flights, haul_summary
+
+
+def main(countries: int = 50, seed: int = 0) -> None:
+    """
+    Summarizes a random sample of countries each way and prints the milliseconds per query.
+    """
+    flight_data = FlightData(lazy=True)
+    airports = flight_data.airports_df
+    routes = flight_data.routes_df
+    airport_index = flight_data.airport_index
+
+    start = time.perf_counter()
+    flows = flight_data.country_flows
+    print(f"Countries: {len(flows)}, pairs with flights: {len(flows.to_frame())}")
+    print(f"Building the flows:      {(time.perf_counter() - start) * 1000:10.2f} ms")
+    names = np.random.default_rng(seed).choice(flows.countries, countries)
+
+    start = time.perf_counter()
+    selected = [
+        haul_summary(country_flights(airports, routes, airport_index, country))
+        for country in names
+    ]
+    select_time = (time.perf_counter() - start) * 1000 / countries
+    start = time.perf_counter()
+    looked_up = [flows.summary(country) for country in names]
+    lookup_time = (time.perf_counter() - start) * 1000 / countries
+    for expected, summary in zip(selected, looked_up):
+        assert np.allclose(expected.to_numpy(), summary.to_numpy(), equal_nan=True)
+    print(f"Summary, selected:       {select_time:10.2f} ms")
+    print(f"Summary, looked up:      {lookup_time:10.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
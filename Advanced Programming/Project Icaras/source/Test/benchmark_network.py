@@ -0,0 +1,65 @@
+"""
+This module benchmarks the hub metrics of the whole route network: the degrees and
+routes lost per airport with a boolean mask of routes_df per airport, against the
+sparse adjacency matrix, and the time of PageRank and of the exact and sampled
+betweenness of every airport.
+
+The masks per airport are timed for a sample of airports and extrapolated.
+
+The benchmark is not part of the pytest suite. Run it from the source directory with:
+    python -m Test.benchmark_network
+"""
+
+import time
+
+import numpy as np
+
+from flightclass.flight import FlightData
+from Functions.network import betweenness, pagerank, route_adjacency
+
+SAMPLE = 200  # Number of airports whose degrees are computed with masks
+
+
+def main(samples: int = 500) -> None:
+    """
+    Times each metric, checks that the degrees agree and prints the times.
+    """
+    flight_data = FlightData(lazy=True)
+    routes = flight_data.routes_df
+
+    start = time.perf_counter()
+    airport_ids, adjacency = route_adjacency(routes)
+    destinations = np.diff(adjacency.indptr)
+    routes_lost = adjacency.sum(axis=1).A1 + adjacency.sum(axis=0).A1
+    matrix_time = time.perf_counter() - start
+    print(f"Airports: {len(airport_ids)}, connections: {adjacency.nnz}")
+
+    start = time.perf_counter()
+    sample = np.linspace(0, len(airport_ids) - 1, SAMPLE).astype(int)
+    for position in sample:
+        departing = routes[routes["Source airport ID"] == airport_ids[position]]
+        arriving = routes[routes["Destination airport ID"] == airport_ids[position]]
+        departing = departing[departing["Destination airport ID"] != airport_ids[position]]
+        assert departing["Destination airport ID"].nunique() == destinations[position]
+        assert len(departing) + len(arriving) >= routes_lost[position]
+    mask_time = (time.perf_counter() - start) * len(airport_ids) / SAMPLE
+
+    start = time.perf_counter()
+    pagerank(adjacency)
+    pagerank_time = time.perf_counter() - start
+    start = time.perf_counter()
+    betweenness(adjacency)
+    exact_time = time.perf_counter() - start
+    start = time.perf_counter()
+    betweenness(adjacency, samples=samples)
+    sampled_time = time.perf_counter() - start
+
+    print(f"Degrees with masks (extrapolated): {mask_time:10.2f} s")
+    print(f"Degrees with the matrix:           {matrix_time:10.2f} s")
+    print(f"PageRank:                          {pagerank_time:10.2f} s")
+    print(f"Betweenness, exact:                {exact_time:10.2f} s")
+    print(f"Betweenness, sampled:              {sampled_time:10.2f} s ({samples} sources)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+This module benchmarks parsing the flight data zip file with the default options
+of pandas.read_csv against parsing it with the column and type schemas of FlightData.
+It reports the parse time, the peak memory while parsing and the memory of the
+resulting DataFrames.
+
+The benchmark is not part of the pytest suite. Run it from the source directory with:
+    python -m Test.benchmark_parsing
+"""
+
+import time
+import tracemalloc
+
+from flightclass.flight import TABLE_SCHEMAS
+from Functions.download_zip import download_file
+from Functions.reading_zip import TARGET_URL, unzip
+
+
+def measure(target_file: str, schemas: dict = None) -> tuple:
+    """
+    Parses the zip file and measures the parse time, the peak memory and the size
+    of the resulting DataFrames.
+
+    Parameters
+    ------------
+    target_file: str
+        The path of the zip file.
+    schemas: dict, optional
+        The read options per table, passed on to unzip.
+
+    Returns
+    ---------
+    tuple
+        The parse time in seconds, the peak memory in bytes and the
+        memory used by the DataFrames in bytes.
+    """
+    # Time the parsing without tracing, which would slow it down
+    start = time.perf_counter()
+    unzip(target_file, schemas=schemas)
+    parse_time = time.perf_counter() - start
+
+    tracemalloc.start()
+    dataframes_dict = unzip(target_file, schemas=schemas)
+    _, peak_memory = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    frame_memory = sum(
+        dataframe.memory_usage(deep=True).sum() for dataframe in dataframes_dict.values()
+    )
+    return parse_time, peak_memory, frame_memory
+
+
+def main(target_file: str = "downloads/flight_data.zip") -> None:
+    """
+    Measures both ways of parsing and prints the reduction.
+    """
+    download_file(TARGET_URL, target_file)
+    unzip(target_file)  # Warm up the file system cache and pandas
+
+    default = measure(target_file)
+    schema = measure(target_file, TABLE_SCHEMAS)
+
+    print(f"{'':22}{'read_csv defaults':>20}{'schemas':>12}{'reduction':>12}")
+    for label, before, after, scale, unit in [
+        ("Parse time", default[0], schema[0], 1000, "ms"),
+        ("Peak memory", default[1], schema[1], 1 / 2**20, "MiB"),
+        ("DataFrame memory", default[2], schema[2], 1 / 2**20, "MiB"),
+    ]:
+        print(
+            f"{label + ' (' + unit + ')':22}{before * scale:20.1f}{after * scale:12.1f}"
+            f"{(1 - after / before) * 100:11.1f}%"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""
+This module benchmarks drawing routes and airports as one folium object each against
+drawing them as a single GeoJSON layer of routes and a clustered layer of airports.
+It reports the time to build and render the map to HTML and the size of the HTML.
+
+The benchmark runs on the busiest airport and the country with the most routes and
+is not part of the pytest suite. Run it from the source directory with:
+    python -m Test.benchmark_rendering
+"""
+
+import time
+
+from flightclass.flight import FlightData
+from flightclass.plotting import RENDER_MODES
+
+
+def measure(plot, *args, **kwargs) -> tuple:
+    """
+    Builds a map and renders it to HTML, the way a notebook does when displaying it.
+
+    Parameters
+    ------------
+    plot: callable
+        The plotting method of FlightData.
+    args, kwargs:
+        The arguments passed on to the plotting method.
+
+    Returns
+    ---------
+    tuple
+        The time to build and render the map in seconds and the size of the HTML in bytes.
+    """
+    start = time.perf_counter()
+    html = plot(*args, **kwargs).get_root().render()
+    return time.perf_counter() - start, len(html.encode("utf-8"))
+
+
+def main() -> None:
+    """
+    Measures both ways of drawing for each map and prints the reduction.
+    """
+    flight_data = FlightData()
+    routes_df = flight_data.routes_df
+    airport_code = str(routes_df["Source airport"].value_counts().index[0])
+    source_countries = routes_df["Source airport"].map(
+        flight_data.airport_index["Country"]
+    )
+    country_name = str(source_countries.value_counts().index[0])
+    airport_country = str(flight_data.airports_df["Country"].value_counts().index[0])
+
+    cases = [
+        (f"Airport {airport_code}", flight_data.plot_airport_flights, airport_code),
+        (f"Country {country_name}", flight_data.plot_country_flights, country_name),
+        (f"Airports of {airport_country}", flight_data.plot_airports, airport_country),
+    ]
+    print(f"{'':34}{'objects':>12}{'geojson':>12}{'reduction':>12}")
+    for label, plot, argument in cases:
+        objects, geojson = [measure(plot, argument, render=render) for render in RENDER_MODES]
+        print(label)
+        for name, index, scale, unit in [("Time", 0, 1000, "ms"), ("HTML", 1, 1 / 2**10, "KiB")]:
+            print(
+                f"  {name + ' (' + unit + ')':32}{objects[index] * scale:12.1f}"
+                f"{geojson[index] * scale:12.1f}"
+                f"{(1 - geojson[index] / objects[index]) * 100:11.1f}%"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""
+This module benchmarks origin/destination queries on the route graph of FlightData:
+random airport pairs without any cached shortest paths, queries from the busiest
+airports to random destinations, and random pairs after all distances are precomputed.
+It reports the number of queries answered per second.
+
+The benchmark is not part of the pytest suite. Run it from the source directory with:
+    python -m Test.benchmark_route_graph
+"""
+
+import time
+
+import numpy as np
+
+from flightclass.flight import FlightData
+from Functions.route_graph import RouteGraph
+
+
+def queries_per_second(graph: RouteGraph, source_ids, destination_ids) -> float:
+    """
+    Answers the queries in one batch and returns the number of queries per second.
+    """
+    start = time.perf_counter()
+    graph.distances(source_ids, destination_ids)
+    return len(source_ids) / (time.perf_counter() - start)
+
+
+def main(queries: int = 5_000, hubs: int = 100, seed: int = 0) -> None:
+    """
+    Measures the query throughput in each situation.
+    """
+    flight_data = FlightData(lazy=True)
+    rng = np.random.default_rng(seed)
+
+    start = time.perf_counter()
+    graph = RouteGraph(flight_data.routes_df)
+    print(f"Airports: {len(graph)}, connections: {len(graph.indices)}")
+    print(f"Building the graph:              {(time.perf_counter() - start) * 1000:12.1f} ms")
+
+    source_ids = rng.choice(graph.airport_ids, queries)
+    destination_ids = rng.choice(graph.airport_ids, queries)
+    print(
+        f"Random pairs, queries/s:         "
+        f"{queries_per_second(graph, source_ids, destination_ids):12.0f}"
+    )
+
+    # A new graph, so that no shortest paths are cached
+    busiest = graph.airport_ids[np.argsort(np.diff(graph.indptr))[-hubs:]]
+    graph = RouteGraph(flight_data.routes_df)
+    hub_source_ids = rng.choice(busiest, queries * 4)
+    hub_destination_ids = rng.choice(graph.airport_ids, queries * 4)
+    print(
+        f"From the {hubs} busiest, queries/s: "
+        f"{queries_per_second(graph, hub_source_ids, hub_destination_ids):12.0f}"
+    )
+
+    start = time.perf_counter()
+    graph.precompute()
+    print(f"Precomputing all distances:      {time.perf_counter() - start:12.1f} s")
+    print(
+        f"Random pairs, queries/s:         "
+        f"{queries_per_second(graph, source_ids, destination_ids):12.0f}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""
+This module benchmarks the interned route table against routes_df: the memory of
+routes_df with and without the IATA_x and IATA_y columns that it used to carry,
+against the arrays of RouteTable, and two joins done with string codes and with the
+int32 IDs: the country of the source airport of every route, and the airplane models
+of every route (split, explode and merge on the codes, as in the equipment cube).
+
+The benchmark is not part of the pytest suite. Run it from the source directory with:
+    python -m Test.benchmark_route_table
+"""
+
+import time
+
+import numpy as np
+import pandas as pd
+
+from flightclass.flight import FlightData
+from Functions.route_table import RouteTable
+
+REPEATS = 5  # Number of times each join is timed, the fastest time is kept
+
+
+def fastest(join) -> tuple:
+    """
+    Runs a join REPEATS times and returns its result and its fastest time in ms.
+    """
+    times = []
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        result = join()
+        times.append(time.perf_counter() - start)
+    return result, min(times) * 1000
+
+
+def main() -> None:
+    """
+    Measures the memory and the joins and checks that both ways give the same result.
+    """
+    flight_data = FlightData(lazy=True)
+    routes = flight_data.routes_df
+    airports = flight_data.airports_df
+    airport_index = flight_data.airport_index
+    airplanes = flight_data.airplanes_df
+
+    start = time.perf_counter()
+    table = RouteTable(routes, airports, airport_index)
+    build_time = (time.perf_counter() - start) * 1000
+    leftovers = routes.assign(
+        IATA_x=airport_index["IATA"].reindex(routes["Source airport"]).to_numpy(),
+        IATA_y=airport_index["IATA"].reindex(routes["Destination airport"]).to_numpy(),
+    )
+    leftover_mb = leftovers.memory_usage(deep=True).sum() / 1e6
+    routes_mb = routes.memory_usage(deep=True).sum() / 1e6
+    print(f"Routes: {len(table)}, airports: {len(table.airport_codes)}")
+    print(f"routes_df with IATA_x and IATA_y: {leftover_mb:8.2f} MB")
+    print(f"routes_df:                        {routes_mb:8.2f} MB")
+    print(f"RouteTable:                       {table.nbytes / 1e6:8.2f} MB")
+    print(f"Building the table:               {build_time:8.1f} ms")
+
+    strings, string_time = fastest(
+        lambda: airport_index["Country"].reindex(routes["Source airport"]).to_numpy()
+    )
+    ids, id_time = fastest(lambda: table.airport_values(airports["Country"], table.source))
+    assert (pd.Series(strings, dtype=object).fillna("") == pd.Series(ids).fillna("")).all()
+    print(f"Source countries, codes:          {string_time:8.1f} ms")
+    print(f"Source countries, IDs:            {id_time:8.1f} ms")
+
+    def merge_models() -> pd.DataFrame:
+        equipment = routes["Equipment"].astype(object).str.split(" ").reset_index(drop=True)
+        equipment = equipment.explode().dropna()
+        exploded = pd.DataFrame(
+            {"Route": equipment.index.to_numpy(), "Equipment": equipment.to_numpy()}
+        )
+        return exploded.merge(
+            airplanes[["Name", "IATA code"]], left_on="Equipment", right_on="IATA code"
+        )[["Route", "Name"]]
+
+    merged, merge_time = fastest(merge_models)
+    looked_up, lookup_time = fastest(lambda: table.equipment_models(airplanes))
+    order = ["Route", "Name"]
+    assert np.array_equal(
+        merged.sort_values(order).to_numpy(), looked_up[order].sort_values(order).to_numpy()
+    )
+    print(f"Airplane models, codes:           {merge_time:8.1f} ms")
+    print(f"Airplane models, IDs:             {lookup_time:8.1f} ms")
+
+    _, frame_time = fastest(table.to_frame)
+    print(f"Materializing routes_df:          {frame_time:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
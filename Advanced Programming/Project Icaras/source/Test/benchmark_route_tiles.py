@@ -0,0 +1,70 @@
+"""
+This module benchmarks the world route map: all routes embedded in the map as one
+GeoJSON layer against the level-of-detail tiles of plot_world_routes. It prints the
+time to build and render each map, the size of the HTML, and for the tiles the time
+to write them, their size and the number of lines per level and per tile. One
+folium object per route is left out, as rendering 67k of them takes minutes.
+
+The benchmark is not part of the pytest suite. Run it from the source directory with:
+    python -m Test.benchmark_route_tiles
+"""
+
+import json
+import os
+import tempfile
+import time
+
+import folium
+
+from flightclass.flight import FlightData
+from Functions.map_layers import add_route_layer, route_feature_collection
+
+
+def main(max_zoom: int = 6) -> None:
+    """
+    Builds and renders the world map both ways and prints the measurements.
+    """
+    flight_data = FlightData(lazy=True, result_cache_size=0)
+    routes = flight_data.routes_df
+    routes = routes[routes["Source latitude"].notna() & routes["Destination latitude"].notna()]
+    print(f"Routes: {len(routes)}")
+
+    start = time.perf_counter()
+    world_map = folium.Map(location=[20, 0], zoom_start=2)
+    add_route_layer(
+        world_map,
+        route_feature_collection(
+            routes["Source latitude"],
+            routes["Source longitude"],
+            routes["Destination latitude"],
+            routes["Destination longitude"],
+            ["blue"] * len(routes),
+        ),
+    )
+    html = world_map.get_root().render()
+    print(f"Embedded GeoJSON:  {time.perf_counter() - start:8.2f} s, {len(html) / 1e6:8.2f} MB")
+
+    with tempfile.TemporaryDirectory() as directory:
+        start = time.perf_counter()
+        world_map = flight_data.plot_world_routes(directory, max_zoom=max_zoom)
+        html = world_map.get_root().render()
+        print(f"Tiles:             {time.perf_counter() - start:8.2f} s, {len(html) / 1e6:8.2f} MB")
+
+        with open(os.path.join(directory, "index.json"), encoding="utf-8") as file:
+            index = json.load(file)
+        for zoom, tiles in index["tiles"].items():
+            sizes, lines = [], []
+            for tile in tiles:
+                path = os.path.join(directory, zoom, f"{tile}.geojson")
+                sizes.append(os.path.getsize(path))
+                with open(path, encoding="utf-8") as file:
+                    lines.append(len(json.load(file)["features"]))
+            print(
+                f"Level {zoom}: {index['edges'][zoom]:6d} lines, {len(tiles):5d} tiles, "
+                f"{sum(sizes) / 1e6:6.2f} MB, at most {max(lines, default=0):5d} lines "
+                f"and {max(sizes, default=0) / 1e3:6.1f} kB per tile"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+This module benchmarks a sweep of the emission reduction over 240 countries,
+50 thresholds, 10 train to plane ratios and both internal settings: a call of
+country_flights and haul_summary per country, threshold and internal setting, as
+plot_country_flights computes them, against the single pass of
+FlightData.emission_scenarios over the departures.
+
+The calls one by one are timed for a sample of countries and extrapolated, as the
+full sweep takes minutes that way.
+
+The benchmark is not part of the pytest suite. Run it from the source directory with:
+    python -m Test.benchmark_scenarios
+"""
+
+import time
+
+import numpy as np
+
+from flightclass.flight import FlightData
+from Functions.emissions import country_flights, emission_reduction, haul_summary
+
+THRESHOLDS = np.linspace(100, 5000, 50)
+RATIOS = np.linspace(0.05, 0.5, 10)
+SAMPLE = 5  # Number of countries whose scenarios are computed one by one
+
+
+def main() -> None:
+    """
+    Runs the sweep both ways, checks that the sampled scenarios agree and prints
+    the times and the scenarios per second.
+    """
+    flight_data = FlightData()
+    countries = sorted(flight_data.airports_df["Country"].dropna().astype(str).unique())[:240]
+    sample = countries[:: max(len(countries) // SAMPLE, 1)][:SAMPLE]
+
+    start = time.perf_counter()
+    flight_data.departures()
+    table_time = time.perf_counter() - start
+    start = time.perf_counter()
+    scenarios = flight_data.emission_scenarios(countries, THRESHOLDS, RATIOS)
+    sweep_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    expected = {}
+    for country in sample:
+        for threshold in THRESHOLDS:
+            for internal in [False, True]:
+                flights = country_flights(
+                    flight_data.airports_df,
+                    flight_data.routes_df,
+                    flight_data.airport_index,
+                    country,
+                    threshold=threshold,
+                    internal=internal,
+                )
+                summary = haul_summary(flights)
+                for ratio in RATIOS:
+                    expected[country, threshold, ratio, internal] = emission_reduction(
+                        summary.at[0, "sh_dist"], summary.at[0, "lh_dist"], ratio
+                    )
+    loop_time = (time.perf_counter() - start) * len(countries) / len(sample)
+
+    found = scenarios.set_index(["Country", "threshold", "train_plane_ratio", "internal"])
+    for key, reduction in expected.items():
+        assert np.isclose(found.at[key, "emission_reduction"], reduction, equal_nan=True), key
+
+    print(f"Scenarios:                        {len(scenarios):10d}")
+    print(f"One by one (extrapolated):        {loop_time:10.1f} s")
+    print(f"Departure table:                  {table_time * 1000:10.1f} ms")
+    print(f"Sweep:                            {sweep_time * 1000:10.1f} ms")
+    print(f"Scenarios per second:             {len(scenarios) / sweep_time:10.0f}")
+    print(f"Speedup:                          {loop_time / (table_time + sweep_time):10.0f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""
+This module benchmarks finding airports near a location: a Python loop that calls
+distance for every airport against the spatial index of FlightData, for radius and
+nearest neighbour queries. It also times the blocked many-to-many distance matrix
+between all airports.
+
+The benchmark is not part of the pytest suite. Run it from the source directory with:
+    python -m Test.benchmark_spatial
+"""
+
+import time
+
+import numpy as np
+
+from flightclass.flight import FlightData
+from Functions.distances import distance, distance_blocks
+
+
+def loop_within(airports_df, latitude: float, longitude: float, radius_km: float) -> list:
+    """
+    Finds the airports within a radius with a Python loop over distance.
+    """
+    return [
+        label
+        for label, airport_lat, airport_long in zip(
+            airports_df.index, airports_df["Latitude"], airports_df["Longitude"]
+        )
+        if distance(latitude, longitude, airport_lat, airport_long) <= radius_km
+    ]
+
+
+def main(queries: int = 200, radius_km: float = 250, seed: int = 0) -> None:
+    """
+    Times both ways of answering the queries, checks that they agree and prints the
+    time per query.
+    """
+    flight_data = FlightData(lazy=True)
+    airports_df = flight_data.airports_df
+    rng = np.random.default_rng(seed)
+    sample = airports_df.sample(queries, random_state=seed)
+    latitudes = sample["Latitude"].to_numpy() + rng.uniform(-1, 1, queries)
+    longitudes = sample["Longitude"].to_numpy() + rng.uniform(-1, 1, queries)
+
+    start = time.perf_counter()
+    spatial_index = flight_data.spatial_index
+    build_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    loop_results = [
+        loop_within(airports_df, lat, long, radius_km) for lat, long in zip(latitudes, longitudes)
+    ]
+    loop_time = (time.perf_counter() - start) / queries
+
+    start = time.perf_counter()
+    index_results = [
+        spatial_index.within(lat, long, radius_km) for lat, long in zip(latitudes, longitudes)
+    ]
+    index_time = (time.perf_counter() - start) / queries
+    for expected, found in zip(loop_results, index_results):
+        assert sorted(expected) == sorted(found.index)
+
+    start = time.perf_counter()
+    spatial_index.nearest(latitudes, longitudes, k=5)
+    nearest_time = (time.perf_counter() - start) / queries
+
+    start = time.perf_counter()
+    for _ in distance_blocks(
+        airports_df["Latitude"],
+        airports_df["Longitude"],
+        airports_df["Latitude"],
+        airports_df["Longitude"],
+        block_size=512,
+    ):
+        pass
+    matrix_time = time.perf_counter() - start
+
+    print(f"Airports:                          {len(airports_df):10d}")
+    print(f"Building the index:                {build_time * 1000:10.2f} ms")
+    print(f"Radius {radius_km:g} km, loop over distance: {loop_time * 1000:10.3f} ms per query")
+    print(f"Radius {radius_km:g} km, spatial index:      {index_time * 1000:10.3f} ms per query")
+    print(f"Speedup:                           {loop_time / index_time:10.1f}x")
+    print(f"5 nearest, spatial index:          {nearest_time * 1000:10.3f} ms per query")
+    print(f"All-pairs matrix in 512-row blocks: {matrix_time:9.2f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+This module benchmarks the top airplane model counts of plot_top_models for every
+country: the former copy, split, stack, value_counts and merge over all routes per
+query against lookups in the equipment cube of FlightData.
+
+The benchmark is not part of the pytest suite. Run it from the source directory with:
+    python -m Test.benchmark_top_models
+"""
+
+import time
+
+import pandas as pd
+
+from flightclass.flight import FlightData
+from Functions.equipment import EquipmentCube
+
+
+def split_path(flight_data: FlightData, countries: list, top_n: int = 10) -> pd.Series:
+    """
+    Counts the top models with the former implementation of plot_top_models,
+    without drawing the chart.
+    """
+    routes = flight_data.routes_df.copy()
+    airports_df = flight_data.airports_df
+    airports_in_countries = airports_df[airports_df["Country"].isin(countries)]
+    routes = routes[
+        (routes["Source airport"].isin(airports_in_countries["IATA"]))
+        | (routes["Destination airport"].isin(airports_in_countries["IATA"]))
+    ]
+    expanded_equipment = (
+        routes["Equipment"].str.split(" ", expand=True).stack().reset_index(level=1, drop=True)
+    )
+    route_counts = (
+        expanded_equipment.value_counts().rename_axis("IATA code").reset_index(name="Counts")
+    )
+    model_counts = route_counts.merge(flight_data.airplanes_df, on="IATA code")
+    return model_counts.groupby("Name")["Counts"].sum().sort_values(ascending=False).head(top_n)
+
+
+def main() -> None:
+    """
+    Runs the query for every country with both implementations, checks that they
+    agree and prints the time per query and the time to build the cube.
+    """
+    flight_data = FlightData()
+    countries = sorted(flight_data.airports_df["Country"].dropna().unique())
+
+    start = time.perf_counter()
+    # The route table is built here as well, as the cube joins through it
+    cube = EquipmentCube(
+        flight_data.route_table, flight_data.airports_df, flight_data.airplanes_df
+    )
+    build_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    split_results = [split_path(flight_data, [country]) for country in countries]
+    split_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    cube_results = [cube.top_models([country]) for country in countries]
+    cube_time = time.perf_counter() - start
+
+    for country, expected, result in zip(countries, split_results, cube_results):
+        # Models with the same count may be ordered differently, so compare counts
+        assert sorted(expected.to_numpy()) == sorted(result.to_numpy()), country
+
+    print(f"Countries:                  {len(countries):10d}")
+    print(f"Building the cube:          {build_time * 1000:10.2f} ms")
+    print(f"Split and merge per query:  {split_time / len(countries) * 1000:10.3f} ms")
+    print(f"Cube lookup per query:      {cube_time / len(countries) * 1000:10.3f} ms")
+    print(f"Speedup:                    {split_time / cube_time:10.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,16 @@
+"""
+This module contains the pytest fixtures that the tests share.
+"""
+
+import pytest
+
+from Test.fixtures import write_snapshot
+
+
+@pytest.fixture(name="snapshot_zip")
+def fixture_snapshot_zip(tmp_path):
+    """
+    Writes a zip file of the snapshot of Test/fixtures.py, with four airports in
+    two countries and four routes.
+    """
+    return write_snapshot(tmp_path / "flight_data.zip")
@@ -0,0 +1,125 @@
+"""
+This module contains the tables of a small snapshot of the flight data that the
+tests share, and functions to write them to a zip file or to set them on a
+FlightData without reading any file.
+The snapshot has one airline, three airplanes, four airports in Germany and
+Portugal and four routes of the airline between them.
+"""
+
+import zipfile
+
+import pandas as pd
+
+from flightclass.flight import FlightData
+
+AIRLINES = pd.DataFrame(
+    {
+        "Airline ID": [1],
+        "Name": ["Test Air"],
+        "Alias": ["\\N"],
+        "IATA": ["TA"],
+        "ICAO": ["TAA"],
+        "Callsign": ["TEST"],
+        "Country": ["Germany"],
+        "Active": ["Y"],
+    }
+)
+AIRPLANES = pd.DataFrame(
+    {
+        "Name": ["Airbus A320", "Boeing 737-800", "Canadair CRJ200"],
+        "IATA code": ["320", "738", "CR2"],
+        "ICAO code": ["A320", "B738", "CRJ2"],
+    }
+)
+AIRPORTS = pd.DataFrame(
+    {
+        "Airport ID": [1, 2, 3, 4],
+        "Name": ["Dusseldorf", "Frankfurt", "Lisbon", "Porto"],
+        "City": ["Dusseldorf", "Frankfurt", "Lisbon", "Porto"],
+        "Country": ["Germany", "Germany", "Portugal", "Portugal"],
+        "IATA": ["DUS", "FRA", "LIS", "OPO"],
+        "ICAO": ["EDDL", "EDDF", "LPPT", "LPPR"],
+        "Latitude": [51.29, 50.03, 38.78, 41.24],
+        "Longitude": [6.77, 8.57, -9.14, -8.68],
+        "Altitude": [147, 364, 374, 228],
+        "Timezone": [1, 1, 0, 0],
+        "DST": ["E", "E", "E", "E"],
+        "Tz database time zone": ["Europe/Berlin"] * 2 + ["Europe/Lisbon"] * 2,
+        "Type": ["airport"] * 4,
+        "Source": ["OurAirports"] * 4,
+    }
+)
+ROUTES = pd.DataFrame(
+    {
+        "Airline": ["TA"] * 4,
+        "Airline ID": [1] * 4,
+        "Source airport": ["DUS", "FRA", "LIS", "OPO"],
+        "Source airport ID": [1, 2, 3, 4],
+        "Destination airport": ["FRA", "LIS", "OPO", "DUS"],
+        "Destination airport ID": [2, 3, 4, 1],
+        "Codeshare": [None] * 4,
+        "Stops": [0] * 4,
+        "Equipment": ["320", "320 738", "CR2", "738"],
+    }
+)
+
+
+def write_snapshot(path, airports: pd.DataFrame = AIRPORTS, routes: pd.DataFrame = ROUTES) -> str:
+    """
+    Writes a zip file of the snapshot, with the given airports and routes.
+
+    Parameters
+    ------------
+    path: str or pathlib.Path
+        The path of the zip file.
+    airports: pandas.DataFrame, optional
+        The airports of the snapshot. By default AIRPORTS.
+    routes: pandas.DataFrame, optional
+        The routes of the snapshot. By default ROUTES.
+
+    Returns
+    ---------
+    str
+        The path of the zip file.
+    """
+    tables = {
+        "airlines.csv": AIRLINES,
+        "airplanes.csv": AIRPLANES,
+        "airports.csv": airports,
+        "routes.csv": routes,
+    }
+    with zipfile.ZipFile(path, "w") as archive:
+        for name, table in tables.items():
+            archive.writestr(name, table.reset_index(drop=True).to_csv())
+    return str(path)
+
+
+def make_flight_data(
+    airlines: pd.DataFrame = None,
+    airplanes: pd.DataFrame = None,
+    airports: pd.DataFrame = None,
+    routes: pd.DataFrame = None,
+) -> FlightData:
+    """
+    Creates a lazy FlightData and sets the given tables, without reading any file.
+
+    Parameters
+    ------------
+    airlines, airplanes, airports, routes: pandas.DataFrame, optional
+        The tables to set. The other tables are not set.
+
+    Returns
+    ---------
+    FlightData
+        The FlightData with the tables.
+    """
+    flight_data = FlightData(lazy=True)
+    for name, table in [
+        ("airlines_df", airlines),
+        ("airplanes_df", airplanes),
+        ("airports_df", airports),
+        ("routes_df", routes),
+    ]:
+        if table is not None:
+            setattr(flight_data, name, table)
+    return flight_data
@@ -0,0 +1,143 @@
+"""
+This module contains tests for the airlines.py module and the airline methods of
+FlightData.
+The tests are:
+    1. Test that the airline index finds the routes of each airline in their order,
+    without the routes missing an Airline ID, and raises a ValueError for an airline
+    without routes.
+    2. Test that the countries served and the fleet mix of an airline are counted
+    per route.
+    3. Test that an airline is found by its ID, IATA code or name, summarized and
+    drawn on a new map per call, and that an unknown airline raises a ValueError.
+    4. Test that the airlines are ranked by the PageRank of the airports they serve
+    in the whole route network, without computing the betweenness.
+
+The tests are run by running the command `pytest` in the terminal.
+"""
+
+import folium
+import pandas as pd
+import pytest
+
+from Functions.airlines import AirlineIndex, fleet_mix, served_countries
+from Functions.network import airline_table, hub_table
+from Functions.route_table import RouteTable
+from Test.fixtures import AIRPLANES, AIRPORTS, make_flight_data
+
+AIRPORT_INDEX = AIRPORTS.set_index("IATA", drop=False)
+AIRLINES = pd.DataFrame(
+    {
+        "Airline ID": [1, 2],
+        "Name": ["Test Air", "Other Air"],
+        "IATA": ["TA", "TB"],
+        "ICAO": ["TAA", "TBB"],
+        "Country": ["Germany", "Portugal"],
+    }
+)
+
+
+@pytest.fixture(name="routes")
+def fixture_routes():
+    """
+    Creates five routes of airlines 2 and 1, in mixed order, and one route without
+    an Airline ID, with their coordinates and distances.
+    """
+    return pd.DataFrame(
+        {
+            "Airline": ["TB", "TA", "TB", "TA", "TA", "XX"],
+            "Airline ID": ["2", "1", "2", "1", "1", "\\N"],
+            "Source airport": ["DUS", "DUS", "LIS", "FRA", "LIS", "DUS"],
+            "Source airport ID": [1, 1, 3, 2, 3, 1],
+            "Destination airport": ["FRA", "LIS", "OPO", "LIS", "OPO", "OPO"],
+            "Destination airport ID": [2, 3, 4, 3, 4, 4],
+            "Codeshare": [None] * 6,
+            "Stops": [0] * 6,
+            "Equipment": ["320", "320 738", "CR2", "738", "XYZ", "320"],
+            "Source latitude": [51.29, 51.29, 38.78, 50.03, 38.78, 51.29],
+            "Source longitude": [6.77, 6.77, -9.14, 8.57, -9.14, 6.77],
+            "Destination latitude": [50.03, 38.78, 41.24, 38.78, 41.24, 41.24],
+            "Destination longitude": [8.57, -9.14, -8.68, -9.14, -8.68, -8.68],
+            "distance_km": [180.0, 1900.0, 275.0, 1850.0, 275.0, 1600.0],
+        }
+    )
+
+
+def test_one(routes):
+    """
+    Test that the airline index finds the routes of each airline in their order,
+    without the routes missing an Airline ID, and raises a ValueError for an airline
+    without routes.
+    """
+    index = AirlineIndex(routes)
+    assert index.airline_ids.tolist() == [1, 2]
+    assert index.positions(1).tolist() == [1, 3, 4]
+    assert index.positions(2).tolist() == [0, 2]
+    assert index.route_counts().to_dict() == {1: 3, 2: 2}
+    assert 3 not in index
+    with pytest.raises(ValueError):
+        index.positions(3)
+
+
+def test_two(routes):
+    """
+    Test that the countries served and the fleet mix of an airline are counted
+    per route.
+    """
+    airline_routes = routes.iloc[[1, 3, 4]]
+    assert served_countries(airline_routes, AIRPORT_INDEX).to_dict() == {
+        "Portugal": 3,
+        "Germany": 2,
+    }
+    # The unknown code XYZ is left out
+    table = RouteTable(routes, AIRPORTS, AIRPORT_INDEX)
+    assert fleet_mix(table, [1, 3, 4], AIRPLANES).to_dict() == {
+        "Boeing 737-800": 2,
+        "Airbus A320": 1,
+    }
+
+
+def test_three(routes):
+    """
+    Test that an airline is found by its ID, IATA code or name, summarized and
+    drawn on a new map per call, and that an unknown airline raises a ValueError.
+    """
+    flight_data = make_flight_data(AIRLINES, AIRPLANES, AIRPORTS, routes)
+
+    summary = flight_data.airline_summary("TA")
+    assert summary["Airline ID"] == 1
+    assert summary["Name"] == "Test Air"
+    assert (summary["Routes"], summary["Airports"], summary["Countries"]) == (3, 4, 2)
+    assert summary["Total distance_km"] == 4025.0
+    assert summary["Median distance_km"] == 1850.0
+    assert summary["Model"] == "Boeing 737-800"
+    assert flight_data.airline_routes("Other Air").equals(routes.iloc[[0, 2]])
+    assert flight_data.airline_fleet(2).to_dict() == {"Airbus A320": 1, "Canadair CRJ200": 1}
+
+    airline_map = flight_data.plot_airline_network(1, render="geojson")
+    assert "MultiLineString" in airline_map.get_root().render()
+    # Each call builds a new map from the cached routes, so a changed map is not reused
+    folium.Marker([0, 0], tooltip="Added marker").add_to(airline_map)
+    new_map = flight_data.plot_airline_network(1, render="geojson")
+    assert new_map is not airline_map
+    assert "Added marker" not in new_map.get_root().render()
+    assert flight_data.cache_info().hits >= 1
+    with pytest.raises(ValueError):
+        flight_data.airline_summary("ZZ")
+
+
+def test_four(routes, monkeypatch):
+    """
+    Test that airline_hubs ranks the airlines by the PageRank of the hub table
+    without computing the betweenness.
+    """
+    flight_data = make_flight_data(AIRLINES, airports=AIRPORTS, routes=routes)
+    expected = airline_table(routes, hub_table(routes)["PageRank"])
+
+    def no_betweenness(*args, **kwargs):
+        raise AssertionError("airline_hubs computed the betweenness.")
+
+    monkeypatch.setattr("Functions.network.betweenness", no_betweenness)
+    hubs = flight_data.airline_hubs().set_index("Airline ID")
+    assert hubs.loc[1, "Name"] == "Test Air"
+    assert hubs.loc[1, "Hub IATA"] == "LIS"
+    pd.testing.assert_series_equal(hubs["PageRank"], expected["PageRank"])
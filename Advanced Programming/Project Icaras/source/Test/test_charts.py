@@ -0,0 +1,62 @@
+"""
+This module contains tests for the charts.py module.
+The tests are:
+    1. Test that the distance histogram counts every flight with a distance once.
+    2. Test that charts are rendered to PNG and SVG bytes without pyplot.
+    3. Test that an unknown image format raises a ValueError.
+
+The tests are run by running the command `pytest` in the terminal.
+"""
+
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from Functions.charts import (
+    distance_histogram,
+    draw_distance_histogram,
+    draw_top_models,
+    render_chart,
+)
+
+
+def test_one():
+    """
+    Test that the distance histogram counts every flight with a distance once.
+    """
+    distances = [100.0, 250.0, np.nan, 900.0, 1000.0]
+    histogram = distance_histogram(distances, bins=4)
+    assert len(histogram) == 4
+    assert histogram["Flights"].sum() == 4
+    assert histogram["Bin start"].iloc[0] == 100.0
+    assert histogram["Bin end"].iloc[-1] == 1000.0
+    assert histogram["Flights"].tolist() == [2, 0, 0, 2]
+
+
+def test_two():
+    """
+    Test that charts are rendered to PNG and SVG bytes without pyplot.
+    """
+    already_imported = "matplotlib.pyplot" in sys.modules
+    histogram = distance_histogram(np.linspace(0, 5000, 50), bins=10)
+    png = render_chart(draw_distance_histogram, histogram, image_format="png")
+    assert png.startswith(b"\x89PNG")
+
+    model_counts = pd.DataFrame(
+        {"Counts": [5, 3]}, index=pd.Index(["Airbus A320", "Boeing 737"], name="Model")
+    )
+    svg = render_chart(draw_top_models, model_counts, "Top 2", image_format="svg")
+    assert b"<svg" in svg
+    if not already_imported:
+        assert "matplotlib.pyplot" not in sys.modules
+
+
+def test_three():
+    """
+    Test that an unknown image format raises a ValueError.
+    """
+    histogram = distance_histogram([1.0, 2.0], bins=2)
+    with pytest.raises(ValueError):
+        render_chart(draw_distance_histogram, histogram, image_format="gif")
@@ -0,0 +1,93 @@
+"""
+This module contains tests for the deltas.py module and FlightData.apply_delta.
+The tests are:
+    1. Test that rows are matched by value, repeated rows in order, whatever the
+    categories of categorical columns and with missing values.
+    2. Test that unmatched rows are counted as added, removed or changed by key.
+    3. Test that applying a new snapshot gives the tables of a FlightData of the
+    snapshot, updates the equipment cube in place and keeps everything else when
+    nothing changed.
+
+The tests are run by running the command `pytest` in the terminal.
+"""
+
+import numpy as np
+import pandas as pd
+
+from flightclass.flight import TABLE_NAMES, FlightData
+from Functions.deltas import count_changes, match_rows, unmatched
+from Test.fixtures import AIRPORTS, ROUTES, write_snapshot
+
+
+def test_one():
+    """
+    Test that rows are matched by value, repeated rows in order, whatever the
+    categories of categorical columns and with missing values.
+    """
+    old = pd.DataFrame(
+        {
+            "Code": pd.Categorical(["A", "B", "A", "C"]),
+            "Value": [1.0, np.nan, 1.0, 3.0],
+        }
+    )
+    new = pd.DataFrame(
+        {
+            "Code": pd.Categorical(["A", "D", "B", "A", "A"]),
+            "Value": [1.0, 4.0, np.nan, 1.0, 1.0],
+        }
+    )
+    matches = match_rows(old, new, ["Code", "Value"])
+    assert matches.tolist() == [0, -1, 1, 2, -1]
+    assert unmatched(matches, len(old)).tolist() == [3]
+
+
+def test_two():
+    """
+    Test that unmatched rows are counted as added, removed or changed by key.
+    """
+    old_rows = pd.DataFrame({"ID": [1, 2, 3], "Name": ["a", "b", "c"]})
+    new_rows = pd.DataFrame({"ID": [2, 4], "Name": ["B", "d"]})
+    assert count_changes(old_rows, new_rows, ["ID"]) == (1, 2, 1)
+
+
+def test_three(tmp_path):
+    """
+    Test that applying a new snapshot gives the tables of a FlightData of the
+    snapshot, updates the equipment cube in place and keeps everything else when
+    nothing changed.
+    """
+    old_file = write_snapshot(tmp_path / "old.zip", AIRPORTS, ROUTES)
+    flight_data = FlightData(file=old_file, download=False, cache_dir=str(tmp_path / "cache"))
+    equipment_cube = flight_data.equipment_cube
+    route_graph = flight_data.route_graph
+
+    info = flight_data.apply_delta(old_file)
+    assert info == (0, 0, 0, 0, 0, 0, 0)
+    assert flight_data.route_graph is route_graph
+
+    # Porto moves, Lisbon is removed, Faro is added and one route changes airplanes
+    airports = AIRPORTS.copy()
+    airports.loc[3, "Latitude"] = 41.0
+    airports = pd.concat(
+        [
+            airports.drop(index=2),
+            AIRPORTS.iloc[[2]].assign(
+                **{"Airport ID": 5, "Name": "Faro", "City": "Faro", "IATA": "FAO", "ICAO": "LPFR"}
+            ),
+        ]
+    )
+    routes = ROUTES.copy()
+    routes.loc[0, "Equipment"] = "738"
+    new_file = write_snapshot(tmp_path / "new.zip", airports, routes)
+    info = flight_data.apply_delta(new_file)
+    assert (info.airports_added, info.airports_removed, info.airports_changed) == (1, 1, 1)
+    assert (info.routes_added, info.routes_removed, info.routes_changed) == (0, 0, 1)
+    # The changed route and the routes from and to Lisbon and Porto
+    assert info.routes_enriched == 4
+    assert flight_data.equipment_cube is equipment_cube
+
+    expected = FlightData(file=new_file, download=False, use_cache=False)
+    for name in TABLE_NAMES:
+        pd.testing.assert_frame_equal(getattr(flight_data, name), getattr(expected, name))
+    assert flight_data.top_models(["Germany"]).equals(expected.top_models(["Germany"]))
+    assert flight_data.file == new_file
@@ -6,6 +6,13 @@ The tests are:
     3. Test that the function returns the correct distance between two points.
     Here, we test the case where the two points are the same.
 
+Two further tests cover the vectorized distance_many function:
+    4. Test that distance_many agrees with distance for arrays of points.
+    5. Test that distance_many returns NaN for pairs with missing coordinates.
+
+A last test covers the blocked many-to-many distance_matrix function:
+    6. Test that distance_matrix gives the same matrix for any block size.
+
 The tests are run by running the command `pytest` in the terminal.
 
 The expected output is:
@@ -44,10 +51,11 @@ The tests are run by running the command `pytest` in the terminal.
 """
 
 import sys
+import numpy as np
 import pytest
 
 sys.path.append("./Functions/")
-from Functions.distances import distance
+from Functions.distances import distance, distance_many, distance_matrix
 
 
 def test_one():
@@ -86,3 +94,41 @@ def test_three():
         distance(coord_fra[0], coord_fra[1], coord_fra[0], coord_fra[1])
         == test_distance
     )
+
+
+def test_four():
+    """
+    Test that distance_many returns the same distances as distance for arrays of points.
+    """
+    lats1 = [51.289501, 50.033333, 55.751244]
+    lons1 = [6.766780000000001, 8.570556, 37.618423]
+    lats2 = [32.7336006165, 50.033333, 59.93863]
+    lons2 = [-117.190002441, 8.570556, 30.31413]
+    expected = [
+        distance(lat1, lon1, lat2, lon2)
+        for lat1, lon1, lat2, lon2 in zip(lats1, lons1, lats2, lons2)
+    ]
+    assert distance_many(lats1, lons1, lats2, lons2) == pytest.approx(expected)
+
+
+def test_five():
+    """
+    Test that distance_many returns NaN for pairs with a missing coordinate,
+    as happens for routes to airports that are not in the data.
+    """
+    result = distance_many([50.033333, np.nan], [8.570556, 0], [50.033333, 0], [8.570556, 0])
+    assert result[0] == 0
+    assert np.isnan(result[1])
+
+
+def test_six():
+    """
+    Test that distance_matrix gives the same matrix for any block size and that
+    its entries agree with distance.
+    """
+    lats = [51.289501, 50.033333, 55.751244, 32.7336006165, 59.93863]
+    lons = [6.766780000000001, 8.570556, 37.618423, -117.190002441, 30.31413]
+    matrix = distance_matrix(lats, lons, lats[:2], lons[:2], block_size=2)
+    assert matrix.shape == (5, 2)
+    assert matrix[3, 0] == pytest.approx(distance(lats[3], lons[3], lats[0], lons[0]))
+    np.testing.assert_allclose(matrix, distance_matrix(lats, lons, lats[:2], lons[:2]))
@@ -0,0 +1,178 @@
+"""
+This module contains tests for the download_file function in the download_zip.py module.
+The tests run against a local HTTP server that stands in for the real server and
+supports ETags, conditional requests and Range requests.
+The tests are:
+    1. Test that a file is downloaded and that an unchanged file is not downloaded again.
+    2. Test that a changed file on the server is downloaded again.
+    3. Test that an interrupted download is resumed with a Range request.
+    4. Test that a download that does not match the expected checksum is rejected.
+    5. Test that an existing file is kept when the server answers with an error.
+
+The tests are run by running the command `pytest` in the terminal.
+"""
+
+import hashlib
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.error import HTTPError
+
+import pytest
+
+from Functions.download_zip import download_file
+
+
+class FileHandler(BaseHTTPRequestHandler):
+    """
+    Serves the content of the server with an ETag, answers conditional requests
+    with 304 and Range requests with 206, or every request with the error status of
+    the server if it is set. Every request is recorded on the server.
+    """
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        """
+        Answers a GET request.
+        """
+        content = self.server.content
+        etag = '"' + hashlib.sha256(content).hexdigest()[:16] + '"'
+        self.server.requests.append(dict(self.headers))
+        if self.server.status:
+            self.send_error(self.server.status)
+            return
+
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.end_headers()
+            return
+
+        start = 0
+        range_header = self.headers.get("Range")
+        if range_header and self.headers.get("If-Range", etag) == etag:
+            start = int(range_header.split("=")[1].rstrip("-"))
+            self.send_response(206)
+            self.send_header("Content-Range", f"bytes {start}-{len(content) - 1}/{len(content)}")
+        else:
+            self.send_response(200)
+        body = content[start:]
+        self.send_header("ETag", etag)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+
+        if self.server.truncate:
+            # Simulate a connection that drops halfway through the download
+            self.server.truncate = False
+            self.wfile.write(body[: len(body) // 2])
+            self.close_connection = True
+            return
+        self.wfile.write(body)
+
+    def log_message(self, *args):  # pylint: disable=arguments-differ
+        """
+        Keeps the test output quiet.
+        """
+
+
+@pytest.fixture(name="server")
+def fixture_server():
+    """
+    Starts the local HTTP server in a background thread.
+    """
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FileHandler)
+    server.content = os.urandom(100_000)
+    server.requests = []
+    server.truncate = False
+    server.status = None
+    thread = threading.Thread(
+        target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True
+    )
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def url_of(server) -> str:
+    """
+    Returns the URL of the file on the local server.
+    """
+    return f"http://127.0.0.1:{server.server_address[1]}/flight_data.zip"
+
+
+def test_one(server, tmp_path):
+    """
+    Test that a file is downloaded and that an unchanged file is not downloaded again.
+    """
+    output_file = str(tmp_path / "downloads" / "flight_data.zip")
+    download_file(url_of(server), output_file)
+    with open(output_file, "rb") as file:
+        assert file.read() == server.content
+
+    download_file(url_of(server), output_file)
+    assert "If-None-Match" in server.requests[-1]
+    with open(output_file, "rb") as file:
+        assert file.read() == server.content
+
+
+def test_two(server, tmp_path):
+    """
+    Test that a changed file on the server is downloaded again.
+    """
+    output_file = str(tmp_path / "flight_data.zip")
+    download_file(url_of(server), output_file)
+    server.content = os.urandom(50_000)
+
+    download_file(url_of(server), output_file)
+    with open(output_file, "rb") as file:
+        assert file.read() == server.content
+
+
+def test_three(server, tmp_path):
+    """
+    Test that an interrupted download is resumed with a Range request and that the
+    output file only appears once it is complete.
+    """
+    output_file = str(tmp_path / "flight_data.zip")
+    server.truncate = True
+    with pytest.raises(ValueError):
+        download_file(url_of(server), output_file)
+    assert not os.path.exists(output_file)
+    assert os.path.getsize(output_file + ".part") == len(server.content) // 2
+
+    download_file(url_of(server), output_file)
+    assert server.requests[-1]["Range"] == f"bytes={len(server.content) // 2}-"
+    with open(output_file, "rb") as file:
+        assert file.read() == server.content
+    assert not os.path.exists(output_file + ".part")
+
+
+def test_four(server, tmp_path):
+    """
+    Test that a download that does not match the expected checksum is rejected.
+    """
+    output_file = str(tmp_path / "flight_data.zip")
+    with pytest.raises(ValueError):
+        download_file(url_of(server), output_file, sha256="0" * 64)
+    assert not os.path.exists(output_file)
+
+    download_file(url_of(server), output_file, sha256=hashlib.sha256(server.content).hexdigest())
+    assert os.path.exists(output_file)
+
+
+def test_five(server, tmp_path):
+    """
+    Test that an existing file is kept when the server answers with an error,
+    and that the error is raised when there is no file to fall back to.
+    """
+    output_file = str(tmp_path / "flight_data.zip")
+    download_file(url_of(server), output_file)
+    content = server.content
+    server.content = os.urandom(50_000)
+    server.status = 503
+
+    download_file(url_of(server), output_file)
+    with open(output_file, "rb") as file:
+        assert file.read() == content
+
+    with pytest.raises(HTTPError):
+        download_file(url_of(server), str(tmp_path / "other.zip"))
@@ -0,0 +1,79 @@
+"""
+This module contains tests for the emissions.py module.
+The tests are:
+    1. Test that the departure table lists the flights of every country with a known
+    destination, sorted by distance.
+    2. Test that the scenario sweep gives the totals and emission reduction of
+    country_flights and haul_summary for every scenario.
+
+The tests are run by running the command `pytest` in the terminal.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from Functions.emissions import (
+    country_flights,
+    departure_table,
+    haul_summary,
+    scenario_sweep,
+)
+
+
+@pytest.fixture(name="tables")
+def fixture_tables():
+    """
+    Creates four airports in two countries and six routes, one to an unknown airport.
+    """
+    airports = pd.DataFrame(
+        {
+            "IATA": ["DUS", "FRA", "LIS", "OPO"],
+            "Country": ["Germany", "Germany", "Portugal", "Portugal"],
+            "Latitude": [51.29, 50.03, 38.78, 41.24],
+            "Longitude": [6.77, 8.57, -9.14, -8.68],
+        }
+    )
+    routes = pd.DataFrame(
+        {
+            "Source airport": ["DUS", "FRA", "FRA", "LIS", "OPO", "DUS"],
+            "Destination airport": ["FRA", "DUS", "LIS", "OPO", "FRA", "XXX"],
+            "distance_km": [185.0, 185.0, 1890.0, 275.0, 1700.0, 500.0],
+        }
+    )
+    airport_index = airports.set_index(airports["IATA"].rename("Code"))
+    return airports, routes, airport_index
+
+
+def test_one(tables):
+    """
+    Test that the departure table lists the flights of every country with a known
+    destination, sorted by distance.
+    """
+    departures = departure_table(*tables)
+    assert departures["Country"].tolist() == ["Germany"] * 3 + ["Portugal"] * 2
+    assert departures["distance_km"].tolist() == [185.0, 185.0, 1890.0, 275.0, 1700.0]
+    assert departures["Internal"].tolist() == [True, True, False, True, False]
+
+
+def test_two(tables):
+    """
+    Test that the scenario sweep gives the totals and emission reduction of
+    country_flights and haul_summary for every scenario.
+    """
+    airports, routes, airport_index = tables
+    thresholds = [100, 185, 186, 1800, 2000]
+    ratios = [0.1, 0.5]
+    scenarios = scenario_sweep(
+        departure_table(*tables), ["Germany", "Portugal"], thresholds, ratios
+    )
+    assert len(scenarios) == 2 * len(thresholds) * len(ratios) * 2
+    for row in scenarios.itertuples():
+        flights = country_flights(
+            airports, routes, airport_index, row.Country, row.threshold, row.internal
+        )
+        expected = haul_summary(flights, row.train_plane_ratio).iloc[0]
+        assert (row.sh_count, row.lh_count) == (expected["sh_count"], expected["lh_count"])
+        assert np.isclose(row.sh_dist, expected["sh_dist"])
+        assert np.isclose(row.lh_dist, expected["lh_dist"])
+        assert np.isclose(row.emission_reduction, expected["emission_reduction"])
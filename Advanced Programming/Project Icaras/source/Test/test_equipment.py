@@ -0,0 +1,137 @@
+"""
+This module contains tests for the equipment.py module.
+The tests are:
+    1. Test that the worldwide counts count every airplane of every route.
+    2. Test that the counts of a set of countries count each route departing from or
+    arriving in the set once, also when it stays within the set.
+    3. Test that updating the cube to changed routes gives the counts of a new cube.
+    4. Test that FlightData.top_models takes a single country like a list of it,
+    with the same cached result.
+
+The tests are run by running the command `pytest` in the terminal.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from Functions.equipment import EquipmentCube
+from Functions.route_table import RouteTable
+from Test.fixtures import make_flight_data
+
+AIRPORTS = pd.DataFrame(
+    {
+        "Airport ID": [1, 2, 3, 4],
+        "Name": ["Dusseldorf", "Frankfurt", "Lisbon", "Madrid"],
+        "Country": ["Germany", "Germany", "Portugal", "Spain"],
+        "IATA": ["DUS", "FRA", "LIS", "MAD"],
+        "ICAO": ["EDDL", "EDDF", "LPPT", "LEMD"],
+        "Latitude": [51.29, 50.03, 38.78, 40.47],
+        "Longitude": [6.77, 8.57, -9.14, -3.56],
+    }
+)
+AIRPORT_INDEX = AIRPORTS.set_index("IATA", drop=False)
+AIRPLANES = pd.DataFrame({"Name": ["Airbus A320", "Boeing 737-800"], "IATA code": ["320", "738"]})
+
+
+def make_routes(sources: list, destinations: list, equipment: list) -> pd.DataFrame:
+    """
+    Creates routes of one airline with the columns of routes_df.
+    """
+    return pd.DataFrame(
+        {
+            "Airline": "TA",
+            "Airline ID": 1,
+            "Source airport": sources,
+            "Source airport ID": 0,
+            "Destination airport": destinations,
+            "Destination airport ID": 0,
+            "Codeshare": None,
+            "Stops": 0,
+            "Equipment": equipment,
+            "distance_km": 100.0,
+        }
+    )
+
+
+def make_table(routes: pd.DataFrame) -> RouteTable:
+    """
+    Builds the route table of routes between the airports.
+    """
+    return RouteTable(routes, AIRPORTS, AIRPORT_INDEX)
+
+
+@pytest.fixture(name="routes")
+def fixture_routes():
+    """
+    Creates five routes between three countries and an unknown airport.
+    """
+    return make_routes(
+        ["DUS", "FRA", "LIS", "MAD", "XXX"],
+        ["FRA", "LIS", "MAD", "DUS", "DUS"],
+        ["320 738", "320", "738 738", None, "320"],
+    )
+
+
+@pytest.fixture(name="cube")
+def fixture_cube(routes):
+    """
+    Creates a cube of the five routes.
+    """
+    return EquipmentCube(make_table(routes), AIRPORTS, AIRPLANES)
+
+
+def test_one(cube):
+    """
+    Test that the worldwide counts count every airplane of every route.
+    """
+    assert cube.counts().to_dict() == {"Airbus A320": 3, "Boeing 737-800": 3}
+    assert len(cube.exploded) == 6
+
+
+def test_two(cube):
+    """
+    Test that the counts of a set of countries count each route departing from or
+    arriving in the set once, also when it stays within the set.
+    """
+    assert cube.counts(["Germany"]).to_dict() == {"Airbus A320": 3, "Boeing 737-800": 1}
+    assert cube.counts(["Germany", "Portugal"]).to_dict() == {
+        "Airbus A320": 3,
+        "Boeing 737-800": 3,
+    }
+    assert list(cube.top_models(["Spain"], top_n=1).index) == ["Boeing 737-800"]
+
+
+def test_three(routes):
+    """
+    Test that updating the cube to changed routes gives the counts of a new cube.
+    """
+    cube = EquipmentCube(make_table(routes), AIRPORTS, AIRPLANES)
+    # The first route is removed, the third changes its airplanes and one is added
+    new_table = make_table(
+        make_routes(
+            ["FRA", "LIS", "MAD", "XXX", "LIS"],
+            ["LIS", "MAD", "DUS", "DUS", "FRA"],
+            ["320", "320", None, "320", "738"],
+        )
+    )
+    cube.update(new_table, AIRPORTS, AIRPLANES, np.array([1, -1, 3, 4, -1]))
+    expected = EquipmentCube(new_table, AIRPORTS, AIRPLANES)
+    pd.testing.assert_frame_equal(cube.exploded, expected.exploded)
+    pd.testing.assert_frame_equal(cube.pair_counts, expected.pair_counts)
+    for countries in [None, ["Germany"], ["Portugal", "Spain"]]:
+        assert cube.counts(countries).equals(expected.counts(countries))
+
+
+def test_four(routes):
+    """
+    Test that FlightData.top_models takes a single country like a list of it,
+    with the same cached result.
+    """
+    flight_data = make_flight_data(airplanes=AIRPLANES, airports=AIRPORTS, routes=routes)
+
+    listed = flight_data.top_models(["Germany"])
+    assert flight_data.top_models("Germany").equals(listed)
+    assert listed["Counts"].to_dict() == {"Airbus A320": 3, "Boeing 737-800": 1}
+    info = flight_data.cache_info()
+    assert (info.hits, info.misses) == (1, 1)
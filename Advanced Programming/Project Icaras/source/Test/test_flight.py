@@ -0,0 +1,39 @@
+"""
+This module contains tests for the flight.py module.
+The tests are:
+    1. Test that lookup_airport finds an airport by its IATA or ICAO code, prefers
+    the IATA code of one airport over the same ICAO code of another, and returns
+    None for an unknown code.
+
+The tests are run by running the command `pytest` in the terminal.
+"""
+
+import pandas as pd
+
+from Test.fixtures import make_flight_data
+
+
+def test_one():
+    """
+    Test that lookup_airport finds an airport by its IATA or ICAO code, prefers
+    the IATA code of one airport over the same ICAO code of another, and returns
+    None for an unknown code.
+    """
+    airports = pd.DataFrame(
+        {
+            "Airport ID": [1, 2, 3],
+            "Name": ["Dusseldorf", "Frankfurt", "Lisbon"],
+            "IATA": ["DUS", "FRA", "\\N"],
+            "ICAO": ["EDDL", "DUS", "LPPT"],
+        }
+    )
+    flight_data = make_flight_data(airports=airports)
+
+    assert flight_data.lookup_airport("FRA")["Name"] == "Frankfurt"
+    assert flight_data.lookup_airport("EDDL")["Name"] == "Dusseldorf"
+    # An airport without an IATA code is found by its ICAO code
+    assert flight_data.lookup_airport("LPPT")["Name"] == "Lisbon"
+    # DUS is the IATA code of Dusseldorf and the ICAO code of Frankfurt
+    assert flight_data.lookup_airport("DUS")["Name"] == "Dusseldorf"
+    assert flight_data.lookup_airport("XXX") is None
+    assert flight_data.lookup_airport("\\N") is None
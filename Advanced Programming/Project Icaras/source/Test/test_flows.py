@@ -0,0 +1,123 @@
+"""
+This module contains tests for the flows.py module and the country flow methods of
+FlightData.
+The tests are:
+    1. Test that the flights between countries are counted and split into short-haul
+    and long-haul flights per pair of countries, without flights to unknown airports.
+    2. Test that the summary of a country equals haul_summary of its flights, with and
+    without the flights to other countries, and that the airports are grouped by country.
+    3. Test that FlightData looks up and exports the country flows, rebuilds them when
+    the routes change and raises a ValueError for an unknown country or file type.
+
+The tests are run by running the command `pytest` in the terminal.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from Functions.emissions import country_flights, departure_table, haul_summary
+from Functions.flows import CountryFlows
+from Test.fixtures import make_flight_data
+
+AIRPORTS = pd.DataFrame(
+    {
+        "IATA": ["DUS", "LIS", "FRA", "OPO", "MAD"],
+        "ICAO": ["EDDL", "LPPT", "EDDF", "LPPR", "LEMD"],
+        "Country": ["Germany", "Portugal", "Germany", "Portugal", "Spain"],
+        "Latitude": [51.29, 38.78, 50.03, 41.24, 40.47],
+        "Longitude": [6.77, -9.14, 8.57, -8.68, -3.56],
+    }
+)
+AIRPORT_INDEX = AIRPORTS.set_index(AIRPORTS["IATA"].rename("Code"))
+
+
+@pytest.fixture(name="routes")
+def fixture_routes():
+    """
+    Creates seven routes between Germany and Portugal, one to an unknown airport.
+    """
+    return pd.DataFrame(
+        {
+            "Source airport": ["DUS", "FRA", "FRA", "LIS", "OPO", "DUS", "LIS"],
+            "Destination airport": ["FRA", "DUS", "LIS", "OPO", "FRA", "XXX", "DUS"],
+            "distance_km": [185.0, 185.0, 1890.0, 275.0, 1700.0, 500.0, 1900.0],
+        }
+    )
+
+
+@pytest.fixture(name="flows")
+def fixture_flows(routes):
+    """
+    Aggregates the routes per pair of countries.
+    """
+    return CountryFlows(departure_table(AIRPORTS, routes, AIRPORT_INDEX), AIRPORTS)
+
+
+def test_one(flows):
+    """
+    Test that the flights between countries are counted and split into short-haul
+    and long-haul flights per pair of countries, without flights to unknown airports.
+    """
+    assert flows.countries.tolist() == ["Germany", "Portugal", "Spain"]
+    assert flows.matrix("Routes").to_numpy().tolist() == [[2, 1, 0], [2, 1, 0], [0, 0, 0]]
+    assert flows.pair("Germany", "Germany").to_dict() == {
+        "Routes": 2,
+        "distance_km": 370.0,
+        "sh_count": 2,
+        "sh_dist": 370.0,
+        "lh_count": 0,
+        "lh_dist": 0.0,
+    }
+    assert flows.pair("Portugal", "Germany")["lh_dist"] == 3600.0
+    table = flows.to_frame()
+    assert list(zip(table["Source country"], table["Destination country"])) == [
+        ("Germany", "Germany"),
+        ("Germany", "Portugal"),
+        ("Portugal", "Germany"),
+        ("Portugal", "Portugal"),
+    ]
+    assert table["Routes"].sum() == 6
+    with pytest.raises(ValueError):
+        flows.matrix("Passengers")
+
+
+def test_two(flows, routes):
+    """
+    Test that the summary of a country equals haul_summary of its flights, with and
+    without the flights to other countries, and that the airports are grouped by country.
+    """
+    for country in ["Germany", "Portugal", "Spain"]:
+        for internal in [False, True]:
+            expected = haul_summary(
+                country_flights(AIRPORTS, routes, AIRPORT_INDEX, country, internal=internal)
+            )
+            pd.testing.assert_frame_equal(flows.summary(country, internal), expected)
+    assert flows.airport_positions("Germany").tolist() == [0, 2]
+    assert flows.airport_positions("Spain").tolist() == [4]
+    assert "Spain" in flows
+    with pytest.raises(ValueError):
+        flows.summary("France")
+
+
+def test_three(routes, tmp_path):
+    """
+    Test that FlightData looks up and exports the country flows, rebuilds them when
+    the routes change and raises a ValueError for an unknown country or file type.
+    """
+    flight_data = make_flight_data(airports=AIRPORTS, routes=routes)
+    assert flight_data.country_flow("Germany", "Portugal")["Routes"] == 1
+    assert flight_data.country_flow_matrix("lh_count").loc["Portugal", "Germany"] == 2
+
+    flight_data.export_country_flows(str(tmp_path / "flows.csv"))
+    exported = pd.read_csv(tmp_path / "flows.csv")
+    assert np.array_equal(exported.to_numpy(), flight_data.country_flows.to_frame().to_numpy())
+    flight_data.export_country_flows(str(tmp_path / "flows.json"))
+    assert len(pd.read_json(tmp_path / "flows.json")) == 4
+
+    flight_data.routes_df = routes.iloc[:2]
+    assert flight_data.country_flow_matrix().to_numpy().sum() == 2
+    with pytest.raises(ValueError):
+        flight_data.country_flow("Germany", "France")
+    with pytest.raises(ValueError):
+        flight_data.export_country_flows(str(tmp_path / "flows.xlsx"))
@@ -0,0 +1,60 @@
+"""
+This module contains import-time tests. Each test imports a module in a fresh
+interpreter with `python -X importtime`, which reports every module that is
+imported and how long it took.
+The tests are:
+    1. Test that importing flightclass.flight does not import the plotting, display,
+    language model and scipy libraries.
+    2. Test that importing the language model lookup does not import langchain_openai.
+
+The tests are run by running the command `pytest` in the terminal. Run
+`pytest -s Test/test_import_time.py` to also see the measured import times.
+"""
+
+import os
+import subprocess
+import sys
+
+# The libraries that are only imported when a method needs them
+HEAVY_MODULES = ["folium", "matplotlib", "branca", "IPython", "langchain_openai", "scipy"]
+SOURCE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def import_times(module: str) -> dict:
+    """
+    Imports a module in a fresh interpreter and returns the cumulative import time
+    in microseconds of every module that was imported, keyed on the module name.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=SOURCE_DIR,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+def test_one():
+    """
+    Test that importing flightclass.flight does not import the plotting, display,
+    language model and scipy libraries.
+    """
+    times = import_times("flightclass.flight")
+    print(f"\nimport flightclass.flight: {times['flightclass.flight'] / 1000:.0f} ms")
+    assert not [name for name in HEAVY_MODULES if name in times]
+
+
+def test_two():
+    """
+    Test that importing the language model lookup does not import langchain_openai.
+    """
+    times = import_times("Functions.llm_lookup")
+    print(f"\nimport Functions.llm_lookup: {times['Functions.llm_lookup'] / 1000:.0f} ms")
+    assert "langchain_openai" not in times
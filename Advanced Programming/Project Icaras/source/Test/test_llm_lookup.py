@@ -0,0 +1,157 @@
+"""
+This module contains tests for the llm_lookup.py module. The tests run against a
+local stand-in for the language model, so they need no API key or network.
+The tests are:
+    1. Test that an answer is cached on disk and reused by a new client.
+    2. Test that the cache key depends on the model and the temperature.
+    3. Test that ask_many keeps the order of the requests, asks about duplicate and
+    cached entities once and never exceeds the concurrency limit.
+    4. Test that every ask_many of a client runs on the same event loop, also when
+    it is called inside a running event loop.
+    5. Test that unknown aircraft and airport names are reported as aircraft and
+    airports, without asking the language model.
+    6. Test that cached answers are read without creating the default client, which
+    is only created for an answer that is not cached.
+
+The tests are run by running the command `pytest` in the terminal.
+"""
+
+import asyncio
+import sys
+from types import SimpleNamespace
+
+import pytest
+
+from Functions.llm_lookup import LLMLookup
+from Test.fixtures import AIRPLANES, AIRPORTS, make_flight_data
+
+
+class FakeLLM:
+    """
+    Answers every prompt with a fixed text and records the prompts, the largest
+    number of requests that were answered at the same time and the event loops
+    the asynchronous requests ran on.
+    """
+
+    def __init__(self, model_name: str = "fake-model", temperature: float = 0.1):
+        self.model_name = model_name
+        self.temperature = temperature
+        self.prompts = []
+        self.running = 0
+        self.max_running = 0
+        self.loops = set()
+
+    def invoke(self, prompt: str):
+        """
+        Answers a prompt.
+        """
+        self.prompts.append(prompt)
+        return SimpleNamespace(content=f"Answer to: {prompt}")
+
+    async def ainvoke(self, prompt: str):
+        """
+        Answers a prompt after a short wait, like a network request.
+        """
+        self.loops.add(id(asyncio.get_running_loop()))
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        await asyncio.sleep(0.01)
+        self.running -= 1
+        return self.invoke(prompt)
+
+
+def test_one(tmp_path):
+    """
+    Test that an answer is cached on disk and reused by a new client.
+    """
+    llm = FakeLLM()
+    lookup = LLMLookup(llm=llm, cache_dir=str(tmp_path))
+    answer = lookup.ask("Boeing 737-800", "Tell me about the airplane Boeing 737-800")
+    assert lookup.ask("Boeing 737-800", "Tell me about the airplane Boeing 737-800") == answer
+
+    new_lookup = LLMLookup(llm=llm, cache_dir=str(tmp_path))
+    assert new_lookup.ask("Boeing 737-800", "Tell me about the airplane Boeing 737-800") == answer
+    assert len(llm.prompts) == 1
+    assert (lookup.hits, lookup.misses, new_lookup.hits) == (1, 1, 1)
+
+
+def test_two(tmp_path):
+    """
+    Test that the cache key depends on the model and the temperature.
+    """
+    request = ("Airbus A320", "Tell me about the airplane Airbus A320")
+    for llm in [FakeLLM(), FakeLLM(model_name="other-model"), FakeLLM(temperature=0.7)]:
+        LLMLookup(llm=llm, cache_dir=str(tmp_path)).ask(*request)
+        assert len(llm.prompts) == 1
+
+
+def test_three(tmp_path):
+    """
+    Test that ask_many keeps the order of the requests, asks about duplicate and
+    cached entities once and never exceeds the concurrency limit.
+    """
+    llm = FakeLLM()
+    lookup = LLMLookup(llm=llm, cache_dir=str(tmp_path), max_concurrency=3)
+    lookup.ask("Model 0", "Prompt 0")
+    requests = [(f"Model {i}", f"Prompt {i}") for i in range(10)] + [("Model 4", "Prompt 4")]
+
+    answers = lookup.ask_many(requests)
+    assert answers == [f"Answer to: {prompt}" for _, prompt in requests]
+    assert sorted(llm.prompts) == sorted(f"Prompt {i}" for i in range(10))
+    assert llm.max_running == 3
+
+
+def test_four(tmp_path):
+    """
+    Test that every ask_many of a client runs on the same event loop, also when
+    it is called inside a running event loop.
+    """
+    llm = FakeLLM()
+    lookup = LLMLookup(llm=llm, cache_dir=str(tmp_path))
+    lookup.ask_many([("Model 0", "Prompt 0")])
+
+    async def notebook_cell():
+        return lookup.ask_many([("Model 1", "Prompt 1")])
+
+    assert asyncio.run(notebook_cell()) == ["Answer to: Prompt 1"]
+    assert len(llm.loops) == 1
+    lookup.close()
+
+
+def test_five(tmp_path):
+    """
+    Test that unknown aircraft and airport names are reported as aircraft and
+    airports, without asking the language model.
+    """
+    llm = FakeLLM()
+    flight_data = make_flight_data(airplanes=AIRPLANES, airports=AIRPORTS)
+    flight_data.llm_lookup = LLMLookup(llm=llm, cache_dir=str(tmp_path))
+
+    with pytest.raises(ValueError, match="^Aircraft Boeing 999 not found"):
+        flight_data.aircraft_info("Boeing 999")
+    with pytest.raises(ValueError, match="^Aircraft Boeing 999 not found"):
+        flight_data.aircraft_info_many(["Airbus A320", "Boeing 999"])
+    with pytest.raises(ValueError, match="^Airport Atlantis not found"):
+        flight_data.airport_info("Atlantis")
+    with pytest.raises(ValueError, match="^Airport Atlantis not found"):
+        flight_data.airport_info_many(["Atlantis"])
+    assert not llm.prompts
+
+
+def test_six(tmp_path, monkeypatch):
+    """
+    Test that cached answers are read without creating the default client, which
+    is only created for an answer that is not cached.
+    """
+    request = ("Airbus A320", "Tell me about the airplane Airbus A320")
+    LLMLookup(llm=FakeLLM(model_name="gpt-4o-mini"), cache_dir=str(tmp_path)).ask(*request)
+
+    # Without langchain_openai, as offline without an API key, creating the client fails
+    monkeypatch.setitem(sys.modules, "langchain_openai", None)
+    lookup = LLMLookup(model="gpt-4o-mini", cache_dir=str(tmp_path))
+    assert lookup.ask(*request) == f"Answer to: {request[1]}"
+    assert lookup.ask_many([request]) == [f"Answer to: {request[1]}"]
+    assert lookup.hits == 2
+    with pytest.raises(ImportError):
+        lookup.ask("Airbus A321", "Tell me about the airplane Airbus A321")
+    lookup.close()
@@ -0,0 +1,90 @@
+"""
+This module contains tests for the network.py module.
+The tests are:
+    1. Test that the adjacency matrix counts the routes between each pair of airports,
+    of all airlines or of one airline, without routes missing an airport.
+    2. Test that the hub of a star network has all of the betweenness and the most
+    PageRank, and that the ranks add up to 1.
+    3. Test that the hub table counts the routes lost and the stranded airports if an
+    airport closes, and that the airline table finds the hub of each airline.
+
+The tests are run by running the command `pytest` in the terminal.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from Functions.network import (
+    airline_table,
+    betweenness,
+    hub_table,
+    pagerank,
+    route_adjacency,
+)
+
+
+@pytest.fixture(name="routes")
+def fixture_routes():
+    """
+    Creates a star network of airline 1 around airport 1, with routes in both
+    directions to airports 2, 3 and 4, and one route of airline 2 from 4 to 5.
+    The last route has no destination airport ID.
+    """
+    return pd.DataFrame(
+        {
+            "Airline ID": [1, 1, 1, 1, 1, 1, 1, 2, 2],
+            "Source airport ID": [1, 2, 1, 3, 1, 4, 1, 4, 5],
+            "Destination airport ID": [2, 1, 3, 1, 4, 1, 2, 5, "\\N"],
+        }
+    )
+
+
+def test_one(routes):
+    """
+    Test that the adjacency matrix counts the routes between each pair of airports,
+    of all airlines or of one airline, without routes missing an airport.
+    """
+    airport_ids, adjacency = route_adjacency(routes)
+    assert airport_ids.tolist() == [1, 2, 3, 4, 5]
+    assert adjacency[0, 1] == 2
+    assert adjacency.sum() == 8
+
+    airport_ids, adjacency = route_adjacency(routes, airline_id=2)
+    assert airport_ids.tolist() == [4, 5]
+    assert adjacency.toarray().tolist() == [[0, 1], [0, 0]]
+
+
+def test_two(routes):
+    """
+    Test that the hub of a star network has all of the betweenness and the most
+    PageRank, and that the ranks add up to 1.
+    """
+    _, adjacency = route_adjacency(routes, airline_id=1)
+    np.testing.assert_allclose(betweenness(adjacency), [1.0, 0.0, 0.0, 0.0])
+    np.testing.assert_allclose(betweenness(adjacency, batch_size=3), [1.0, 0.0, 0.0, 0.0])
+    ranks = pagerank(adjacency)
+    assert ranks.sum() == pytest.approx(1.0)
+    assert ranks.argmax() == 0
+    # Airport 2 has two routes from the hub and is visited more often than 3 and 4
+    assert ranks[1] > ranks[2] == pytest.approx(ranks[3])
+
+
+def test_three(routes):
+    """
+    Test that the hub table counts the routes lost and the stranded airports if an
+    airport closes, and that the airline table finds the hub of each airline.
+    """
+    table = hub_table(routes)
+    assert table.index[0] == 1
+    assert table.loc[1, ["Destinations", "Origins"]].tolist() == [3, 3]
+    assert table.loc[1, "Routes lost"] == 7
+    assert table["Stranded airports"].to_dict() == {1: 2, 2: 0, 3: 0, 4: 1, 5: 0}
+    # Airport 4 connects airport 5 with the rest of the network
+    assert table.loc[4, "Betweenness"] > 0
+
+    airlines = airline_table(routes, table["PageRank"])
+    assert airlines.loc[1, ["Routes", "Airports", "Hub"]].tolist() == [7, 4, 1]
+    assert airlines.loc[1, "Hub share"] == 1.0
+    assert airlines.loc[2, "Routes"] == 2
+    assert airlines.index.tolist() == [1, 2]
@@ -0,0 +1,96 @@
+"""
+This module contains tests for the reading_zip.py module.
+The tests are:
+    1. Test that unzip loads every csv file of a zip file into a DataFrame.
+    2. Test that iter_csv_chunks streams a csv file in chunks that add up to the whole file.
+    3. Test that parsing the csv files in a thread or process pool gives the same dictionary.
+    4. Test that the table schemas of FlightData select the columns of each table and
+    parse them with their compact types, keeping missing IDs ("\\N") as text.
+
+The tests are run by running the command `pytest` in the terminal.
+"""
+
+import zipfile
+
+import pandas as pd
+import pytest
+
+from flightclass.flight import TABLE_COLUMNS, TABLE_DTYPES, TABLE_SCHEMAS
+from Functions.reading_zip import iter_csv_chunks, unzip
+from Test.fixtures import ROUTES, write_snapshot
+
+
+@pytest.fixture(name="zip_file")
+def fixture_zip_file(tmp_path):
+    """
+    Creates a small zip file with two csv files and a file that is not a csv file.
+    """
+    path = tmp_path / "flight_data.zip"
+    airports = pd.DataFrame({"IATA": ["DUS", "FRA", "LIS"], "Latitude": [51.3, 50.0, 38.8]})
+    routes = pd.DataFrame(
+        {
+            "Source airport": ["DUS", "FRA", "LIS", "DUS", "FRA"],
+            "Destination airport": ["FRA", "LIS", "DUS", "LIS", "DUS"],
+        }
+    )
+    with zipfile.ZipFile(path, "w") as zip_contents:
+        zip_contents.writestr("airports.csv", airports.to_csv(index=False))
+        zip_contents.writestr("routes.csv", routes.to_csv(index=False))
+        zip_contents.writestr("readme.txt", "not a csv file")
+    return str(path)
+
+
+def test_one(zip_file):
+    """
+    Test that unzip loads every csv file of a zip file into a DataFrame.
+    """
+    dataframes_dict = unzip(zip_file)
+    assert sorted(dataframes_dict) == ["airports_df", "routes_df"]
+    assert len(dataframes_dict["routes_df"]) == 5
+
+
+def test_two(zip_file):
+    """
+    Test that iter_csv_chunks streams a csv file in chunks that add up to the whole file.
+    """
+    chunks = list(iter_csv_chunks(zip_file, "routes.csv", chunksize=2))
+    assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+    pd.testing.assert_frame_equal(
+        pd.concat(chunks, ignore_index=True), unzip(zip_file)["routes_df"]
+    )
+
+
+@pytest.mark.parametrize("parallel", ["thread", "process"])
+def test_three(zip_file, parallel):
+    """
+    Test that parsing the csv files in a thread or process pool gives the same dictionary.
+    """
+    expected = unzip(zip_file)
+    dataframes_dict = unzip(zip_file, parallel=parallel)
+    assert list(dataframes_dict) == list(expected)
+    for key_name, dataframe in expected.items():
+        pd.testing.assert_frame_equal(dataframes_dict[key_name], dataframe)
+
+
+def test_four(tmp_path):
+    """
+    Test that the table schemas of FlightData select the columns of each table and
+    parse them with their compact types, keeping missing IDs ("\\N") as text.
+    """
+    routes = ROUTES.assign(Extra="not needed")
+    routes["Airline ID"] = ["1", "\\N", "1", "1"]
+    routes["Source airport ID"] = ["1", "2", "\\N", "4"]
+    zip_file = write_snapshot(tmp_path / "flight_data.zip", routes=routes)
+
+    dataframes_dict = unzip(zip_file, schemas=TABLE_SCHEMAS)
+    assert sorted(dataframes_dict) == sorted(TABLE_COLUMNS)
+    for name, dataframe in dataframes_dict.items():
+        # The index column of the csv files and the extra column are not parsed
+        assert list(dataframe.columns) == TABLE_COLUMNS[name]
+        for column, dtype in TABLE_DTYPES[name].items():
+            assert dataframe[column].dtype == dtype
+    routes_df = dataframes_dict["routes_df"]
+    assert routes_df["Airline ID"].tolist() == ["1", "\\N", "1", "1"]
+    assert routes_df["Source airport ID"].tolist() == ["1", "2", "\\N", "4"]
+    assert routes_df["Destination airport ID"].tolist() == [2, 3, 4, 1]
+    assert list(routes_df["Equipment"].cat.categories) == ["320", "320 738", "738", "CR2"]
@@ -0,0 +1,76 @@
+"""
+This module contains tests for the reports.py module.
+The tests are:
+    1. Test that country names are turned into plain directory names.
+    2. Test that the reports of every country are written with a summary, and that
+    a country without airports is recorded as failed instead of stopping the run.
+    3. Test that worker processes write the reports, and that any error of a
+    country is recorded with its traceback and the summary is still written.
+
+The tests are run by running the command `pytest` in the terminal.
+"""
+
+import os
+
+import pandas as pd
+
+from flightclass.reports import REPORT_FILES, country_slug, generate_reports
+
+
+def test_one():
+    """
+    Test that country names are turned into plain directory names.
+    """
+    assert country_slug("Germany") == "Germany"
+    assert country_slug("Cote d'Ivoire") == "Cote_d_Ivoire"
+    assert country_slug("Bosnia and Herzegovina") == "Bosnia_and_Herzegovina"
+
+
+def test_two(snapshot_zip, tmp_path):
+    """
+    Test that the reports of every country are written with a summary, and that
+    a country without airports is recorded as failed instead of stopping the run.
+    """
+    output_dir = tmp_path / "reports"
+    summary = generate_reports(
+        str(output_dir),
+        countries=["Portugal", "Germany", "Atlantis"],
+        processes=1,
+        progress=False,
+        file=snapshot_zip,
+        cache_dir=str(tmp_path / "cache"),
+        download=False,
+    )
+    assert summary.index.tolist() == ["Portugal", "Germany", "Atlantis"]
+    for country in ["Portugal", "Germany"]:
+        assert summary.loc[country, "Error"] is None
+        for file_name in REPORT_FILES.values():
+            assert os.path.getsize(output_dir / country / file_name) > 0
+    assert "Atlantis" in summary.loc["Atlantis", "Error"]
+    assert not os.path.exists(output_dir / "Atlantis")
+    assert os.path.exists(output_dir / "summary.csv")
+
+
+def test_three(snapshot_zip, tmp_path):
+    """
+    Test that worker processes write the reports, and that any error of a
+    country is recorded with its traceback and the summary is still written.
+    """
+    output_dir = tmp_path / "reports"
+    output_dir.mkdir()
+    # A file in the place of the directory of Portugal makes its report fail with an OSError
+    (output_dir / "Portugal").write_text("")
+    summary = generate_reports(
+        str(output_dir),
+        countries=["Portugal", "Germany"],
+        processes=2,
+        progress=False,
+        file=snapshot_zip,
+        cache_dir=str(tmp_path / "cache"),
+        download=False,
+    )
+    assert summary.loc["Germany", "Error"] is None
+    for file_name in REPORT_FILES.values():
+        assert os.path.getsize(output_dir / "Germany" / file_name) > 0
+    assert "FileExistsError" in summary.loc["Portugal", "Traceback"]
+    assert "FileExistsError" in pd.read_csv(output_dir / "summary.csv")["Traceback"].iloc[0]
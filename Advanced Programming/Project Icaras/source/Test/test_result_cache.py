@@ -0,0 +1,93 @@
+"""
+This module contains tests for the result_cache.py module.
+The tests are:
+    1. Test that the least recently used result is evicted when the cache is full.
+    2. Test that a cached method computes a result once for equivalent arguments
+    and counts the hits and misses.
+    3. Test that clearing the cache makes the method compute the result again.
+    4. Test that a cached DataFrame is returned as a copy, so changing it does not
+    change later results.
+
+The tests are run by running the command `pytest` in the terminal.
+"""
+
+import pandas as pd
+
+from Functions.result_cache import ResultCache, cached_method
+
+
+class Counter:
+    """
+    Counts how often its cached method computes a result.
+    """
+
+    def __init__(self, maxsize: int = 128):
+        self.result_cache = ResultCache(maxsize)
+        self.calls = 0
+
+    @cached_method
+    def total(self, values: list, offset: int = 0) -> int:
+        """
+        Returns the sum of the values plus the offset.
+        """
+        self.calls += 1
+        return sum(values) + offset
+
+    @cached_method
+    def table(self, values: list) -> pd.DataFrame:
+        """
+        Returns the values as a DataFrame.
+        """
+        self.calls += 1
+        return pd.DataFrame({"Value": values})
+
+
+def test_one():
+    """
+    Test that the least recently used result is evicted when the cache is full.
+    """
+    cache = ResultCache(maxsize=2)
+    cache.get_or_compute("a", lambda: 1)
+    cache.get_or_compute("b", lambda: 2)
+    cache.get_or_compute("a", lambda: 1)
+    cache.get_or_compute("c", lambda: 3)
+    assert cache.get_or_compute("a", lambda: None) == 1
+    assert cache.get_or_compute("b", lambda: None) is None
+    assert len(cache) == 2
+
+
+def test_two():
+    """
+    Test that a cached method computes a result once for equivalent arguments
+    and counts the hits and misses.
+    """
+    counter = Counter()
+    assert counter.total([1, 2]) == 3
+    assert counter.total((1, 2), offset=0) == 3
+    assert counter.total([1, 2], 1) == 4
+    assert counter.calls == 2
+    info = counter.result_cache.info()
+    assert (info.hits, info.misses, info.currsize) == (1, 2, 2)
+
+
+def test_three():
+    """
+    Test that clearing the cache makes the method compute the result again.
+    """
+    counter = Counter()
+    counter.total([1, 2])
+    counter.result_cache.clear()
+    counter.total([1, 2])
+    assert counter.calls == 2
+
+
+def test_four():
+    """
+    Test that a cached DataFrame is returned as a copy, so changing it does not
+    change later results.
+    """
+    counter = Counter()
+    table = counter.table([1, 2])
+    table["Value"] = 0
+    assert counter.table([1, 2])["Value"].tolist() == [1, 2]
+    assert counter.calls == 1
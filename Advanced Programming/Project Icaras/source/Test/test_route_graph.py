@@ -0,0 +1,72 @@
+"""
+This module contains tests for the route_graph.py module.
+The tests are:
+    1. Test that the shortest route and the route with the fewest flights are found.
+    2. Test that reachability stops after the given number of flights.
+    3. Test that batched queries give the same distances as single queries, also
+    after precomputing all distances.
+    4. Test that an airport without routes raises a ValueError.
+
+The tests are run by running the command `pytest` in the terminal.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from Functions.route_graph import RouteGraph
+
+
+@pytest.fixture(name="graph")
+def fixture_graph():
+    """
+    Creates a graph in which the direct flight from 1 to 4 is longer than the
+    connection through 2 and 3. Airport 5 can only be reached, not left.
+    """
+    routes = pd.DataFrame(
+        {
+            "Source airport ID": [1, 1, 2, 3, 4, 4, 1],
+            "Destination airport ID": [2, 4, 3, 4, 5, 1, 2],
+            "distance_km": [100.0, 500.0, 100.0, 100.0, 50.0, 500.0, 120.0],
+        }
+    )
+    return RouteGraph(routes)
+
+
+def test_one(graph):
+    """
+    Test that the shortest route and the route with the fewest flights are found.
+    """
+    assert graph.shortest_route(1, 4) == (300.0, [1, 2, 3, 4])
+    assert graph.fewest_hops(1, 4) == (1.0, [1, 4])
+    assert graph.shortest_route(5, 1) == (np.inf, [])
+    assert len(graph.indices) == 6
+
+
+def test_two(graph):
+    """
+    Test that reachability stops after the given number of flights.
+    """
+    assert graph.reachable(1, 1).to_dict() == {1: 0, 2: 1, 4: 1}
+    assert graph.reachable([2, 4], 1).to_dict() == {1: 1, 2: 0, 3: 1, 4: 0, 5: 1}
+
+
+def test_three(graph):
+    """
+    Test that batched queries give the same distances as single queries, also
+    after precomputing all distances.
+    """
+    sources, destinations = [1, 4, 2, 1, 5], [5, 3, 1, 4, 5]
+    expected = [graph.shortest_route(s, d)[0] for s, d in zip(sources, destinations)]
+    np.testing.assert_allclose(graph.distances(sources, destinations), expected)
+    graph.precompute()
+    np.testing.assert_allclose(graph.distances(sources, destinations), expected)
+    np.testing.assert_allclose(graph.distances([1], [5], unweighted=True), [2])
+
+
+def test_four(graph):
+    """
+    Test that an airport without routes raises a ValueError.
+    """
+    with pytest.raises(ValueError):
+        graph.shortest_route(1, 6)
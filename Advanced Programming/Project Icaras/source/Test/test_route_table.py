@@ -0,0 +1,130 @@
+"""
+This module contains tests for the route_table.py module.
+The tests are:
+    1. Test that codes are interned to dense IDs, missing codes to -1.
+    2. Test that the airplanes of the routes are stored as a CSR list of airplane IDs
+    and joined with the airplane models, a code of several models giving several rows.
+    3. Test that airport columns are joined by ID and that the materialized routes
+    equal the routes the table was built from.
+
+The tests are run by running the command `pytest` in the terminal.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from Functions.route_table import RouteTable, intern
+
+AIRPORTS = pd.DataFrame(
+    {
+        "Airport ID": [1, 2, 3],
+        "Country": ["Germany", "Germany", "Portugal"],
+        "IATA": ["DUS", "FRA", "LIS"],
+        "ICAO": ["EDDL", "EDDF", "LPPT"],
+        "Latitude": np.array([51.29, 50.03, 38.78], dtype=np.float32),
+        "Longitude": np.array([6.77, 8.57, -9.14], dtype=np.float32),
+    }
+)
+AIRPORT_INDEX = pd.concat(
+    [AIRPORTS.set_index("IATA", drop=False), AIRPORTS.set_index("ICAO", drop=False)]
+)
+AIRPLANES = pd.DataFrame(
+    {
+        "Name": ["Airbus A320", "Airbus A320neo", "Boeing 737-800"],
+        "IATA code": ["320", "320", "738"],
+        "ICAO code": ["A320", "A20N", "B738"],
+    }
+)
+
+
+@pytest.fixture(name="routes")
+def fixture_routes():
+    """
+    Creates four routes, one to the unknown airport XXX and one by its ICAO code,
+    with the coordinates and distances of routes_df.
+    """
+    routes = pd.DataFrame(
+        {
+            "Airline": pd.Categorical(["TA", "TB", "TA", "TA"]),
+            "Airline ID": [1, 2, 1, 1],
+            "Source airport": pd.Categorical(["DUS", "FRA", "LIS", "EDDL"]),
+            "Source airport ID": [1, 2, 3, 1],
+            "Destination airport": pd.Categorical(["FRA", "LIS", "XXX", "LIS"]),
+            "Destination airport ID": [2, 3, 4, 3],
+            "Codeshare": pd.Categorical([None, "Y", None, None]),
+            "Stops": [0, 0, 1, 0],
+            "Equipment": pd.Categorical(["320 738", "738", None, "320"]),
+        }
+    )
+    for prefix, code_column in [
+        ("Source", "Source airport"),
+        ("Destination", "Destination airport"),
+    ]:
+        matched = AIRPORT_INDEX.reindex(routes[code_column].astype(object))
+        routes[f"{prefix} latitude"] = matched["Latitude"].to_numpy()
+        routes[f"{prefix} longitude"] = matched["Longitude"].to_numpy()
+    routes["distance_km"] = [180.0, 1850.0, np.nan, 1900.0]
+    return routes
+
+
+@pytest.fixture(name="table")
+def fixture_table(routes):
+    """
+    Builds the route table of the routes.
+    """
+    return RouteTable(routes, AIRPORTS, AIRPORT_INDEX)
+
+
+def test_one():
+    """
+    Test that codes are interned to dense IDs, missing codes to -1.
+    """
+    vocabulary, ids = intern(pd.Series(["FRA", "DUS", None, "FRA"]))
+    assert vocabulary.tolist() == ["DUS", "FRA"]
+    assert ids.tolist() == [1, 0, -1, 1]
+    assert ids.dtype == np.int32
+
+
+def test_two(table):
+    """
+    Test that the airplanes of the routes are stored as a CSR list of airplane IDs
+    and joined with the airplane models, a code of several models giving several rows.
+    """
+    assert table.equipment_codes.tolist() == ["320", "738"]
+    assert table.equipment_indptr.tolist() == [0, 2, 3, 3, 4]
+    assert table.equipment_ids.tolist() == [0, 1, 1, 0]
+    assert table.equipment_routes().tolist() == [0, 0, 1, 3]
+    models = table.equipment_models(AIRPLANES)
+    assert sorted(zip(models["Route"], models["Name"])) == [
+        (0, "Airbus A320"),
+        (0, "Airbus A320neo"),
+        (0, "Boeing 737-800"),
+        (1, "Boeing 737-800"),
+        (3, "Airbus A320"),
+        (3, "Airbus A320neo"),
+    ]
+
+
+def test_three(table, routes):
+    """
+    Test that airport columns are joined by ID and that the materialized routes
+    equal the routes the table was built from.
+    """
+    assert table.airport_codes.tolist() == ["DUS", "EDDL", "FRA", "LIS", "XXX"]
+    assert table.airport_values(AIRPORTS["Country"], table.destination).tolist() == [
+        "Germany",
+        "Portugal",
+        None,
+        "Portugal",
+    ]
+    assert table.airport_values(AIRPORTS["Country"], table.source)[3] == "Germany"
+
+    frame = table.to_frame()
+    assert list(frame.columns) == list(routes.columns)
+    for column in routes.columns:
+        pd.testing.assert_series_equal(
+            frame[column].astype(object), routes[column].astype(object), check_names=False
+        )
+    assert frame["Source latitude"].dtype == np.float32
+    assert table.to_frame(["Airline", "Stops"]).shape == (4, 2)
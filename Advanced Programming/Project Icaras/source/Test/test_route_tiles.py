@@ -0,0 +1,139 @@
+"""
+This module contains tests for the route_tiles.py module and the world route map
+of FlightData.
+The tests are:
+    1. Test that coordinates are projected to the tile scheme of web maps and that
+    routes between the same grid cells are merged into one edge, fewer at coarse levels.
+    2. Test that an edge is assigned to the tiles of its two ends and that a tile
+    keeps the edges with the most routes.
+    3. Test that the tiles and their index are written per zoom level and that the
+    world map loads them instead of embedding the routes, writing them on every call.
+
+The tests are run by running the command `pytest` in the terminal.
+"""
+
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from Functions import route_tiles
+from Functions.route_tiles import (
+    edge_tiles,
+    inverse_mercator,
+    level_edges,
+    mercator,
+    write_route_tiles,
+)
+from Test.fixtures import make_flight_data
+
+# Düsseldorf, Frankfurt, Lisbon, Porto and New York JFK
+COORDINATES = {
+    "DUS": (51.29, 6.77),
+    "FRA": (50.03, 8.57),
+    "LIS": (38.78, -9.14),
+    "OPO": (41.24, -8.68),
+    "JFK": (40.64, -73.78),
+}
+
+
+@pytest.fixture(name="routes")
+def fixture_routes():
+    """
+    Creates seven routes, one back and forth, and one to an unknown airport.
+    """
+    sources = ["DUS", "FRA", "DUS", "LIS", "LIS", "LIS", "JFK"]
+    destinations = ["FRA", "LIS", "LIS", "DUS", "OPO", "JFK", "XXX"]
+    routes = pd.DataFrame({"Source airport": sources, "Destination airport": destinations})
+    for prefix, codes in [("Source", sources), ("Destination", destinations)]:
+        latitudes, longitudes = zip(*[COORDINATES.get(code, (np.nan, np.nan)) for code in codes])
+        routes[f"{prefix} latitude"] = latitudes
+        routes[f"{prefix} longitude"] = longitudes
+    return routes
+
+
+def coordinates(routes: pd.DataFrame) -> list:
+    """
+    Returns the coordinate columns of the routes in the order of the functions.
+    """
+    return [
+        routes["Source latitude"],
+        routes["Source longitude"],
+        routes["Destination latitude"],
+        routes["Destination longitude"],
+    ]
+
+
+def test_one(routes):
+    """
+    Test that coordinates are projected to the tile scheme of web maps and that
+    routes between the same grid cells are merged into one edge, fewer at coarse levels.
+    """
+    x, y = mercator([0, 85.0511287798, -90], [0, -180, 180])
+    assert np.allclose(x, [0.5, 0, 1])
+    assert np.allclose(y, [0.5, 0, 1])
+    latitudes, longitudes = inverse_mercator(*mercator([51.29, -33.9], [6.77, 151.2]))
+    assert np.allclose(latitudes, [51.29, -33.9])
+    assert np.allclose(longitudes, [6.77, 151.2])
+
+    # Up to level 3, Düsseldorf and Frankfurt share a cell
+    _, _, routes_0 = level_edges(*coordinates(routes), zoom=0)
+    assert sorted(routes_0.tolist()) == [1, 1, 3]
+    # At level 6 every pair of airports is an edge, both directions in one
+    x, y, routes_6 = level_edges(*coordinates(routes), zoom=6)
+    assert sorted(routes_6.tolist()) == [1, 1, 1, 1, 2]
+    assert x.shape == y.shape == (2, 5)
+
+
+def test_two(routes, monkeypatch):
+    """
+    Test that an edge is assigned to the tiles of its two ends and that a tile
+    keeps the edges with the most routes.
+    """
+    x, y, routes_2 = level_edges(*coordinates(routes), zoom=2)
+    edges, tile_x, tile_y = edge_tiles(x, y, routes_2, zoom=2)
+    for edge in range(len(routes_2)):
+        expected = set(zip(np.floor(x[:, edge] * 4), np.floor(y[:, edge] * 4)))
+        assert set(zip(tile_x[edges == edge], tile_y[edges == edge])) == expected
+
+    # The world is one tile at level 0, where the edge with the most routes is kept
+    monkeypatch.setattr(route_tiles, "MAX_TILE_EDGES", 1)
+    x, y, routes_0 = level_edges(*coordinates(routes), zoom=0)
+    edges, tile_x, tile_y = edge_tiles(x, y, routes_0, zoom=0)
+    assert routes_0[edges].tolist() == [3]
+    assert (tile_x.tolist(), tile_y.tolist()) == ([0], [0])
+
+
+def test_three(routes, tmp_path):
+    """
+    Test that the tiles and their index are written per zoom level and that the
+    world map loads them instead of embedding the routes, writing them on every call.
+    """
+    index = write_route_tiles(tmp_path / "tiles", *coordinates(routes), max_zoom=4)
+    assert index["edges"] == {"0": 3, "1": 3, "2": 3, "3": 3, "4": 5}
+    with open(tmp_path / "tiles" / "index.json", encoding="utf-8") as file:
+        assert json.load(file) == index
+    for zoom, tiles in index["tiles"].items():
+        ids = set()
+        for tile in tiles:
+            with open(tmp_path / "tiles" / zoom / f"{tile}.geojson", encoding="utf-8") as file:
+                features = json.load(file)["features"]
+            ids.update(feature["properties"]["id"] for feature in features)
+            assert all(feature["geometry"]["type"] == "LineString" for feature in features)
+        assert len(ids) == index["edges"][zoom]
+
+    flight_data = make_flight_data(routes=routes)
+    world_map = flight_data.plot_world_routes(
+        str(tmp_path / "world"), tile_url="world", max_zoom=2
+    )
+    html = world_map.get_root().render()
+    assert '"world"' in html
+    assert "LineString" not in html
+    assert (tmp_path / "world" / "2").is_dir()
+
+    # The tiles follow the routes, also when the same map is asked for again
+    flight_data.routes_df = routes.iloc[:2]
+    flight_data.plot_world_routes(str(tmp_path / "world"), tile_url="world", max_zoom=2)
+    with open(tmp_path / "world" / "index.json", encoding="utf-8") as file:
+        assert json.load(file)["edges"] == {"0": 1, "1": 1, "2": 1}
@@ -0,0 +1,67 @@
+"""
+This module contains tests for the spatial.py module.
+The tests are:
+    1. Test that a radius query finds the same points as calculating every distance.
+    2. Test that a nearest neighbour query finds the same points as sorting every distance.
+    3. Test that points with missing coordinates are left out of the index.
+
+The tests are run by running the command `pytest` in the terminal.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from Functions.distances import distance_many
+from Functions.spatial import SpatialIndex
+
+
+@pytest.fixture(name="points")
+def fixture_points():
+    """
+    Creates 500 random points around the globe, including the poles and the date line.
+    """
+    rng = np.random.default_rng(0)
+    return pd.DataFrame(
+        {
+            "Latitude": np.append(rng.uniform(-90, 90, 497), [90, -90, 0]),
+            "Longitude": np.append(rng.uniform(-180, 180, 497), [0, 0, 180]),
+        },
+        index=pd.RangeIndex(1000, 1500),
+    )
+
+
+def test_one(points):
+    """
+    Test that a radius query finds the same points as calculating every distance.
+    """
+    index = SpatialIndex(points)
+    for latitude, longitude, radius_km in [(51.3, 6.8, 2000), (0, 179.9, 1500), (89, 0, 500)]:
+        distances = distance_many(latitude, longitude, points["Latitude"], points["Longitude"])
+        found = index.within(latitude, longitude, radius_km)
+        assert set(found.index) == set(points.index[distances <= radius_km])
+        assert found.is_monotonic_increasing
+
+
+def test_two(points):
+    """
+    Test that a nearest neighbour query finds the same points as sorting every distance.
+    """
+    index = SpatialIndex(points)
+    latitudes, longitudes = [10.0, -45.0], [20.0, -170.0]
+    nearest = index.nearest(latitudes, longitudes, k=3)
+    assert list(nearest["Query"]) == [0, 0, 0, 1, 1, 1]
+    for query, (latitude, longitude) in enumerate(zip(latitudes, longitudes)):
+        distances = distance_many(latitude, longitude, points["Latitude"], points["Longitude"])
+        expected = points.index[np.argsort(distances)[:3]]
+        assert list(nearest.loc[nearest["Query"] == query, "Label"]) == list(expected)
+
+
+def test_three():
+    """
+    Test that points with missing coordinates are left out of the index.
+    """
+    points = pd.DataFrame({"Latitude": [50.0, np.nan], "Longitude": [8.5, 8.5]})
+    index = SpatialIndex(points)
+    assert len(index) == 1
+    assert list(index.within(50.0, 8.5, 10).index) == [0]
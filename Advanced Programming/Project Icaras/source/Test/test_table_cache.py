@@ -0,0 +1,70 @@
+"""
+This module contains tests for the table_cache.py module.
+The tests are:
+    1. Test that a stored table is loaded back unchanged.
+    2. Test that a table is not found under the key of a changed file and that
+    storing it under the new key removes the outdated cache.
+    3. Test that storing a table leaves the entries of the cache directory alone
+    that are not the tables of a cache key.
+
+The tests are run by running the command `pytest` in the terminal.
+"""
+
+import os
+
+import pandas as pd
+import pytest
+
+pytest.importorskip("pyarrow")
+# pylint: disable=wrong-import-position
+from Functions.table_cache import file_hash, load_table, save_table
+
+
+def test_one(tmp_path):
+    """
+    Test that a stored table is loaded back unchanged.
+    """
+    table = pd.DataFrame({"IATA": ["DUS", "FRA"], "Latitude": [51.289501, 50.033333]})
+    assert save_table(str(tmp_path), "key", "airports_df", table)
+    pd.testing.assert_frame_equal(load_table(str(tmp_path), "key", "airports_df"), table)
+
+
+def test_two(tmp_path):
+    """
+    Test that a changed file gets a new cache key and that storing a table under
+    the new key removes the tables cached for the old file.
+    """
+    source_file = tmp_path / "flight_data.zip"
+    cache_dir = str(tmp_path / "cache")
+    table = pd.DataFrame({"IATA": ["DUS"]})
+
+    source_file.write_bytes(b"first snapshot")
+    old_key = file_hash(str(source_file))
+    save_table(cache_dir, old_key, "airports_df", table)
+
+    source_file.write_bytes(b"second snapshot")
+    new_key = file_hash(str(source_file))
+    assert new_key != old_key
+    assert load_table(cache_dir, new_key, "airports_df") is None
+
+    save_table(cache_dir, new_key, "airports_df", table)
+    assert os.listdir(cache_dir) == [new_key]
+
+
+def test_three(tmp_path):
+    """
+    Test that storing a table only removes the directories of other cache keys,
+    and leaves other files and directories in the cache directory alone.
+    """
+    cache_dir = tmp_path / "cache"
+    old_key, new_key = "a" * 64, "b" * 64
+    table = pd.DataFrame({"IATA": ["DUS"]})
+    save_table(str(cache_dir), old_key, "airports_df", table)
+    # A directory named like a key without tables, another directory and a file
+    (cache_dir / ("c" * 64)).mkdir()
+    (cache_dir / "notes").mkdir()
+    (cache_dir / "notes" / "routes_df.arrow").write_bytes(b"not a cache key")
+    (cache_dir / "README.txt").write_text("Kept")
+
+    save_table(str(cache_dir), new_key, "airports_df", table)
+    assert sorted(os.listdir(cache_dir)) == sorted(["c" * 64, "notes", "README.txt", new_key])
@@ -0,0 +1,181 @@
+"""
+This module contains the methods of FlightData that look up and summarize the routes,
+countries and fleet of a single airline through the airline index.
+"""
+
+import numpy as np
+import pandas as pd
+
+from Functions.airlines import fleet_mix, network_summary, served_countries
+from Functions.result_cache import cached_method
+
+
+class AirlineMixin:
+    """
+    The airline methods of FlightData. An airline is given by its Airline ID, IATA
+    code, ICAO code or name.
+    """
+
+    @cached_method
+    def airline_hubs(self) -> pd.DataFrame:
+        """
+        Ranks the airlines by the summed PageRank of the airports they serve in the
+        whole route network, with the hub of each airline (see airline_table).
+
+        Returns
+        ---------
+        pandas.DataFrame
+            One row per airline, highest PageRank first, with its Airline ID and Name,
+            the number of Routes and Airports, the Hub Airport ID and IATA code, the
+            Hub share of its routes and its PageRank.
+        """
+        # pylint: disable=import-outside-toplevel
+        from Functions.network import airline_table, pagerank, route_adjacency
+
+        # Only the PageRank is needed, not the betweenness of hub_metrics, which
+        # takes seconds for the whole network
+        airport_ids, adjacency = route_adjacency(self.routes_df)
+        table = airline_table(self.routes_df, pd.Series(pagerank(adjacency), index=airport_ids))
+        airlines = self.airlines_df.drop_duplicates("Airline ID").set_index("Airline ID")
+        airports = self.airports_df.drop_duplicates("Airport ID").set_index("Airport ID")
+        table.insert(0, "Name", airlines["Name"].reindex(table.index).to_numpy())
+        table.insert(
+            table.columns.get_loc("Hub") + 1,
+            "Hub IATA",
+            airports["IATA"].reindex(table["Hub"]).to_numpy(),
+        )
+        return table.reset_index()
+
+    def _airline_id(self, airline) -> int:
+        """
+        Returns the Airline ID of an airline given by its Airline ID, IATA code,
+        ICAO code or name. Of several airlines with the same code or name, the first
+        one with routes is taken.
+
+        Raises
+        ------------
+        ValueError
+            If the airline does not exist in the data.
+        """
+        if isinstance(airline, (int, np.integer)):
+            return int(airline)
+        airlines = self.airlines_df
+        found = airlines.loc[
+            (airlines["IATA"] == airline)
+            | (airlines["ICAO"] == airline)
+            | (airlines["Name"] == airline),
+            "Airline ID",
+        ].astype(np.int64)
+        if found.empty:
+            raise ValueError(f"Airline {airline} does not exist in the data.")
+        with_routes = [airline_id for airline_id in found if airline_id in self.airline_index]
+        return int(with_routes[0] if with_routes else found.iloc[0])
+
+    def airline_routes(self, airline) -> pd.DataFrame:
+        """
+        Returns the routes of an airline, taken from routes_df by the positions in
+        the airline index instead of filtering the whole table.
+
+        Parameters
+        ------------
+        airline: int or str
+            The Airline ID, IATA code, ICAO code or name of the airline.
+
+        Returns
+        ---------
+        pandas.DataFrame
+            The rows of routes_df of the airline, in their order in routes_df.
+
+        Raises
+        ------------
+        ValueError
+            If the airline does not exist in the data or has no routes.
+        """
+        return self.routes_df.iloc[self.airline_index.positions(self._airline_id(airline))]
+
+    @cached_method
+    def airline_countries(self, airline) -> pd.Series:
+        """
+        Counts the routes of an airline from or to each country it serves.
+
+        Parameters
+        ------------
+        airline: int or str
+            The Airline ID, IATA code, ICAO code or name of the airline.
+
+        Returns
+        ---------
+        pandas.Series
+            The number of routes per country, most routes first.
+
+        Raises
+        ------------
+        ValueError
+            If the airline does not exist in the data or has no routes.
+        """
+        return served_countries(self.airline_routes(airline), self.airport_index)
+
+    @cached_method
+    def airline_fleet(self, airline) -> pd.Series:
+        """
+        Counts the routes of an airline flown by each airplane model.
+
+        Parameters
+        ------------
+        airline: int or str
+            The Airline ID, IATA code, ICAO code or name of the airline.
+
+        Returns
+        ---------
+        pandas.Series
+            The number of routes per airplane model, most routes first.
+
+        Raises
+        ------------
+        ValueError
+            If the airline does not exist in the data or has no routes.
+        """
+        return fleet_mix(
+            self.route_table,
+            self.airline_index.positions(self._airline_id(airline)),
+            self.airplanes_df,
+        )
+
+    @cached_method
+    def airline_summary(self, airline) -> pd.Series:
+        """
+        Summarizes the network of an airline.
+
+        Parameters
+        ------------
+        airline: int or str
+            The Airline ID, IATA code, ICAO code or name of the airline.
+
+        Returns
+        ---------
+        pandas.Series
+            The Airline ID, Name and Country of the airline, the number of Routes, of
+            Airports and of Countries served, the Total distance_km and Median
+            distance_km of its routes and its most used airplane Model.
+
+        Raises
+        ------------
+        ValueError
+            If the airline does not exist in the data or has no routes.
+
+        Example
+        ---------
+        >>> flight_data.airline_summary("LH")
+        """
+        airline_id = self._airline_id(airline)
+        routes = self.airline_routes(airline_id)
+        airlines = self.airlines_df[self.airlines_df["Airline ID"] == airline_id]
+        fleet = self.airline_fleet(airline_id)
+        summary = {
+            "Airline ID": airline_id,
+            "Name": airlines["Name"].iloc[0] if len(airlines) else None,
+            "Country": airlines["Country"].iloc[0] if len(airlines) else None,
+            **network_summary(routes, self.airline_countries(airline_id)),
+            "Model": fleet.index[0] if len(fleet) else None,
+        }
+        return pd.Series(summary, dtype=object, name=airline_id)
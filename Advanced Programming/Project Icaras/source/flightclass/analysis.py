@@ -0,0 +1,362 @@
+"""
+This module contains the methods of FlightData that analyze the route network: the
+airplane models, the flights and emissions between countries, the airports near a
+location, the connections between airports and the hubs of the network.
+"""
+
+from __future__ import annotations
+
+import os
+
+import pandas as pd
+
+from Functions.distances import distance_many
+from Functions.emissions import departure_table, scenario_sweep
+from Functions.result_cache import cached_method
+
+
+class AnalysisMixin:
+    """
+    The analytics methods of FlightData. They query the tables and indexes of
+    FlightData and cache their results in its result cache.
+    """
+
+    def top_models(self, countries: list = None, top_n: int = 10) -> pd.DataFrame:
+        """
+        Counts the routes of the N most used airplane models. The result is cached.
+
+        Parameters
+        ------------
+        countries: list or str, optional
+            A list of country names, or a single country name, to filter the routes by.
+        top_n: int, optional
+            The number of top airplane models to return.
+
+        Returns
+        ---------
+        pandas.DataFrame
+            The number of routes in the Counts column, indexed by model name
+            in descending order.
+
+        Raises
+        ------------
+        ValueError
+            If the specified country does not exist in the provided data.
+        """
+        # A single country has the same result, and cache key, as a list of it
+        if isinstance(countries, str):
+            countries = [countries]
+        return self._top_models(countries, top_n)
+
+    @cached_method
+    def _top_models(self, countries: list = None, top_n: int = 10) -> pd.DataFrame:
+        """
+        Counts the routes of the N most used airplane models of a list of countries,
+        see top_models.
+        """
+        # Check if the countries exist in the airports_df
+        if countries is not None:
+            invalid_countries = [
+                country for country in countries if country not in self.country_flows
+            ]
+
+            if invalid_countries:
+                invalid_countries_str = ", ".join(invalid_countries)
+                raise ValueError(
+                    f"The following countries do not exist in the data: {invalid_countries_str}"
+                )
+
+        # Count the routes departing from or arriving in the countries for each
+        # airplane model, from the counts that are aggregated once per country
+        return self.equipment_cube.top_models(countries, top_n).to_frame()
+
+    @cached_method
+    def departures(self) -> pd.DataFrame:
+        """
+        Lists the flights departing from every country with their distance and whether
+        they are internal, sorted by country and distance (see departure_table).
+        The table is built once and reused by emission_scenarios.
+
+        Returns
+        ---------
+        pandas.DataFrame
+            One row per flight with the Country, distance_km, Destination country and
+            Internal columns.
+        """
+        return departure_table(self.airports_df, self.routes_df, self.airport_index)
+
+    def emission_scenarios(
+        self,
+        countries: list = None,
+        thresholds: list = (1000,),
+        train_plane_ratios: list = (3 / 25,),
+        internal: list = (False, True),
+    ) -> pd.DataFrame:
+        """
+        Calculates the emission reduction of plot_country_flights, if short-haul flights
+        were replaced by trains, for every combination of country, threshold, train to
+        plane ratio and internal-only setting in one pass over the departures.
+
+        Parameters
+        ------------
+        countries: list, optional
+            The countries of departure. By default all countries of airports_df.
+        thresholds: list, optional
+            The distance thresholds in kilometers below which flights are short-haul.
+        train_plane_ratios: list, optional
+            The ratios of train to plane emissions for short-haul flights.
+        internal: list, optional
+            Whether to only include flights within the same country, one scenario per value.
+
+        Returns
+        ---------
+        pandas.DataFrame
+            One row per scenario with the columns Country, threshold, train_plane_ratio,
+            internal, sh_count, sh_dist, lh_count, lh_dist and emission_reduction.
+
+        Raises
+        ------------
+        ValueError
+            If a specified country does not exist in the provided data.
+
+        Example
+        ---------
+        >>> flight_data.emission_scenarios(thresholds=range(100, 5001, 100),
+        ...                                train_plane_ratios=[0.05, 0.12, 0.2])
+        """
+        if countries is None:
+            countries = list(self.country_flows.countries)
+        elif isinstance(countries, str):
+            countries = [countries]
+        invalid_countries = sorted(
+            country for country in set(countries) if country not in self.country_flows
+        )
+        if invalid_countries:
+            raise ValueError(
+                f"The following countries do not exist in the data: {', '.join(invalid_countries)}"
+            )
+        return scenario_sweep(
+            self.departures(), countries, thresholds, train_plane_ratios, internal
+        )
+
+    def country_flow(self, source_country: str, destination_country: str) -> pd.Series:
+        """
+        Looks up the flights from one country to another in the country flows,
+        split into short-haul and long-haul flights at 1000 km.
+
+        Parameters
+        ------------
+        source_country: str
+            The country of departure.
+        destination_country: str
+            The country of arrival, the same country for its internal flights.
+
+        Returns
+        ---------
+        pandas.Series
+            The Routes, distance_km, sh_count, sh_dist, lh_count and lh_dist.
+
+        Raises
+        ------------
+        ValueError
+            If a specified country does not exist in the provided data.
+        """
+        return self.country_flows.pair(source_country, destination_country)
+
+    def country_flow_matrix(self, measure: str = "Routes") -> pd.DataFrame:
+        """
+        Returns a measure of the flights between every pair of countries.
+
+        Parameters
+        ------------
+        measure: str, optional
+            One of Routes, distance_km, sh_count, sh_dist, lh_count and lh_dist.
+
+        Returns
+        ---------
+        pandas.DataFrame
+            The measure with the countries of departure as index and the countries
+            of arrival as columns.
+
+        Raises
+        ------------
+        ValueError
+            If measure is not one of the measures.
+        """
+        return self.country_flows.matrix(measure)
+
+    def export_country_flows(self, path: str) -> None:
+        """
+        Writes the pairs of countries with flights between them and their measures
+        to a file, e.g. for a dashboard.
+
+        Parameters
+        ------------
+        path: str
+            The file, a .csv, .json (one record per pair) or .parquet file.
+
+        Raises
+        ------------
+        ValueError
+            If the file is not a .csv, .json or .parquet file.
+        """
+        writers = {
+            ".csv": lambda table: table.to_csv(path, index=False),
+            ".json": lambda table: table.to_json(path, orient="records"),
+            ".parquet": lambda table: table.to_parquet(path, index=False),
+        }
+        extension = os.path.splitext(path)[1].lower()
+        if extension not in writers:
+            raise ValueError(f"path must be a {', '.join(writers)} file, not '{path}'.")
+        writers[extension](self.country_flows.to_frame())
+
+    def airports_within(self, latitude: float, longitude: float, radius_km: float) -> pd.DataFrame:
+        """
+        Finds the airports within a radius of a location.
+
+        Parameters
+        ------------
+        latitude: float
+            The latitude of the location in degrees.
+        longitude: float
+            The longitude of the location in degrees.
+        radius_km: float
+            The radius in kilometers.
+
+        Returns
+        ---------
+        pandas.DataFrame
+            The airports with their distance to the location in the distance_km
+            column, from nearest to farthest.
+
+        Example
+        ---------
+        flight_data.airports_within(51.289501, 6.766780, 100)
+        """
+        found = self.spatial_index.within(latitude, longitude, radius_km)
+        airports = self.airports_df.loc[found.index].copy()
+        airports["distance_km"] = found.to_numpy()
+        return airports
+
+    def nearest_airports(self, latitudes, longitudes, k: int = 1) -> pd.DataFrame:
+        """
+        Finds the k nearest airports to each of one or many locations.
+
+        Parameters
+        ------------
+        latitudes: float or array-like
+            The latitudes of the locations in degrees.
+        longitudes: float or array-like
+            The longitudes of the locations in degrees.
+        k: int, optional
+            The number of airports per location.
+
+        Returns
+        ---------
+        pandas.DataFrame
+            k rows per location, nearest first: the position of the location in the
+            Query column, the airport and its distance in the distance_km column.
+        """
+        found = self.spatial_index.nearest(latitudes, longitudes, k)
+        airports = self.airports_df.loc[found["Label"]].reset_index(drop=True)
+        airports.insert(0, "Query", found["Query"].to_numpy())
+        airports["distance_km"] = found["distance_km"].to_numpy()
+        return airports
+
+    def itinerary(
+        self, source_code: str, destination_code: str, fewest_hops: bool = False
+    ) -> pd.DataFrame:
+        """
+        Finds the connection between two airports with the shortest total distance,
+        or with the fewest flights.
+
+        Parameters
+        ------------
+        source_code: str
+            The IATA or ICAO code of the origin.
+        destination_code: str
+            The IATA or ICAO code of the destination.
+        fewest_hops: bool, optional
+            Whether to minimize the number of flights instead of the distance.
+
+        Returns
+        ---------
+        pandas.DataFrame
+            The airports of the connection from origin to destination with the
+            distance of the flight to each of them in the Leg distance column.
+            Empty if the destination cannot be reached.
+
+        Raises
+        ------------
+        ValueError
+            If an airport does not exist in the data or has no routes.
+
+        Example
+        ---------
+        flight_data.itinerary("DUS", "SYD")
+        """
+        airport_ids = []
+        for airport_code in [source_code, destination_code]:
+            airport = self.lookup_airport(airport_code)
+            if airport is None:
+                raise ValueError(f"Airport with code {airport_code} does not exist in the data.")
+            airport_ids.append(int(airport["Airport ID"]))
+
+        if fewest_hops:
+            _, path = self.route_graph.fewest_hops(*airport_ids)
+        else:
+            _, path = self.route_graph.shortest_route(*airport_ids)
+
+        airports = self.airports_df.drop_duplicates("Airport ID").set_index("Airport ID")
+        stops = airports.loc[path, ["Name", "City", "Country", "IATA", "Latitude", "Longitude"]]
+        stops["Leg distance"] = 0.0
+        if len(stops) > 1:
+            stops.iloc[1:, stops.columns.get_loc("Leg distance")] = distance_many(
+                stops["Latitude"].to_numpy()[:-1],
+                stops["Longitude"].to_numpy()[:-1],
+                stops["Latitude"].to_numpy()[1:],
+                stops["Longitude"].to_numpy()[1:],
+            )
+        return stops.reset_index()
+
+    @cached_method
+    def hub_metrics(self, airline_id: int = None, samples: int = None) -> pd.DataFrame:
+        """
+        Ranks the airports of the route network, or of the network of one airline,
+        by their importance as hubs (see hub_table). The metrics of each network are
+        computed once and kept in the result cache.
+
+        Parameters
+        ------------
+        airline_id: int, optional
+            The Airline ID whose network is analysed. By default all routes.
+        samples: int, optional
+            The number of source airports that estimate the betweenness.
+            By default all of them, which takes a few seconds for the whole network.
+
+        Returns
+        ---------
+        pandas.DataFrame
+            One row per airport with routes, highest PageRank first, with its Airport ID,
+            Name, City, Country and IATA code, the number of Destinations and Origins,
+            the Routes lost and Stranded airports if it closes, its PageRank and
+            Betweenness.
+
+        Raises
+        ------------
+        ValueError
+            If the airline has no routes in the data.
+
+        Example
+        ---------
+        >>> flight_data.hub_metrics().head(10)
+        >>> flight_data.hub_metrics(airline_id=4178)
+        """
+        # pylint: disable=import-outside-toplevel
+        from Functions.network import hub_table
+        metrics = hub_table(self.routes_df, airline_id, samples)
+        if metrics.empty and airline_id is not None:
+            raise ValueError(f"Airline with ID {airline_id} has no routes in the data.")
+        airports = self.airports_df.drop_duplicates("Airport ID").set_index("Airport ID")
+        names = airports.reindex(metrics.index)[["Name", "City", "Country", "IATA"]]
+        return names.join(metrics).reset_index()
@@ -1,29 +1,153 @@
 """
 This module contains a class for processing flight data, including downloading and parsing
 flight-related data and plotting flight routes.
+
+Heavy libraries that are only needed for plotting (folium, matplotlib, branca), for
+displaying (IPython) and for the language model lookups (langchain_openai), as well as
+the graph and spatial indexes (scipy), are imported on first use, so that importing this
+module for the DataFrames alone stays fast.
+
+FlightData loads the tables and builds the indexes. It takes its plotting, analytics,
+airline and language model methods from the mixins of flightclass.plotting,
+flightclass.analysis, flightclass.airline_queries and flightclass.lookups.
 """
 
+from __future__ import annotations
+
+import os
 import sys
+from typing import TYPE_CHECKING
 
 # Modify sys.path to include the parent directory for imports
 sys.path.append("..")
 
 # pylint: disable=wrong-import-position
-import folium
-import matplotlib.pyplot as plt
+import numpy as np
 import pandas as pd
-from branca.element import Element
-from IPython.display import Markdown, display
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 
-from Functions.distances import distance
+from Functions.airlines import AirlineIndex
+from Functions.deltas import DeltaInfo, count_changes, match_rows, unmatched
+from Functions.distances import distance_many
 from Functions.download_zip import download_file
-from Functions.reading_zip import unzip
-from langchain_openai import ChatOpenAI
+from Functions.emissions import departure_table
+from Functions.equipment import EquipmentCube
+from Functions.flows import CountryFlows
+from Functions.reading_zip import iter_csv_chunks, unzip
+from Functions.result_cache import CacheInfo, ResultCache
+from Functions.route_table import RouteTable
+from Functions.table_cache import (
+    file_hash,
+    is_cached,
+    load_table,
+    save_table,
+    write_chunks,
+)
+from flightclass.airline_queries import AirlineMixin
+from flightclass.analysis import AnalysisMixin
+from flightclass.lookups import LookupMixin
+from flightclass.plotting import PlottingMixin
+
+if TYPE_CHECKING:
+    import folium
+
+    from Functions.charts import ChartResult
+    from Functions.llm_lookup import LLMLookup
+    from Functions.route_graph import RouteGraph
+    from Functions.spatial import SpatialIndex
+
+# The columns that are kept of each table, superfluous columns are removed
+TABLE_COLUMNS = {
+    "airlines_df": [
+        "Airline ID",
+        "Name",
+        "Alias",
+        "IATA",
+        "ICAO",
+        "Callsign",
+        "Country",
+        "Active",
+    ],
+    "airplanes_df": ["Name", "IATA code", "ICAO code"],
+    "airports_df": [
+        "Airport ID",
+        "Name",
+        "City",
+        "Country",
+        "IATA",
+        "ICAO",
+        "Latitude",
+        "Longitude",
+        "Altitude",
+        "Timezone",
+        "DST",
+        "Tz database time zone",
+        "Type",
+        "Source",
+    ],
+    "routes_df": [
+        "Airline",
+        "Airline ID",
+        "Source airport",
+        "Source airport ID",
+        "Destination airport",
+        "Destination airport ID",
+        "Codeshare",
+        "Stops",
+        "Equipment",
+    ],
+}
+# Compact types of the columns: repetitive strings become categorical and
+# coordinates float32, which is precise to about a meter
+TABLE_DTYPES = {
+    "airlines_df": {"Country": "category", "Active": "category"},
+    "airplanes_df": {},
+    "airports_df": {
+        "Country": "category",
+        "Latitude": "float32",
+        "Longitude": "float32",
+        "DST": "category",
+        "Tz database time zone": "category",
+        "Type": "category",
+        "Source": "category",
+    },
+    "routes_df": {
+        "Airline": "category",
+        "Source airport": "category",
+        "Destination airport": "category",
+        "Codeshare": "category",
+        "Equipment": "category",
+    },
+}
+# The columns that identify a row when comparing two snapshots of a table
+TABLE_KEYS = {
+    "airports_df": ["Airport ID"],
+    "routes_df": ["Airline", "Source airport", "Destination airport"],
+}
+# The options for parsing each CSV file, so that only the needed columns are parsed
+TABLE_SCHEMAS = {
+    name: {"usecols": columns, "dtype": TABLE_DTYPES[name]}
+    for name, columns in TABLE_COLUMNS.items()
+}
+# The processed tables that are loaded and cached between runs
+TABLE_NAMES = list(TABLE_COLUMNS)
+# Fixed, nullable types of streamed routes, so that every chunk has the same schema
+ROUTE_STREAM_DTYPES = {
+    "Airline": "string",
+    "Airline ID": "Int64",
+    "Source airport": "string",
+    "Source airport ID": "Int64",
+    "Destination airport": "string",
+    "Destination airport ID": "Int64",
+    "Codeshare": "string",
+    "Stops": "Int64",
+    "Equipment": "string",
+}
+
 
 # pylint: disable=R0903
 # pylint: disable=R0914
-class FlightData(BaseModel):
+class FlightData(PlottingMixin, AnalysisMixin, AirlineMixin, LookupMixin, BaseModel):
     """
     A class for processing flight data, including downloading
     and parsing flight-related data and plotting flight routes.
@@ -34,6 +158,25 @@ class FlightData(BaseModel):
         The URL to download the flight data from.
     file: str
         The name of the downloaded zip file.
+    download: bool
+        Whether to check the server for a new zip file. If False, an existing file
+        is used as it is, e.g. in worker processes of a batch run.
+    cache_dir: str
+        The directory in which the processed tables are cached.
+    use_cache: bool
+        Whether to load the processed tables from, and store them in, the cache.
+    lazy: bool
+        Whether to load each table only when it is first accessed instead of at construction.
+    parallel: str
+        'thread' or 'process' to parse the CSV files concurrently at construction.
+    result_cache_size: int
+        The number of results of repeated plotting and analytics calls that are kept,
+        least recently used first out. 0 disables the result cache.
+    llm_cache_dir: str
+        The directory in which the answers of the language model are cached.
+        None disables the cache.
+    llm_concurrency: int
+        The maximum number of concurrent requests to the language model.
     airlines_df: pandas.DataFrame
         A DataFrame containing airline data.
     airplanes_df: pandas.DataFrame
@@ -41,22 +184,87 @@ class FlightData(BaseModel):
     airports_df: pandas.DataFrame
         A DataFrame containing airport data.
     routes_df: pandas.DataFrame
-        A DataFrame containing route data.
+        A DataFrame containing route data, enriched with coordinates and distances.
+    airport_index: pandas.DataFrame
+        The airports indexed by their IATA and ICAO codes, built once at load time.
+    equipment_cube: EquipmentCube
+        The airplane model counts per country, built on first use.
+    airline_index: AirlineIndex
+        The positions of the routes grouped by Airline ID, built on first use.
+    country_flows: CountryFlows
+        The flights between every pair of countries, built at load time.
+    route_table: RouteTable
+        The routes as arrays of interned int32 IDs, built on first use.
+    route_graph: RouteGraph
+        The airports connected by the routes as a CSR graph, built on first use.
+    spatial_index: SpatialIndex
+        A k-d tree over the coordinates of the airports, built on first use.
+    llm_lookup: LLMLookup
+        The language model client with its answer cache, created on first use.
+    result_cache: ResultCache
+        The cached results of the plotting and analytics methods. Tables are
+        returned as copies, maps as the cached map.
 
     Methods
     ---------
     plot_airports(country: str) -> folium.Map:
         Plots the airports from a specified country on a map.
-    distance_analysis() -> None:
-        Plots the distribution of flight distances.
+    distance_analysis(show: bool = True, image_format: str = "png",
+                      bins: int = 100) -> ChartResult | None:
+        Plots the distribution of flight distances, or renders it without a display.
     plot_airport_flights(airport_code: str, internal: bool = False) -> folium.Map:
         Plots the flight routes from a specified airport on a map.
-    plot_top_models(countries: list = None, top_n: int = 10) -> None:
-        Plots the N most used airplane models by number of routes.
+    top_models(countries: list = None, top_n: int = 10) -> pandas.DataFrame:
+        Counts the routes of the N most used airplane models.
+    plot_top_models(countries: list = None, top_n: int = 10, show: bool = True,
+                    image_format: str = "png") -> ChartResult | None:
+        Plots the N most used airplane models by number of routes,
+        or renders them without a display.
     plot_country_flights(country_name: str,
                         threshold: int = 1000,
                         internal: bool = False) -> folium.Map:
         Plots the flight routes from all airports in a specified country on a map.
+    airports_within(latitude: float, longitude: float, radius_km: float) -> pandas.DataFrame:
+        Finds the airports within a radius of a location.
+    nearest_airports(latitudes, longitudes, k: int = 1) -> pandas.DataFrame:
+        Finds the k nearest airports to each of many locations.
+    itinerary(source_code: str, destination_code: str,
+              fewest_hops: bool = False) -> pandas.DataFrame:
+        Finds the shortest connection between two airports.
+    hub_metrics(airline_id: int = None, samples: int = None) -> pandas.DataFrame:
+        Ranks the airports by degree, PageRank, betweenness and the routes lost
+        if they close.
+    airline_hubs() -> pandas.DataFrame:
+        Ranks the airlines by the importance of the airports they serve.
+    airline_routes(airline) -> pandas.DataFrame:
+        Returns the routes of an airline through the airline index.
+    airline_summary(airline) -> pandas.Series:
+        Summarizes the network size, distances, countries and main model of an airline.
+    airline_countries(airline) -> pandas.Series:
+        Counts the routes of an airline per country served.
+    airline_fleet(airline) -> pandas.Series:
+        Counts the routes of an airline per airplane model.
+    plot_airline_network(airline, render: str = "objects") -> folium.Map:
+        Plots the routes of an airline on a map.
+    plot_world_routes(directory: str = "downloads/route_tiles", tile_url: str = None,
+                      max_zoom: int = 6, color: str = "blue") -> folium.Map:
+        Plots all routes on a world map that loads level-of-detail tiles in view.
+    departures() -> pandas.DataFrame:
+        Lists the flights departing from every country with their distance.
+    emission_scenarios(countries: list = None, thresholds: list = (1000,),
+                       train_plane_ratios: list = (3 / 25,),
+                       internal: list = (False, True)) -> pandas.DataFrame:
+        Calculates the emission reduction for a grid of scenarios.
+    country_flow(source_country: str, destination_country: str) -> pandas.Series:
+        Looks up the flights from one country to another.
+    country_flow_matrix(measure: str = "Routes") -> pandas.DataFrame:
+        Returns a measure of the flights between every pair of countries.
+    export_country_flows(path: str) -> None:
+        Writes the flights between countries to a CSV, JSON or Parquet file.
+    cache_info() -> CacheInfo:
+        Returns the hit and miss statistics of the cached results.
+    apply_delta(file: str = None) -> DeltaInfo:
+        Updates the tables to a new snapshot, processing only the rows that changed.
     aircrafts() -> list:
         Print the list of unique airplane models in the data.
     aircraft_info(aircraft_name: str):
@@ -65,16 +273,35 @@ class FlightData(BaseModel):
         Print the list of unique airports in the data.
     airport_info(airport_name: str):
         Print the specifications of a specific airport.
+    aircraft_info_many(aircraft_names: list) -> dict:
+        Get the specifications of many airplane models concurrently.
+    airport_info_many(airport_names: list) -> dict:
+        Get the specifications of many airports concurrently.
     """
 
     url: str = Field(
         default="https://gitlab.com/adpro1/adpro2024/-/raw/main/Files/flight_data.zip?inline=false"
     )
     file: str = Field(default="downloads/flight_data.zip")
-    airlines_df: pd.DataFrame = pd.DataFrame()
-    airplanes_df: pd.DataFrame = pd.DataFrame()
-    airports_df: pd.DataFrame = pd.DataFrame()
-    routes_df: pd.DataFrame = pd.DataFrame()
+    download: bool = Field(default=True)
+    cache_dir: str = Field(default="downloads/cache")
+    use_cache: bool = Field(default=True)
+    lazy: bool = Field(default=False)
+    parallel: str | None = Field(default=None)
+    result_cache_size: int = Field(default=128)
+    llm_cache_dir: str | None = Field(default="downloads/llm_cache")
+    llm_concurrency: int = Field(default=8)
+    _tables: dict = PrivateAttr(default_factory=dict)
+    _airport_index: pd.DataFrame = PrivateAttr(default=None)
+    _cache_key: str = PrivateAttr(default=None)
+    _equipment_cube: EquipmentCube = PrivateAttr(default=None)
+    _airline_index: AirlineIndex = PrivateAttr(default=None)
+    _country_flows: CountryFlows = PrivateAttr(default=None)
+    _route_table: RouteTable = PrivateAttr(default=None)
+    _route_graph: RouteGraph = PrivateAttr(default=None)
+    _spatial_index: SpatialIndex = PrivateAttr(default=None)
+    _llm_lookup: LLMLookup = PrivateAttr(default=None)
+    _result_cache: ResultCache = PrivateAttr(default=None)
 
     class Config:
         """
@@ -91,7 +318,12 @@ class FlightData(BaseModel):
     def __init__(self, **data):
         """
         Initialize the class with default or passed values.
-        Downloads the zip file, unzips it, and loads the CSVs into DataFrames.
+        Downloads the zip file, unzips it, loads the CSVs into DataFrames and
+        aggregates the flights between countries.
+        The processed DataFrames are cached in cache_dir, keyed on the content hash
+        of the zip file, so later runs with an unchanged zip file load them directly.
+        With lazy=True nothing is loaded here; each DataFrame is loaded the first
+        time it is accessed, and the country flows the first time they are needed.
 
         Parameters
         ------------
@@ -103,549 +335,504 @@ class FlightData(BaseModel):
         None
         """
         super().__init__(**data)  # Initialize with defaults or passed values
+        self._result_cache = ResultCache(self.result_cache_size)
 
-        download_file(self.url, self.file)  # Downloading the zip file
-        dataframes_dict = unzip(self.file)  # Unzipping and loading CSVs into DataFrames
-
-        # Directly setting the DataFrame attributes and removing superfluous columns
-        if "airlines_df" in dataframes_dict:
-            allowed_columns_airlines = [
-                "Airline ID",
-                "Name",
-                "Alias",
-                "IATA",
-                "ICAO",
-                "Callsign",
-                "Country",
-                "Active",
-            ]
-            self.airlines_df = dataframes_dict["airlines_df"][allowed_columns_airlines]
-        if "airplanes_df" in dataframes_dict:
-            allowed_columns_airplanes = ["Name", "IATA code", "ICAO code"]
-            self.airplanes_df = dataframes_dict["airplanes_df"][
-                allowed_columns_airplanes
-            ]
-        if "airports_df" in dataframes_dict:
-            allowed_columns_airports = [
-                "Airport ID",
-                "Name",
-                "City",
-                "Country",
-                "IATA",
-                "ICAO",
-                "Latitude",
-                "Longitude",
-                "Altitude",
-                "Timezone",
-                "DST",
-                "Tz database time zone",
-                "Type",
-                "Source",
-            ]
-            self.airports_df = dataframes_dict["airports_df"][allowed_columns_airports]
-        if "routes_df" in dataframes_dict:
-            allowed_columns_routes = [
-                "Airline",
-                "Airline ID",
-                "Source airport",
-                "Source airport ID",
-                "Destination airport",
-                "Destination airport ID",
-                "Codeshare",
-                "Stops",
-                "Equipment",
-            ]
-            self.routes_df = dataframes_dict["routes_df"][allowed_columns_routes]
-
-            # Adding "lat" and "long" columns of source airport from airports_df to routes_df
-            self.routes_df = self.routes_df.merge(
-                self.airports_df[["Latitude", "Longitude", "IATA"]],
-                left_on="Source airport",
-                right_on="IATA",
-                how="left",
-            )
-            # rename columns
-            self.routes_df.rename(
-                columns={
-                    "Latitude": "Source latitude",
-                    "Longitude": "Source longitude",
-                },
-                inplace=True,
-            )
+        if not self.lazy:
+            self._load_tables(TABLE_NAMES)
+            self._country_flows = self._build_country_flows()
 
-            # Adding "lat" and "long" columns of dest. airport from airports_df to routes_df
-            self.routes_df = self.routes_df.merge(
-                self.airports_df[["Latitude", "Longitude", "IATA"]],
-                left_on="Destination airport",
-                right_on="IATA",
-                how="left",
-            )
-            # rename columns
-            self.routes_df.rename(
-                columns={
-                    "Latitude": "Destination latitude",
-                    "Longitude": "Destination longitude",
-                },
-                inplace=True,
-            )
-            # Calculate the distance in km between source and destination airports
-            self.routes_df["distance_km"] = self.routes_df.apply(
-                lambda row: distance(
-                    row["Source latitude"],
-                    row["Source longitude"],
-                    row["Destination latitude"],
-                    row["Destination longitude"],
-                ),
-                axis=1,
-            )
-
-    def plot_airports(self, country: str) -> folium.Map:
+    @property
+    def airlines_df(self) -> pd.DataFrame:
         """
-        Plots the airports from a specified country on a map using the Folium library.
-        Utilizes the class's DataFrame
-
-        Parameters
-        ------------
-        country: str
-            The name of the country to plot airports for.
+        A DataFrame containing airline data.
+        """
+        return self._load_table("airlines_df")
 
-        Returns
-        ---------
-        folium.Map
-            A map object with plotted airports.
+    @airlines_df.setter
+    def airlines_df(self, table: pd.DataFrame) -> None:
+        self._store_table("airlines_df", table)
 
-        Raises
-        ------------
-        ValueError
-            If the specified country does not exist in the provided data.
+    @property
+    def airplanes_df(self) -> pd.DataFrame:
+        """
+        A DataFrame containing airplane data.
         """
+        return self._load_table("airplanes_df")
 
-        # Check if the country exists in the DataFrame
-        if country not in self.airports_df["Country"].values:
-            raise ValueError(
-                f"The specified country '{country}' does not exist in the provided data."
-            )
+    @airplanes_df.setter
+    def airplanes_df(self, table: pd.DataFrame) -> None:
+        self._store_table("airplanes_df", table)
 
-        # Filter the dataframe for the specified country
-        country_airports = self.airports_df[self.airports_df["Country"] == country]
+    @property
+    def airports_df(self) -> pd.DataFrame:
+        """
+        A DataFrame containing airport data.
+        """
+        return self._load_table("airports_df")
 
-        # Calculate the mean latitude and longitude to center the map
-        mean_lat = country_airports["Latitude"].mean()
-        mean_long = country_airports["Longitude"].mean()
+    @airports_df.setter
+    def airports_df(self, table: pd.DataFrame) -> None:
+        self._store_table("airports_df", table)
 
-        # Create a map centered at the mean latitude and longitude with a simple tileset
-        country_map = folium.Map(
-            location=[mean_lat, mean_long], tiles="CartoDB positron", zoom_start=6
-        )
-
-        # Add a circle marker for each airport
-        for _, row in country_airports.iterrows():
-            folium.Circle(
-                location=[row["Latitude"], row["Longitude"]],
-                radius=25,
-                color="black",
-                weight=1,
-                fill_opacity=0.6,
-                opacity=1,
-                fill_color="red",
-                fill=True,
-                tooltip=row["Name"],
-            ).add_to(country_map)
+    @property
+    def routes_df(self) -> pd.DataFrame:
+        """
+        A DataFrame containing route data, enriched with coordinates and distances.
+        """
+        return self._load_table("routes_df")
 
-        # Return the map object
-        return country_map
+    @routes_df.setter
+    def routes_df(self, table: pd.DataFrame) -> None:
+        self._store_table("routes_df", table)
 
-    def distance_analysis(self) -> None:
+    def _store_table(self, name: str, table: pd.DataFrame) -> None:
         """
-        Plots the distribution of flight distances.
+        Stores a loaded or replaced table and drops what was derived from the
+        previous version of it: the airport index is rebuilt and the spatial index
+        is discarded with the airports, the route graph and the airline index with
+        the routes, the route table and the country flows with the routes or
+        airports, and the equipment cube with the routes, airports or airplanes.
+        The cached results are always discarded.
 
         Parameters
         ------------
-        self: FlightData
+        name: str
+            The name of the table, one of TABLE_NAMES.
+        table: pandas.DataFrame
+            The table.
+        """
+        self._tables[name] = table
+        if name == "airports_df":
+            self._airport_index = self._build_airport_index()
+            self._spatial_index = None
+        if name == "routes_df":
+            self._route_graph = None
+            self._airline_index = None
+        if name in ["airports_df", "routes_df"]:
+            self._route_table = None
+            self._country_flows = None
+        if name != "airlines_df":
+            self._equipment_cube = None
+        self._result_cache.clear()
+
+    @property
+    def result_cache(self) -> ResultCache:
+        """
+        The cache of the results of the plotting and analytics methods.
+        """
+        return self._result_cache
 
-        Returns
-        ---------
-        None
+    def cache_info(self) -> CacheInfo:
         """
-        # Plot the distribution of flight distances
-        plt.figure(figsize=(10, 6))
-        plt.hist(
-            self.routes_df["distance_km"], bins=100, color="blue", edgecolor="black"
-        )
-        plt.title("Distribution of Flight Distances")
-        plt.xlabel("Distance (km)")
-        plt.ylabel("Number of Flights")
-        plt.grid(True)
-        plt.show()
+        Returns the hits, misses, maximum size and current size of the result cache
+        of the plotting and analytics methods.
+        """
+        return self._result_cache.info()
 
-    def plot_airport_flights(self, airport_code: str, internal=False) -> folium.Map:
+    def cache_clear(self) -> None:
         """
-        Plots the flight routes from a specified airport on a map.
+        Removes all cached results of the plotting and analytics methods.
+        """
+        self._result_cache.clear()
 
-        Parameters
-        ------------
-        airport_code: str
-            The IATA code of the airport to plot flights from.
-        internal: bool, optional
-            Whether to only include flights within the same country.
+    def _download(self) -> None:
+        """
+        Downloads the zip file, unless download is False and the file exists,
+        and calculates its cache key, once per instance.
+        """
+        if self._cache_key is None:
+            if self.download or not os.path.exists(self.file):
+                download_file(self.url, self.file)  # Downloading the zip file
+            self._cache_key = file_hash(self.file) if self.use_cache else ""
 
-        Returns
-        ---------
-        folium.Map
-            A map object with plotted flight routes.
+    def _load_tables(self, names: list) -> None:
+        """
+        Loads several tables at once. The CSV files of all tables that are not cached
+        are parsed by a single call to unzip, concurrently if parallel is set.
 
-        Raises
+        Parameters
         ------------
-        ValueError
-            If the specified airport does not exist in the provided data.
+        names: list
+            The names of the tables, in the order of TABLE_NAMES.
         """
-        # Check if the airport exists in the DataFrame
-        source_airport_info = self.airports_df[self.airports_df["IATA"] == airport_code]
-        if source_airport_info.empty:
-            print(f"No information found for airport code {airport_code}.")
-            return None
-
-        # Filter the routes DataFrame for flights departing from the specified airport
-        departing_flights = self.routes_df[
-            self.routes_df["Source airport"] == airport_code
+        self._download()
+        to_parse = [
+            name
+            for name in names
+            if name not in self._tables
+            and not (self.use_cache and is_cached(self.cache_dir, self._cache_key, name))
         ]
-        # Create a map centered at the source airport with a simple tileset
-        source_lat = source_airport_info.iloc[0]["Latitude"]
-        source_long = source_airport_info.iloc[0]["Longitude"]
-        flight_map = folium.Map(location=[source_lat, source_long], zoom_start=5)
-
-        # Add a line for each flight route
-        for _, flight in departing_flights.iterrows():
-            destination_airport_code = flight["Destination airport"]
-            destination_airport_info = self.airports_df[
-                self.airports_df["IATA"] == destination_airport_code
-            ]
-            # Skip if the destination airport does not exist in the data
-            if destination_airport_info.empty:
-                continue
-            # Get the latitude and longitude of the destination airport
-            destination_lat = destination_airport_info.iloc[0]["Latitude"]
-            destination_long = destination_airport_info.iloc[0]["Longitude"]
-            # Skip if internal and the source and destination airports are in different countries
-            if internal and (
-                source_airport_info.iloc[0]["Country"]
-                != destination_airport_info.iloc[0]["Country"]
-            ):
-                continue
-            # Set the line color to blue for internal flights and red for international flights
-            color = (
-                "blue"
-                if source_airport_info.iloc[0]["Country"]
-                == destination_airport_info.iloc[0]["Country"]
-                else "red"
+        dataframes_dict = {}
+        if to_parse:
+            # Unzipping and loading the CSVs into DataFrames
+            dataframes_dict = unzip(
+                self.file,
+                members=[name.replace("_df", ".csv") for name in to_parse],
+                schemas=TABLE_SCHEMAS,
+                parallel=self.parallel,
             )
-            # Add the line to the map
-            folium.PolyLine(
-                locations=[
-                    (source_lat, source_long),
-                    (destination_lat, destination_long),
-                ],
-                color=color,
-            ).add_to(flight_map)
+        for name in names:
+            self._load_table(name, dataframes_dict if name in to_parse else None)
 
-        return flight_map
-
-    def plot_top_models(self, countries: list = None, top_n: int = 10) -> None:
+    def _load_table(self, name: str, dataframes_dict: dict = None) -> pd.DataFrame:
         """
-        Plots the N most used airplane models by number of routes.
+        Returns a table, loading it on first access. The zip file is downloaded if
+        needed and the table is taken from the cache, or else read from the zip file,
+        pruned to its allowed columns, processed and stored in the cache.
 
         Parameters
         ------------
-        countries: list, optional
-            A list of country names to filter the routes by.
-        top_n: int, optional
-            The number of top airplane models to plot.
+        name: str
+            The name of the table, one of TABLE_NAMES.
+        dataframes_dict: dict, optional
+            CSV files that were already parsed by unzip, to use instead of the cache.
 
         Returns
         ---------
-        None
-
-        Raises
-        ------------
-        ValueError
-            If the specified country does not exist in the provided data.
+        pandas.DataFrame
+            The loaded table. Empty if the zip file has no CSV file for it.
         """
-        # Use self.routes_df directly, ensuring 'routes' is always defined
-        routes = self.routes_df.copy()
+        if name in self._tables:
+            return self._tables[name]
 
-        # Check if the countries exist in the airports_df
-        if countries is not None:
-            if isinstance(countries, str):
-                countries = [countries]
+        self._download()
 
-            # Get unique countries from airports_df
-            valid_countries = set(self.airports_df["Country"].unique())
-            invalid_countries = [
-                country for country in countries if country not in valid_countries
-            ]
+        # Load the processed DataFrame from the cache if the zip file has not changed
+        table = None
+        if self.use_cache and dataframes_dict is None:
+            table = load_table(self.cache_dir, self._cache_key, name)
 
-            if invalid_countries:
-                invalid_countries_str = ", ".join(invalid_countries)
-                raise ValueError(
-                    f"The following countries do not exist in the data: {invalid_countries_str}"
+        if table is None:
+            if dataframes_dict is None:
+                # Unzipping and loading the CSV into a DataFrame
+                dataframes_dict = unzip(
+                    self.file, members=[name.replace("_df", ".csv")], schemas=TABLE_SCHEMAS
                 )
+            if name in dataframes_dict:
+                # Removing superfluous columns
+                table = dataframes_dict[name][TABLE_COLUMNS[name]].copy()
+                if name == "routes_df":
+                    table = self._enrich_routes(table)
+                # Store the processed DataFrame for the next run
+                if self.use_cache:
+                    save_table(self.cache_dir, self._cache_key, name, table)
+            else:
+                table = pd.DataFrame()
+
+        self._store_table(name, table)
+        return table
+
+    def apply_delta(self, file: str = None) -> DeltaInfo:
+        """
+        Updates the tables to a new snapshot of the flight data. Instead of processing
+        the snapshot from scratch, its airports and routes are compared with the loaded
+        tables row by row: only the routes that are new, or whose airports were added,
+        removed or changed, get their coordinates and distances calculated, and the
+        equipment cube explodes only those routes. The route graph and the spatial
+        index are rebuilt on their next use, and the cached results are discarded.
+        The resulting tables are the same as those of a FlightData of the new snapshot.
 
-            # Filter airports to those in the specified countries
-            airports_in_countries = self.airports_df[
-                self.airports_df["Country"].isin(countries)
-            ]
-            # Filter routes where either source or destination airport is in the specified countries
-            routes = routes[
-                (routes["Source airport"].isin(airports_in_countries["IATA"]))
-                | (routes["Destination airport"].isin(airports_in_countries["IATA"]))
-            ]
+        Parameters
+        ------------
+        file: str, optional
+            The zip file of the new snapshot. By default the zip file is downloaded
+            again from url. The file becomes the file of the instance and, with
+            use_cache, the updated tables are cached under its content hash.
 
-        # Expand 'Equipment' field into separate rows for accurate counting
-        expanded_equipment = (
-            routes["Equipment"]
-            .str.split(" ", expand=True)
-            .stack()
-            .reset_index(level=1, drop=True)
-        )
-        # Count the number of routes for each airplane model
-        route_counts = (
-            expanded_equipment.value_counts()
-            .rename_axis("IATA code")
-            .reset_index(name="Counts")
-        )
+        Returns
+        ---------
+        DeltaInfo
+            The number of added, removed and changed airports (by Airport ID) and
+            routes (by airline, source and destination airport), and the number of
+            routes whose coordinates and distances were calculated.
 
-        # Merge with airplanes_df to get model names, sort by 'Counts', and select top n
-        model_counts = route_counts.merge(self.airplanes_df, on="IATA code")
-        model_counts = (
-            model_counts.groupby("Name")
-            .sum()
-            .sort_values(by="Counts", ascending=False)
-            .head(top_n)
+        Example
+        ---------
+        flight_data = FlightData()
+        flight_data.apply_delta("downloads/flight_data_2025.zip")
+        """
+        self._load_tables(TABLE_NAMES)
+        if file is None:
+            download_file(self.url, self.file)
+            file = self.file
+        new_tables = unzip(
+            file,
+            members=[name.replace("_df", ".csv") for name in TABLE_NAMES],
+            schemas=TABLE_SCHEMAS,
+            parallel=self.parallel,
         )
-
-        # Plot
-        plt.figure(figsize=(10, 6))
-        plt.bar(model_counts.index, model_counts["Counts"])
-        plt.xlabel("Airplane Model")
-        plt.ylabel("Number of Routes")
-        plt.title(
-            f"Top {top_n} Most Used Airplane Models"
-            + (" Worldwide" if not countries else f' in {", ".join(countries)}')
+        new_tables = {
+            name: new_tables[name][TABLE_COLUMNS[name]].copy()
+            if name in new_tables
+            else pd.DataFrame()
+            for name in TABLE_NAMES
+        }
+        equipment_cube = self._equipment_cube
+
+        # Airlines and airplanes are small and replaced as a whole if they changed
+        for name in ["airlines_df", "airplanes_df"]:
+            if not self._same_table(name, new_tables[name]):
+                if name == "airplanes_df":
+                    equipment_cube = None
+                self._store_table(name, new_tables[name])
+
+        # The codes of the airports that were added, removed or changed
+        airports = new_tables["airports_df"]
+        matches = match_rows(self.airports_df, airports, TABLE_COLUMNS["airports_df"])
+        old_airports = self.airports_df.iloc[unmatched(matches, len(self.airports_df))]
+        new_airports = airports.iloc[np.flatnonzero(matches < 0)]
+        airport_changes = count_changes(old_airports, new_airports, TABLE_KEYS["airports_df"])
+        changed_codes = pd.concat(
+            [
+                table[column].astype(object)
+                for table in [old_airports, new_airports]
+                for column in ["IATA", "ICAO"]
+            ]
+        ).unique()
+        if not np.array_equal(matches, np.arange(len(self.airports_df))):
+            self._store_table("airports_df", airports)
+
+        # Routes that are unchanged and whose airports are unchanged are reused
+        old_routes = self.routes_df
+        routes = new_tables["routes_df"]
+        previous = match_rows(old_routes, routes, TABLE_COLUMNS["routes_df"])
+        route_changes = count_changes(
+            old_routes.iloc[unmatched(previous, len(old_routes))],
+            routes.iloc[np.flatnonzero(previous < 0)],
+            TABLE_KEYS["routes_df"],
         )
-        plt.xticks(rotation=45, ha="right")
-        plt.tight_layout()
-        plt.show()
+        for column in ["Source airport", "Destination airport"]:
+            moved = old_routes[column].astype(object).isin(changed_codes).to_numpy()
+            previous[(previous >= 0) & moved[np.maximum(previous, 0)]] = -1
+        reused = np.flatnonzero(previous >= 0)
+        enriched = np.flatnonzero(previous < 0)
+        if not np.array_equal(previous, np.arange(len(old_routes))):
+            # The parsed columns are taken as they are, the columns added by
+            # _enrich_routes are copied from the old routes or calculated
+            computed = self._enrich_routes(routes.iloc[enriched].copy())
+            routes = routes.copy()
+            for column in computed.columns.difference(routes.columns, sort=False):
+                values = np.empty(len(routes), dtype=old_routes[column].dtype)
+                values[reused] = old_routes[column].to_numpy()[previous[reused]]
+                values[enriched] = computed[column].to_numpy()
+                routes[column] = values
+            self._store_table("routes_df", routes)
+            if equipment_cube is not None:
+                equipment_cube.update(
+                    self.route_table, self.airports_df, self.airplanes_df, previous
+                )
+        self._equipment_cube = equipment_cube
 
-    def plot_country_flights(
-        self,
-        country_name: str,
-        threshold: int = 1000,
-        internal: bool = False,
-        train_plane_ratio: float = 3 / 25,
-    ) -> folium.Map:
+        self.file = file
+        if self.use_cache:
+            self._cache_key = file_hash(file)
+            for name in TABLE_NAMES:
+                save_table(self.cache_dir, self._cache_key, name, self._tables[name])
+        return DeltaInfo(*airport_changes, *route_changes, len(enriched))
+
+    def _same_table(self, name: str, table: pd.DataFrame) -> bool:
         """
-        Plots the flight routes from all airports in a specified country on a map.
+        Returns whether a loaded table has the same rows as a new version of it.
+        """
+        current = self._tables[name]
+        if len(current) != len(table) or list(current.columns) != list(table.columns):
+            return False
+        if current.equals(table):
+            return True
+        return bool((match_rows(current, table, list(table.columns)) >= 0).all())
+
+    def _enrich_routes(self, routes: pd.DataFrame) -> pd.DataFrame:
+        """
+        Adds the coordinates of the source and destination airports and the
+        distance between them to the routes.
 
         Parameters
         ------------
-        country_name: str
-            The name of the country to plot flights for.
-        threshold: int, optional
-            The distance threshold in kilometers to distinguish short-haul from long-haul flights.
-        internal: bool, optional
-            Whether to only include flights within the same country.
-        train_plane_ratio: float, optional
-            The ratio of train to plane emissions for short-haul flights.
+        routes: pandas.DataFrame
+            The routes as read from the zip file.
 
         Returns
         ---------
-        folium.Map
-            A map object with plotted flight routes.
-
-        Raises
-        ------------
-        ValueError
-            If the specified country does not exist in the provided data.
-
-        Notes
-        ------------
-        The train_plane_ratio is used to calculate the potential reduction in CO2 emissions
-        if short-haul flights were replaced with train services. The default value of 3/25
-        is based on the average CO2 emissions per passenger-kilometer for trains and planes.
-
-        The map also includes a legend with the total distance and count of short-haul and
-        long-haul flights, as well as the potential reduction in CO2 emissions.
-
-        The map is colored blue for short-haul flights and red for long-haul flights.
+        pandas.DataFrame
+            The routes with the coordinates and the distance_km column.
         """
-        # Check if the country exists in the DataFrame
-        country_airports = self.airports_df[self.airports_df["Country"] == country_name]
-        # If the country does not exist in the DataFrame, raise a ValueError
-        if country_airports.empty:
-            raise ValueError(
-                f"The specified country '{country_name}' does not exist in the provided data."
-            )
-        # Calculate the mean latitude and longitude to center the map
-        mean_lat = country_airports["Latitude"].mean()
-        mean_long = country_airports["Longitude"].mean()
-        flight_map = folium.Map(location=[mean_lat, mean_long], zoom_start=5)
-
-        # Initialize variables to store the total distance and count of short- and long-haul flights
-        sh_dist = 0
-        sh_count = 0
-        lh_dist = 0
-        lh_count = 0
-
-        # Iterate over the airports in the specified country
-        for _, source_airport in country_airports.iterrows():
-            source_airport_code = source_airport["IATA"]
-            departing_flights = self.routes_df[
-                self.routes_df["Source airport"] == source_airport_code
-            ]
-            # Iterate over the departing flights from the current airport
-            for _, flight in departing_flights.iterrows():
-                destination_airport_code = flight["Destination airport"]
-                destination_airport_info = self.airports_df[
-                    self.airports_df["IATA"] == destination_airport_code
-                ]
-                # Skip if the destination airport does not exist in the data
-                if destination_airport_info.empty:
-                    continue
-
-                destination_lat = destination_airport_info.iloc[0]["Latitude"]
-                destination_long = destination_airport_info.iloc[0]["Longitude"]
-                # If internal source and destination airports are in different countries, skip
-                if internal and (
-                    source_airport["Country"]
-                    != destination_airport_info.iloc[0]["Country"]
-                ):
-                    continue
-                # Increment the total distance and count of short-haul and long-haul flights
-                # Set the line color to blue for internal flights and red for international flights
-                if flight["distance_km"] < threshold:
-                    sh_dist += flight["distance_km"]
-                    sh_count += 1
-                    color = "blue"
-                else:
-                    lh_dist += flight["distance_km"]
-                    lh_count += 1
-                    color = "red"
-
-                # Add the line to the map
-                folium.PolyLine(
-                    locations=[
-                        (source_airport["Latitude"], source_airport["Longitude"]),
-                        (destination_lat, destination_long),
-                    ],
-                    color=color,
-                ).add_to(flight_map)
-
-        # If one was to replace short-haul flights with trains
-        emission_reduction = (
-            (train_plane_ratio * sh_dist + lh_dist)
-            / (sh_dist + lh_dist)
-            * 100
+        # Adding "lat" and "long" columns of the source and destination airports,
+        # resolved through the airport index instead of merging on airports_df.
+        # Their IATA codes are not copied, as the route columns already hold the codes
+        for prefix, code_column in [
+            ("Source", "Source airport"),
+            ("Destination", "Destination airport"),
+        ]:
+            matched = self.airport_index.reindex(routes[code_column])
+            routes[f"{prefix} latitude"] = matched["Latitude"].to_numpy()
+            routes[f"{prefix} longitude"] = matched["Longitude"].to_numpy()
+
+        # Calculate the distance in km between source and destination airports
+        routes["distance_km"] = distance_many(
+            routes["Source latitude"],
+            routes["Source longitude"],
+            routes["Destination latitude"],
+            routes["Destination longitude"],
         )
+        return routes
 
-        # Create a legend with the total distance and count of short-haul and long-haul flights
-        legend_html = (
-            f"<div style=\"position: fixed; "
-            f"bottom: 20px; left: 20px; width: 320px; height: 200px; "
-            f"border:2px solid grey; z-index:9999; font-size:14px; "
-            f"background-color:white; "
-            f"opacity: 0.95; "
-            f"padding: 10px; "
-            f"\">&nbsp;<b>Flight Legend</b><br>"
-            f"&nbsp;<span style='color: blue;'>Short-haul flights</span><br>"
-            f"&nbsp;Count: <b>{sh_count}</b> - Total distance: <b>{sh_dist:.2f}</b> km<br>"
-            f"&nbsp;<span style='color: red;'>Long-haul flights</span><br>"
-            f"&nbsp;Count: <b>{lh_count}</b> - Total distance: <b>{lh_dist:.2f}</b> km<br><br>"
-            f"&nbsp;If we were to replace short-haul flights with<br>"
-            f"&nbsp;rail services, we could reduce CO2<br>"
-            f"&nbsp;emissions to <b>{emission_reduction:.2f}</b>% of the current emissions."
-            f"</div>"
-        )
-
-        # Add the HTML code to the Folium map
-        legend = Element(legend_html)
-        flight_map.get_root().html.add_child(legend)
-
-        return flight_map
-
-    def aircrafts(self) -> list:
+    def stream_routes(
+        self,
+        route_file: str,
+        store_path: str,
+        member: str = "routes.csv",
+        chunksize: int = 100_000,
+    ) -> int:
         """
-        Print the list of unique airplane models in the data.
-        Uses the airplanes_df attribute from the class and
-        prints the unique airplane models using the attribute
-        Name from the dataframe.
+        Enriches a route file that may be far larger than memory chunk by chunk
+        and writes the enriched routes to a Parquet store. Each chunk gets the same
+        airport coordinates and distance_km column as routes_df, while only the
+        airports and a single chunk are held in memory.
 
         Parameters
         ------------
-        self: FlightData
+        route_file: str
+            The zip file containing the routes, e.g. multi-year schedule data.
+        store_path: str
+            The path of the Parquet file to write.
+        member: str, optional
+            The name of the csv file with the routes inside the zip file.
+        chunksize: int, optional
+            The number of routes per chunk.
 
         Returns
         ---------
-        unique_aircrafts: list
-            A list of unique airplane models.
+        int
+            The number of routes written to the store.
 
         Example
         ------------
-        flight_data = FlightData()
-        flight_data.aircrafts()
+        flight_data = FlightData(lazy=True)
+        flight_data.stream_routes("downloads/schedules.zip", "downloads/routes.parquet")
+        """
+        chunks = iter_csv_chunks(
+            route_file,
+            member,
+            chunksize=chunksize,
+            usecols=TABLE_COLUMNS["routes_df"],
+            dtype=ROUTE_STREAM_DTYPES,
+            na_values=["\\N"],
+        )
+        enriched_chunks = (
+            self._enrich_routes(chunk[TABLE_COLUMNS["routes_df"]]) for chunk in chunks
+        )
+        return write_chunks(enriched_chunks, store_path)
 
+    @property
+    def airport_index(self) -> pd.DataFrame:
+        """
+        The airports indexed by their IATA and ICAO codes.
         """
-        # Get the unique airplane models from the airplanes_df attribute
-        unique_aircrafts = self.airplanes_df["Name"].unique()
-        print("List of airplane models:")
-        print(list(unique_aircrafts))
+        self._load_table("airports_df")
+        return self._airport_index
 
-        return list(unique_aircrafts)
+    @property
+    def equipment_cube(self) -> EquipmentCube:
+        """
+        The airplane model counts per country, built from the routes the first
+        time they are needed and reused by every later query.
+        """
+        if self._equipment_cube is None:
+            self._equipment_cube = EquipmentCube(
+                self.route_table, self.airports_df, self.airplanes_df
+            )
+        return self._equipment_cube
 
-    def aircraft_info(self, aircraft_name: str):
+    @property
+    def airline_index(self) -> AirlineIndex:
         """
+        The positions of the routes grouped by Airline ID, built from the routes the
+        first time they are needed and reused by every airline query.
+        """
+        if self._airline_index is None:
+            self._airline_index = AirlineIndex(self.routes_df)
+        return self._airline_index
 
-        Print the specifications of a specific airplane model.
-        Uses the airplanes_df attribute from the class and prints the specifications of
-        the airplane model using the attribute Name from the dataframe.
-        The method accesses ChatOpenAI to get the information about the airplane model.
+    @property
+    def country_flows(self) -> CountryFlows:
+        """
+        The route counts and distances between every pair of countries and the airports
+        of each country. They are built at load time, or on first use with lazy=True or
+        after the airports or routes are replaced.
+        """
+        if self._country_flows is None:
+            self._country_flows = self._build_country_flows()
+        return self._country_flows
 
-        Parameters
-        ------------
-        self            : FlightData
-        aircraft_name   : str = the name of the airplane model
+    def _build_country_flows(self) -> CountryFlows:
+        """
+        Aggregates the departures of every country per country of arrival.
+        """
+        return CountryFlows(
+            departure_table(self.airports_df, self.routes_df, self.airport_index),
+            self.airports_df,
+        )
 
-        Returns
-        ------------
-        aircraft_info: A table of specifications about the airplane in Markdown.
+    @property
+    def route_table(self) -> RouteTable:
+        """
+        The routes as parallel arrays of interned int32 airport, airline and airplane
+        IDs, built from the routes the first time they are needed. The equipment cube
+        and airline_fleet join the airplanes and airports through it by array lookups;
+        RouteTable.to_frame materializes columns on demand.
+        """
+        if self._route_table is None:
+            self._route_table = RouteTable(self.routes_df, self.airports_df, self.airport_index)
+        return self._route_table
 
-        Example
-        ------------
-        flight_data = FlightData()
-        flight_data.aircraft_info("Boeing 737-800")
-        """
-        # Check if the airplane model exists in the DataFrame
-        if self.airplanes_df[self.airplanes_df.Name == aircraft_name].empty:
-            # If the airplane model does not exist in the DataFrame, raise a ValueError
-            raise ValueError(
-                f"Aircraft {aircraft_name} not found in the data."
-                f"Choose one of the following: {self.aircrafts()}"
-            )
-        # Access ChatOpenAI to get the information about the airplane model
-        llm = ChatOpenAI(temperature=0.1)
-        aircraft_info = llm.invoke(f"Tell me about the airplane {aircraft_name}")
-        # Print the specifications of the airplane model in Markdown
-        display(
-            Markdown(
-                aircraft_info.content.replace(aircraft_name, ("**" + aircraft_name + "**"))
+    @property
+    def route_graph(self) -> RouteGraph:
+        """
+        The airports connected by the routes as a directed graph weighted by
+        distance_km, built from the routes the first time it is needed.
+        """
+        # pylint: disable=import-outside-toplevel
+        from Functions.route_graph import RouteGraph
+        if self._route_graph is None:
+            self._route_graph = RouteGraph(self.routes_df)
+        return self._route_graph
+
+    @property
+    def spatial_index(self) -> SpatialIndex:
+        """
+        A k-d tree over the coordinates of the airports, built the first time it is needed.
+        """
+        # pylint: disable=import-outside-toplevel
+        from Functions.spatial import SpatialIndex
+        if self._spatial_index is None:
+            self._spatial_index = SpatialIndex(self.airports_df)
+        return self._spatial_index
+
+    @property
+    def llm_lookup(self) -> LLMLookup:
+        """
+        The language model client with its answer cache, created the first time
+        it is needed and reused by every lookup.
+        """
+        # pylint: disable=import-outside-toplevel
+        from Functions.llm_lookup import LLMLookup
+        if self._llm_lookup is None:
+            self._llm_lookup = LLMLookup(
+                cache_dir=self.llm_cache_dir, max_concurrency=self.llm_concurrency
             )
-        )
+        return self._llm_lookup
 
-    def airports(self):
+    @llm_lookup.setter
+    def llm_lookup(self, llm_lookup: LLMLookup) -> None:
+        self._llm_lookup = llm_lookup
+
+    def _build_airport_index(self) -> pd.DataFrame:
         """
-        Print the list of unique airports in the data.
-        Uses the airports_df attribute from the class and
-        prints the unique airports using the attribute
-        Name from the dataframe.
+        Builds a lookup table from IATA and ICAO codes to airport rows.
+        Codes that are missing ("\\N") are skipped and for codes that occur
+        more than once the first airport is kept, like a boolean mask followed by iloc[0].
+        The IATA codes come first, so a code that is the IATA code of one airport and
+        the ICAO code of another finds the airport with the IATA code.
 
         Parameters
         ------------
@@ -653,56 +840,31 @@ class FlightData(BaseModel):
 
         Returns
         ---------
-        unique_airports: list
-            A list of unique airports.
-
-        Example
-        ------------
-        flight_data = FlightData()
-        flight_data.airports()
+        pandas.DataFrame
+            The rows of airports_df indexed by airport code.
         """
-        # Get the unique airports from the airports_df attribute
-        unique_airports = self.airports_df["Name"].unique()
-        print("List of airports in the data:")
-        print(list(unique_airports))
-
-        return list(unique_airports)
-
-    def airport_info(self, airport_name: str):
+        lookups = []
+        for code_column in ["IATA", "ICAO"]:
+            codes = self.airports_df[code_column]
+            valid = self.airports_df[codes.notna() & (codes != "\\N")]
+            lookups.append(valid.set_index(valid[code_column].astype(object).rename("Code")))
+        airport_index = pd.concat(lookups)
+        return airport_index[~airport_index.index.duplicated(keep="first")]
+
+    def lookup_airport(self, airport_code: str):
         """
-
-        Print the specifications of a specific airport.
-        Uses the airports_df attribute from the class and prints the specifications of the airport
-        using the attribute Name from the dataframe.
-        The method accesses ChatOpenAI to get the information about the airport.
+        Returns the airport row for an IATA or ICAO code using the airport index.
 
         Parameters
         ------------
-        self            : FlightData
-        airport_name    : str = the name of the airport
+        airport_code: str
+            The IATA or ICAO code of the airport.
 
         Returns
-        ------------
-        airport_info: A table of specifications about the airport in Markdown.
-
-        Example
-        ------------
-        flight_data = FlightData()
-        flight_data.airport_info("Schiphol Airport")
-        """
-        # Check if the airport exists in the DataFrame
-        if self.airports_df[self.airports_df.Name == airport_name].empty:
-            # If the airport does not exist in the DataFrame, raise a ValueError
-            raise ValueError(
-                f"Aircraft {airport_name} not found in the data."
-                f"Choose one of the following: {self.airports()}"
-            )
-        # Access ChatOpenAI to get the information about the airport
-        llm = ChatOpenAI(temperature=0.1)
-        airport_info = llm.invoke(f"Tell me about the airplane {airport_name}")
-        # Print the specifications of the airport in Markdown
-        display(
-            Markdown(
-                airport_info.content.replace(airport_name, ("**" + airport_name + "**"))
-            )
-        )
+        ---------
+        pandas.Series or None
+            The airport row, or None if the code is not in the data.
+        """
+        if airport_code not in self.airport_index.index:
+            return None
+        return self.airport_index.loc[airport_code]
@@ -0,0 +1,210 @@
+"""
+This module contains the methods of FlightData that list the airplane models and
+airports and look up their specifications with a language model.
+
+IPython is imported on first use, as in flight.py.
+"""
+
+# The prompts of the language model lookups
+AIRCRAFT_PROMPT = "Tell me about the airplane {}"
+AIRPORT_PROMPT = "Tell me about the airport {}"
+
+
+class LookupMixin:
+    """
+    The methods of FlightData that list the airplane models and airports and ask
+    the language model of llm_lookup about them.
+    """
+
+    def aircrafts(self) -> list:
+        """
+        Print the list of unique airplane models in the data.
+        Uses the airplanes_df attribute from the class and
+        prints the unique airplane models using the attribute
+        Name from the dataframe.
+
+        Parameters
+        ------------
+        self: FlightData
+
+        Returns
+        ---------
+        unique_aircrafts: list
+            A list of unique airplane models.
+
+        Example
+        ------------
+        flight_data = FlightData()
+        flight_data.aircrafts()
+
+        """
+        # Get the unique airplane models from the airplanes_df attribute
+        unique_aircrafts = self.airplanes_df["Name"].unique()
+        print("List of airplane models:")
+        print(list(unique_aircrafts))
+
+        return list(unique_aircrafts)
+
+    def aircraft_info(self, aircraft_name: str):
+        """
+
+        Print the specifications of a specific airplane model.
+        Uses the airplanes_df attribute from the class and prints the specifications of
+        the airplane model using the attribute Name from the dataframe.
+        The method accesses ChatOpenAI to get the information about the airplane model.
+
+        Parameters
+        ------------
+        self            : FlightData
+        aircraft_name   : str = the name of the airplane model
+
+        Returns
+        ------------
+        aircraft_info: A table of specifications about the airplane in Markdown.
+
+        Example
+        ------------
+        flight_data = FlightData()
+        flight_data.aircraft_info("Boeing 737-800")
+        """
+        # pylint: disable=import-outside-toplevel
+        from IPython.display import Markdown, display
+        # Check if the airplane model exists in the DataFrame
+        if self.airplanes_df[self.airplanes_df.Name == aircraft_name].empty:
+            # If the airplane model does not exist in the DataFrame, raise a ValueError
+            raise ValueError(
+                f"Aircraft {aircraft_name} not found in the data."
+                f"Choose one of the following: {self.aircrafts()}"
+            )
+        # Access ChatOpenAI, or the cache, to get the information about the airplane model
+        aircraft_info = self.llm_lookup.ask(aircraft_name, AIRCRAFT_PROMPT.format(aircraft_name))
+        # Print the specifications of the airplane model in Markdown
+        display(
+            Markdown(aircraft_info.replace(aircraft_name, ("**" + aircraft_name + "**")))
+        )
+
+    def aircraft_info_many(self, aircraft_names: list) -> dict:
+        """
+        Gets the specifications of many airplane models at once. The language model
+        is asked about all models concurrently, with at most llm_concurrency requests
+        at a time, and models that were asked about before are taken from the cache.
+
+        Parameters
+        ------------
+        self            : FlightData
+        aircraft_names  : list = the names of the airplane models
+
+        Returns
+        ------------
+        dict: The specifications in Markdown, keyed on the name of the airplane model.
+
+        Example
+        ------------
+        flight_data = FlightData()
+        flight_data.aircraft_info_many(["Boeing 737-800", "Airbus A320"])
+        """
+        unknown = sorted(set(aircraft_names) - set(self.airplanes_df["Name"]))
+        if unknown:
+            raise ValueError(
+                f"Aircraft {', '.join(unknown)} not found in the data."
+                f"Choose one of the following: {self.aircrafts()}"
+            )
+        answers = self.llm_lookup.ask_many(
+            [(name, AIRCRAFT_PROMPT.format(name)) for name in aircraft_names]
+        )
+        return dict(zip(aircraft_names, answers))
+
+    def airports(self):
+        """
+        Print the list of unique airports in the data.
+        Uses the airports_df attribute from the class and
+        prints the unique airports using the attribute
+        Name from the dataframe.
+
+        Parameters
+        ------------
+        self: FlightData
+
+        Returns
+        ---------
+        unique_airports: list
+            A list of unique airports.
+
+        Example
+        ------------
+        flight_data = FlightData()
+        flight_data.airports()
+        """
+        # Get the unique airports from the airports_df attribute
+        unique_airports = self.airports_df["Name"].unique()
+        print("List of airports in the data:")
+        print(list(unique_airports))
+
+        return list(unique_airports)
+
+    def airport_info(self, airport_name: str):
+        """
+
+        Print the specifications of a specific airport.
+        Uses the airports_df attribute from the class and prints the specifications of the airport
+        using the attribute Name from the dataframe.
+        The method accesses ChatOpenAI to get the information about the airport.
+
+        Parameters
+        ------------
+        self            : FlightData
+        airport_name    : str = the name of the airport
+
+        Returns
+        ------------
+        airport_info: A table of specifications about the airport in Markdown.
+
+        Example
+        ------------
+        flight_data = FlightData()
+        flight_data.airport_info("Schiphol Airport")
+        """
+        # pylint: disable=import-outside-toplevel
+        from IPython.display import Markdown, display
+        # Check if the airport exists in the DataFrame
+        if self.airports_df[self.airports_df.Name == airport_name].empty:
+            # If the airport does not exist in the DataFrame, raise a ValueError
+            raise ValueError(
+                f"Airport {airport_name} not found in the data."
+                f"Choose one of the following: {self.airports()}"
+            )
+        # Access ChatOpenAI, or the cache, to get the information about the airport
+        airport_info = self.llm_lookup.ask(airport_name, AIRPORT_PROMPT.format(airport_name))
+        # Print the specifications of the airport in Markdown
+        display(Markdown(airport_info.replace(airport_name, ("**" + airport_name + "**"))))
+
+    def airport_info_many(self, airport_names: list) -> dict:
+        """
+        Gets the specifications of many airports at once. The language model is asked
+        about all airports concurrently, with at most llm_concurrency requests at a
+        time, and airports that were asked about before are taken from the cache.
+
+        Parameters
+        ------------
+        self            : FlightData
+        airport_names   : list = the names of the airports
+
+        Returns
+        ------------
+        dict: The specifications in Markdown, keyed on the name of the airport.
+
+        Example
+        ------------
+        flight_data = FlightData()
+        flight_data.airport_info_many(["Schiphol Airport", "Frankfurt am Main Airport"])
+        """
+        unknown = sorted(set(airport_names) - set(self.airports_df["Name"]))
+        if unknown:
+            raise ValueError(
+                f"Airport {', '.join(unknown)} not found in the data."
+                f"Choose one of the following: {self.airports()}"
+            )
+        answers = self.llm_lookup.ask_many(
+            [(name, AIRPORT_PROMPT.format(name)) for name in airport_names]
+        )
+        return dict(zip(airport_names, answers))
@@ -0,0 +1,593 @@
+"""
+This module contains the methods of FlightData that plot the airports and routes on
+maps and the distances and airplane models on charts.
+
+folium, branca, matplotlib and the map and chart helpers are imported on first use,
+as in flight.py.
+"""
+
+from __future__ import annotations
+
+import os
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pandas as pd
+
+from Functions.emissions import country_flights, haul_summary
+from Functions.result_cache import cached_method
+
+if TYPE_CHECKING:
+    import folium
+
+    from Functions.charts import ChartResult
+
+# The ways routes and airports can be drawn: one folium object per route or airport,
+# or a single GeoJSON layer of routes and a clustered layer of airports
+RENDER_MODES = ["objects", "geojson"]
+
+
+class PlottingMixin:
+    """
+    The plotting methods of FlightData. They draw from the tables and indexes of
+    FlightData. The airports and routes behind the maps are cached in its result
+    cache, and every call builds a new map from them, so that changing a returned
+    map does not change later ones.
+    """
+
+    @staticmethod
+    def _check_render(render: str) -> None:
+        """
+        Raises a ValueError if render is not one of RENDER_MODES.
+        """
+        if render not in RENDER_MODES:
+            raise ValueError(f"render must be one of {RENDER_MODES}, not '{render}'.")
+
+    @staticmethod
+    def _route_map(location: list, zoom_start: int, routes: pd.DataFrame, render: str):
+        """
+        Creates a new map and draws routes on it, a line per route or one GeoJSON layer.
+
+        Parameters
+        ------------
+        location: list
+            The latitude and longitude of the center of the map.
+        zoom_start: int
+            The initial zoom level of the map.
+        routes: pandas.DataFrame
+            The routes to draw, with the Source latitude, Source longitude,
+            Destination latitude, Destination longitude and Color columns.
+        render: str
+            One of RENDER_MODES.
+
+        Returns
+        ---------
+        folium.Map
+            The map with the routes.
+        """
+        # pylint: disable=import-outside-toplevel
+        import folium
+
+        from Functions.map_layers import add_route_layer, route_feature_collection
+
+        flight_map = folium.Map(location=location, zoom_start=zoom_start)
+        coordinates = [
+            routes["Source latitude"],
+            routes["Source longitude"],
+            routes["Destination latitude"],
+            routes["Destination longitude"],
+        ]
+        if render == "geojson":
+            add_route_layer(flight_map, route_feature_collection(*coordinates, routes["Color"]))
+            return flight_map
+
+        # Add a line for each flight route
+        for source_lat, source_long, destination_lat, destination_long, color in zip(
+            *coordinates, routes["Color"]
+        ):
+            folium.PolyLine(
+                locations=[
+                    (source_lat, source_long),
+                    (destination_lat, destination_long),
+                ],
+                color=color,
+            ).add_to(flight_map)
+        return flight_map
+
+    @cached_method
+    def _country_airports(self, country: str) -> pd.DataFrame:
+        """
+        Returns the Name, Latitude and Longitude of the airports of a country, which
+        raises a ValueError if the country does not exist in the data.
+        """
+        positions = self.country_flows.airport_positions(country)
+        return self.airports_df.iloc[positions][["Name", "Latitude", "Longitude"]]
+
+    def plot_airports(self, country: str, render: str = "objects") -> folium.Map:
+        """
+        Plots the airports from a specified country on a map using the Folium library.
+        The airports of the country are cached, and every call builds a new map.
+        Utilizes the class's DataFrame
+
+        Parameters
+        ------------
+        country: str
+            The name of the country to plot airports for.
+        render: str, optional
+            'objects' to add a circle per airport, 'geojson' to add all airports
+            as one clustered marker layer, which keeps large maps light.
+
+        Returns
+        ---------
+        folium.Map
+            A map object with plotted airports.
+
+        Raises
+        ------------
+        ValueError
+            If the specified country does not exist in the provided data.
+        """
+        # pylint: disable=import-outside-toplevel
+        import folium
+
+        from Functions.map_layers import add_airport_cluster
+
+        self._check_render(render)
+        # Look up the airports of the country, which raises if it does not exist
+        country_airports = self._country_airports(country)
+
+        # Calculate the mean latitude and longitude to center the map
+        mean_lat = country_airports["Latitude"].mean()
+        mean_long = country_airports["Longitude"].mean()
+
+        # Create a map centered at the mean latitude and longitude with a simple tileset
+        country_map = folium.Map(
+            location=[mean_lat, mean_long], tiles="CartoDB positron", zoom_start=6
+        )
+
+        if render == "geojson":
+            add_airport_cluster(
+                country_map,
+                country_airports["Latitude"],
+                country_airports["Longitude"],
+                country_airports["Name"],
+            )
+            return country_map
+
+        # Add a circle marker for each airport
+        for _, row in country_airports.iterrows():
+            folium.Circle(
+                location=[row["Latitude"], row["Longitude"]],
+                radius=25,
+                color="black",
+                weight=1,
+                fill_opacity=0.6,
+                opacity=1,
+                fill_color="red",
+                fill=True,
+                tooltip=row["Name"],
+            ).add_to(country_map)
+
+        # Return the map object
+        return country_map
+
+    def distance_analysis(
+        self, show: bool = True, image_format: str = "png", bins: int = 100
+    ) -> ChartResult | None:
+        """
+        Plots the distribution of flight distances.
+
+        Parameters
+        ------------
+        show: bool, optional
+            Whether to show the plot with pyplot. If False, nothing is shown and the
+            histogram is returned instead, which needs no display, e.g. in worker processes.
+        image_format: str, optional
+            If show is False, 'png' or 'svg' to also render the plot to bytes in memory,
+            or None to only return the histogram.
+        bins: int, optional
+            The number of equally wide distance bins.
+
+        Returns
+        ---------
+        ChartResult or None
+            If show is False, the histogram (see distance_histogram) and the rendered
+            image, else None.
+
+        Raises
+        ------------
+        ValueError
+            If image_format is not 'png', 'svg' or None.
+        """
+        # pylint: disable=import-outside-toplevel
+        from Functions import charts
+
+        histogram = charts.distance_histogram(self.routes_df["distance_km"], bins)
+        if not show:
+            image = None
+            if image_format is not None:
+                image = charts.render_chart(
+                    charts.draw_distance_histogram, histogram, image_format=image_format
+                )
+            return charts.ChartResult(histogram, image)
+
+        import matplotlib.pyplot as plt
+
+        # Plot the distribution of flight distances
+        plt.figure(figsize=charts.FIGURE_SIZE)
+        charts.draw_distance_histogram(plt.gca(), histogram)
+        plt.show()
+        return None
+
+    def plot_airport_flights(
+        self, airport_code: str, internal=False, render: str = "objects"
+    ) -> folium.Map:
+        """
+        Plots the flight routes from a specified airport on a map.
+        The routes of the airport are cached, and every call builds a new map.
+
+        Parameters
+        ------------
+        airport_code: str
+            The IATA code of the airport to plot flights from.
+        internal: bool, optional
+            Whether to only include flights within the same country.
+        render: str, optional
+            'objects' to add a line per route, 'geojson' to add all routes as a
+            single GeoJSON layer, which keeps maps of hub airports light.
+
+        Returns
+        ---------
+        folium.Map
+            A map object with plotted flight routes.
+
+        Raises
+        ------------
+        ValueError
+            If the specified airport does not exist in the provided data.
+        """
+        self._check_render(render)
+        # Check if the airport exists in the data
+        source_airport_info = self.lookup_airport(airport_code)
+        if source_airport_info is None:
+            print(f"No information found for airport code {airport_code}.")
+            return None
+
+        # Create a map centered at the source airport
+        return self._route_map(
+            [source_airport_info["Latitude"], source_airport_info["Longitude"]],
+            5,
+            self._airport_routes(airport_code, internal),
+            render,
+        )
+
+    @cached_method
+    def _airport_routes(self, airport_code: str, internal: bool = False) -> pd.DataFrame:
+        """
+        Returns the routes departing from an airport that exists in the data, to be
+        drawn by _route_map, blue within its country and red to other countries.
+        """
+        source_airport_info = self.lookup_airport(airport_code)
+        # Filter the routes DataFrame for flights departing from the specified airport,
+        # whose routes may refer to it by either of its codes
+        departing_flights = self.routes_df[
+            self.routes_df["Source airport"].isin(
+                [airport_code, source_airport_info["IATA"], source_airport_info["ICAO"]]
+            )
+        ]
+        # Resolve all destination airports at once through the airport index
+        destinations = self.airport_index.reindex(departing_flights["Destination airport"])
+        # Skip destination airports that do not exist in the data
+        destinations = destinations[destinations["Latitude"].notna()]
+        # Set the line color to blue for internal flights and red for international flights
+        is_internal = (destinations["Country"] == source_airport_info["Country"]).to_numpy()
+        # Skip if internal and the source and destination airports are in different countries
+        if internal:
+            destinations = destinations[is_internal]
+            is_internal = is_internal[is_internal]
+        return pd.DataFrame(
+            {
+                "Source latitude": source_airport_info["Latitude"],
+                "Source longitude": source_airport_info["Longitude"],
+                "Destination latitude": destinations["Latitude"].to_numpy(),
+                "Destination longitude": destinations["Longitude"].to_numpy(),
+                "Color": np.where(is_internal, "blue", "red"),
+            }
+        )
+
+    def plot_top_models(
+        self,
+        countries: list = None,
+        top_n: int = 10,
+        show: bool = True,
+        image_format: str = "png",
+    ) -> ChartResult | None:
+        """
+        Plots the N most used airplane models by number of routes.
+
+        Parameters
+        ------------
+        countries: list, optional
+            A list of country names to filter the routes by.
+        top_n: int, optional
+            The number of top airplane models to plot.
+        show: bool, optional
+            Whether to show the plot with pyplot. If False, nothing is shown and the
+            table of top_models is returned instead, which needs no display.
+        image_format: str, optional
+            If show is False, 'png' or 'svg' to also render the plot to bytes in memory,
+            or None to only return the table.
+
+        Returns
+        ---------
+        ChartResult or None
+            If show is False, the table of top_models and the rendered image, else None.
+
+        Raises
+        ------------
+        ValueError
+            If the specified country does not exist in the provided data,
+            or image_format is not 'png', 'svg' or None.
+        """
+        # pylint: disable=import-outside-toplevel
+        from Functions import charts
+
+        if isinstance(countries, str):
+            countries = [countries]
+        model_counts = self.top_models(countries, top_n)
+        title = f"Top {top_n} Most Used Airplane Models" + (
+            " Worldwide" if not countries else f' in {", ".join(countries)}'
+        )
+        if not show:
+            image = None
+            if image_format is not None:
+                image = charts.render_chart(
+                    charts.draw_top_models, model_counts, title, image_format=image_format
+                )
+            return charts.ChartResult(model_counts, image)
+
+        import matplotlib.pyplot as plt
+
+        # Plot
+        plt.figure(figsize=charts.FIGURE_SIZE)
+        charts.draw_top_models(plt.gca(), model_counts, title)
+        plt.tight_layout()
+        plt.show()
+        return None
+
+    def plot_country_flights(  # pylint: disable=too-many-locals
+        self,
+        country_name: str,
+        threshold: int = 1000,
+        internal: bool = False,
+        train_plane_ratio: float = 3 / 25,
+        render: str = "objects",
+    ) -> folium.Map:
+        """
+        Plots the flight routes from all airports in a specified country on a map.
+        The flights and their totals are cached, and every call builds a new map.
+
+        Parameters
+        ------------
+        country_name: str
+            The name of the country to plot flights for.
+        threshold: int, optional
+            The distance threshold in kilometers to distinguish short-haul from long-haul flights.
+        internal: bool, optional
+            Whether to only include flights within the same country.
+        train_plane_ratio: float, optional
+            The ratio of train to plane emissions for short-haul flights.
+        render: str, optional
+            'objects' to add a line per route, 'geojson' to add all routes as a
+            single GeoJSON layer, which keeps maps of large countries light.
+
+        Returns
+        ---------
+        folium.Map
+            A map object with plotted flight routes.
+
+        Raises
+        ------------
+        ValueError
+            If the specified country does not exist in the provided data.
+
+        Notes
+        ------------
+        The train_plane_ratio is used to calculate the potential reduction in CO2 emissions
+        if short-haul flights were replaced with train services. The default value of 3/25
+        is based on the average CO2 emissions per passenger-kilometer for trains and planes.
+
+        The map also includes a legend with the total distance and count of short-haul and
+        long-haul flights, as well as the potential reduction in CO2 emissions.
+
+        The map is colored blue for short-haul flights and red for long-haul flights.
+        """
+        # pylint: disable=import-outside-toplevel
+        from branca.element import Element
+
+        self._check_render(render)
+        # Look up the airports of the country, which raises if it does not exist
+        country_airports = self._country_airports(country_name)
+        flights, summary = self._country_routes(
+            country_name, threshold, internal, train_plane_ratio
+        )
+        sh_count, sh_dist = summary["sh_count"], summary["sh_dist"]
+        lh_count, lh_dist = summary["lh_count"], summary["lh_dist"]
+        # If one was to replace short-haul flights with trains
+        emission_reduction = summary["emission_reduction"]
+
+        # Add a line for each flight, blue for short-haul and red for long-haul flights,
+        # on a map centered at the mean latitude and longitude of the airports
+        flight_map = self._route_map(
+            [country_airports["Latitude"].mean(), country_airports["Longitude"].mean()],
+            5,
+            flights,
+            render,
+        )
+
+        # Create a legend with the total distance and count of short-haul and long-haul flights
+        legend_html = (
+            f"<div style=\"position: fixed; "
+            f"bottom: 20px; left: 20px; width: 320px; height: 200px; "
+            f"border:2px solid grey; z-index:9999; font-size:14px; "
+            f"background-color:white; "
+            f"opacity: 0.95; "
+            f"padding: 10px; "
+            f"\">&nbsp;<b>Flight Legend</b><br>"
+            f"&nbsp;<span style='color: blue;'>Short-haul flights</span><br>"
+            f"&nbsp;Count: <b>{sh_count}</b> - Total distance: <b>{sh_dist:.2f}</b> km<br>"
+            f"&nbsp;<span style='color: red;'>Long-haul flights</span><br>"
+            f"&nbsp;Count: <b>{lh_count}</b> - Total distance: <b>{lh_dist:.2f}</b> km<br><br>"
+            f"&nbsp;If we were to replace short-haul flights with<br>"
+            f"&nbsp;rail services, we could reduce CO2<br>"
+            f"&nbsp;emissions to <b>{emission_reduction:.2f}</b>% of the current emissions."
+            f"</div>"
+        )
+
+        # Add the HTML code to the Folium map
+        legend = Element(legend_html)
+        flight_map.get_root().html.add_child(legend)
+
+        return flight_map
+
+    @cached_method
+    def _country_routes(
+        self,
+        country_name: str,
+        threshold: int = 1000,
+        internal: bool = False,
+        train_plane_ratio: float = 3 / 25,
+    ) -> tuple:
+        """
+        Returns the flights departing from a country, to be drawn by _route_map, and
+        the row of their totals and emission reduction (see haul_summary). The
+        totals are looked up in the country flows, or aggregated from the flights
+        for another threshold.
+        """
+        flights = country_flights(
+            self.airports_df,
+            self.routes_df,
+            self.airport_index,
+            country_name,
+            threshold=threshold,
+            internal=internal,
+        )
+        if threshold == self.country_flows.threshold:
+            summary = self.country_flows.summary(country_name, internal, train_plane_ratio)
+        else:
+            summary = haul_summary(flights, train_plane_ratio)
+        routes = flights[
+            ["Source latitude", "Source longitude", "Destination latitude", "Destination longitude"]
+        ].assign(Color=np.where(flights["Short-haul"], "blue", "red"))
+        return routes, summary.iloc[0]
+
+    def plot_airline_network(self, airline, render: str = "objects") -> folium.Map:
+        """
+        Plots the routes of an airline on a map, blue for routes within a country
+        and red for international routes.
+        The routes of the airline are cached, and every call builds a new map.
+
+        Parameters
+        ------------
+        airline: int or str
+            The Airline ID, IATA code, ICAO code or name of the airline.
+        render: str, optional
+            'objects' to add a line per route, 'geojson' to add all routes as a
+            single GeoJSON layer, which keeps maps of large airlines light.
+
+        Returns
+        ---------
+        folium.Map
+            A map object with plotted flight routes.
+
+        Raises
+        ------------
+        ValueError
+            If the airline does not exist in the data or has no routes.
+        """
+        self._check_render(render)
+        routes = self._airline_routes(airline)
+        # Center the map on the airports served by the airline
+        latitudes = pd.concat([routes["Source latitude"], routes["Destination latitude"]])
+        longitudes = pd.concat([routes["Source longitude"], routes["Destination longitude"]])
+        return self._route_map(
+            [latitudes.mean(), longitudes.mean()] if len(routes) else [0, 0], 3, routes, render
+        )
+
+    @cached_method
+    def _airline_routes(self, airline) -> pd.DataFrame:
+        """
+        Returns the routes of an airline with known coordinates, to be drawn by
+        _route_map, blue within a country and red between countries.
+        """
+        routes = self.airline_routes(airline)
+        routes = routes[routes["Source latitude"].notna() & routes["Destination latitude"].notna()]
+        countries = self.airport_index["Country"].astype(object)
+        is_internal = (
+            countries.reindex(routes["Source airport"].astype(object)).to_numpy()
+            == countries.reindex(routes["Destination airport"].astype(object)).to_numpy()
+        )
+        return routes[
+            ["Source latitude", "Source longitude", "Destination latitude", "Destination longitude"]
+        ].assign(Color=np.where(is_internal, "blue", "red"))
+
+    def plot_world_routes(
+        self,
+        directory: str = "downloads/route_tiles",
+        tile_url: str = None,
+        max_zoom: int = 6,
+        color: str = "blue",
+    ) -> folium.Map:
+        """
+        Plots all routes on a world map. Instead of adding the routes to the map, they
+        are aggregated into level-of-detail tiles for the zoom levels 0 to max_zoom,
+        written to a directory (see write_route_tiles), and the map loads the tiles
+        in view. Routes between nearby airports are merged into one line, wider the
+        more routes it stands for, the more so the further the map is zoomed out.
+        The tiles are written on every call, so they always match the current routes.
+
+        The browser fetches the tiles, so the map has to be saved and opened from a
+        web server that serves the tiles as well, e.g.:
+
+            flight_data.plot_world_routes().save("world_routes.html")
+
+        and "python -m http.server" in the directory of world_routes.html, which by
+        default is the directory containing downloads.
+
+        Parameters
+        ------------
+        directory: str, optional
+            The directory to write the tiles to.
+        tile_url: str, optional
+            The URL of the tiles, relative to the saved map or absolute.
+            By default the directory.
+        max_zoom: int, optional
+            The most detailed zoom level of the tiles.
+        color: str, optional
+            The line color of the routes.
+
+        Returns
+        ---------
+        folium.Map
+            A map object that loads the routes in view.
+        """
+        # pylint: disable=import-outside-toplevel
+        import folium
+
+        from Functions.map_layers import add_tiled_route_layer
+        from Functions.route_tiles import write_route_tiles
+
+        routes = self.routes_df
+        write_route_tiles(
+            directory,
+            routes["Source latitude"],
+            routes["Source longitude"],
+            routes["Destination latitude"],
+            routes["Destination longitude"],
+            max_zoom=max_zoom,
+        )
+        world_map = folium.Map(location=[20, 0], zoom_start=2)
+        if tile_url is None:
+            tile_url = directory.replace(os.sep, "/")
+        add_tiled_route_layer(world_map, tile_url, color)
+        return world_map
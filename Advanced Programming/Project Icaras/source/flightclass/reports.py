@@ -0,0 +1,199 @@
+"""
+This module contains a batch entry point that writes the airport map, the flight map
+and the top airplane model chart of many countries to an output directory, with the
+countries spread over a pool of worker processes.
+
+The tables are processed once, by the calling process, and stored in the Arrow cache
+of FlightData. Each worker memory-maps the cached tables when it starts, so the tables
+are neither parsed again nor pickled with the tasks, which only carry country names.
+"""
+
+import multiprocessing
+import os
+import re
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import pandas as pd
+
+from flightclass.flight import FlightData
+from flightclass.plotting import RENDER_MODES
+
+# The files written per country
+REPORT_FILES = {
+    "airports": "airports.html",
+    "flights": "flights.html",
+    "top_models": "top_models.png",
+}
+
+# The FlightData of the current worker process, created by _init_worker
+_WORKER_DATA = None
+
+
+def country_slug(country: str) -> str:
+    """
+    Turns a country name into a directory name, e.g. 'Cote d'Ivoire' into 'Cote_d_Ivoire'.
+    """
+    return re.sub(r"[^0-9A-Za-z]+", "_", country).strip("_")
+
+
+def _init_worker(options: dict) -> None:
+    """
+    Creates the FlightData of a worker process from the cached tables. No results
+    are cached, since every country is reported once.
+    """
+    global _WORKER_DATA  # pylint: disable=global-statement
+    _WORKER_DATA = FlightData(lazy=True, download=False, result_cache_size=0, **options)
+
+
+def _write_report(country: str, output_dir: str, render: str) -> dict:
+    """
+    Writes the report files of a country with the FlightData of the worker process.
+
+    Returns
+    ---------
+    dict
+        The Country, the Directory of the files, the Seconds it took, and the Error
+        message and the Traceback if the report could not be written (None otherwise).
+    """
+    start = time.perf_counter()
+    directory = os.path.join(output_dir, country_slug(country))
+    error = error_traceback = None
+    try:
+        airports_map = _WORKER_DATA.plot_airports(country, render=render)
+        os.makedirs(directory, exist_ok=True)
+        airports_map.save(os.path.join(directory, REPORT_FILES["airports"]))
+        _WORKER_DATA.plot_country_flights(country, render=render).save(
+            os.path.join(directory, REPORT_FILES["flights"])
+        )
+        chart = _WORKER_DATA.plot_top_models([country], show=False, image_format="png")
+        with open(os.path.join(directory, REPORT_FILES["top_models"]), "wb") as file:
+            file.write(chart.image)
+    # Any failure is recorded, so that one country does not stop the other reports
+    except Exception as exception:  # pylint: disable=broad-exception-caught
+        error = str(exception) or type(exception).__name__
+        error_traceback = traceback.format_exc()
+    return {
+        "Country": country,
+        "Directory": directory,
+        "Seconds": time.perf_counter() - start,
+        "Error": error,
+        "Traceback": error_traceback,
+    }
+
+
+def generate_reports(  # pylint: disable=too-many-locals
+    output_dir: str = "reports",
+    countries: list = None,
+    processes: int = None,
+    render: str = "geojson",
+    progress: bool = True,
+    **options,
+) -> pd.DataFrame:
+    """
+    Writes the report files of REPORT_FILES for each country to its own directory,
+    output_dir/<country>/, and a summary.csv with the time each report took.
+
+    The largest countries are started first, so that the pool does not wait for a
+    large country at the end. With pyarrow missing or use_cache=False there is no
+    Arrow cache to share, and every worker parses the zip file itself.
+
+    Parameters
+    ------------
+    output_dir: str, optional
+        The directory the reports are written to.
+    countries: list, optional
+        The countries to report on. By default all countries of airports_df.
+    processes: int, optional
+        The number of worker processes, by default the number of CPUs.
+        1 writes the reports in the calling process.
+    render: str, optional
+        How the maps are drawn, one of RENDER_MODES of flightclass.plotting. 'geojson' keeps
+        the maps of large countries light.
+    progress: bool, optional
+        Whether to print the progress and the throughput.
+    options:
+        Further arguments of FlightData, e.g. file or cache_dir.
+
+    Returns
+    ---------
+    pandas.DataFrame
+        One row per country, in the order of countries, with the Directory of the
+        files, the Seconds the report took, and the Error message and the Traceback
+        of failed reports.
+
+    Raises
+    ------------
+    ValueError
+        If render is not one of RENDER_MODES.
+
+    Example
+    ---------
+    >>> summary = generate_reports("reports", countries=["Germany", "Portugal"])
+    """
+    if render not in RENDER_MODES:
+        raise ValueError(f"render must be one of {RENDER_MODES}, not '{render}'.")
+    start = time.perf_counter()
+    # Load and process the tables once, which stores them in the Arrow cache
+    flight_data = FlightData(**options)
+    airport_counts = flight_data.airports_df["Country"].astype(str).value_counts()
+    if countries is None:
+        countries = sorted(airport_counts.index)
+    ordered = sorted(countries, key=lambda country: -airport_counts.get(country, 0))
+
+    worker_options = {
+        "url": flight_data.url,
+        "file": os.path.abspath(flight_data.file),
+        "cache_dir": os.path.abspath(flight_data.cache_dir),
+        "use_cache": flight_data.use_cache,
+    }
+    output_dir = os.path.abspath(output_dir)
+    os.makedirs(output_dir, exist_ok=True)
+    processes = processes or os.cpu_count() or 1
+
+    reports = {}
+
+    def report_progress(report: dict) -> None:
+        reports[report["Country"]] = report
+        if progress:
+            elapsed = time.perf_counter() - start
+            print(
+                f"\r{len(reports)}/{len(ordered)} countries,"
+                f" {60 * len(reports) / elapsed:.1f} per minute",
+                end="",
+                flush=True,
+            )
+
+    if processes == 1:
+        _init_worker(worker_options)
+        for country in ordered:
+            report_progress(_write_report(country, output_dir, render))
+    else:
+        with ProcessPoolExecutor(
+            max_workers=processes,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(worker_options,),
+        ) as executor:
+            futures = [
+                executor.submit(_write_report, country, output_dir, render)
+                for country in ordered
+            ]
+            for future in as_completed(futures):
+                report_progress(future.result())
+
+    summary = pd.DataFrame([reports[country] for country in countries]).set_index("Country")
+    summary.to_csv(os.path.join(output_dir, "summary.csv"))
+
+    if progress:
+        elapsed = time.perf_counter() - start
+        failed = summary["Error"].notna().sum()
+        print(
+            f"\nWrote the reports of {len(summary) - failed} countries to {output_dir}"
+            f" in {elapsed:.1f} s with {processes} processes:"
+            f" {60 * len(summary) / elapsed:.1f} countries per minute,"
+            f" {summary['Seconds'].mean():.2f} s per country in a worker"
+            + (f", {failed} failed" if failed else "")
+        )
+    return summary